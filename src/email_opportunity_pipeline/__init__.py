@@ -31,4 +31,12 @@ __all__ = [
 
 __version__ = "0.2.0"
 
-from .analytics import PipelineAnalytics, generate_report
+
+def __getattr__(name):
+    # Imported on first use so that ``import email_opportunity_pipeline.cli``
+    # (every CLI invocation) does not pay for the analytics module.
+    if name in ("PipelineAnalytics", "generate_report"):
+        from . import analytics
+
+        return getattr(analytics, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
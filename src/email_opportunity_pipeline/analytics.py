@@ -17,6 +17,30 @@ from typing import Any, Dict, List, Optional, Tuple
 from .models import EmailMessage, FilterDecision, FilterOutcome
 
 
+_DOMAIN_RE = re.compile(r"@([A-Z0-9.-]+\.[A-Z]{2,})", re.I)
+_LOCAL_PART_RE = re.compile(r"([A-Z0-9._%+-]+)@", re.I)
+_SCORE_RE = re.compile(r"score:\s*([-\d.]+)")
+
+# Sender categories, checked in order against the lower-cased local part
+_SENDER_PATTERNS = {
+    "noreply": r"^(no-?reply|do-?not-?reply)",
+    "marketing": r"^(marketing|promo|promotions?|campaign)",
+    "newsletter": r"^(newsletter|news|updates?)",
+    "notifications": r"^(notification|alert|notify)",
+    "info": r"^(info|contact|hello|hi)",
+    "support": r"^(support|help|service)",
+    "team": r"^team",
+    "recruiting": r"^(recruit|talent|hiring|careers?|jobs?)",
+    "billing": r"^(billing|invoice|payment|account)",
+    "personal": r"^[a-z]+\.[a-z]+",  # firstname.lastname pattern
+}
+# One alternation in the same order: the first category that matches wins
+# and is reported by ``match.lastgroup``.
+_SENDER_PATTERN_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _SENDER_PATTERNS.items())
+)
+
+
 @dataclass
 class FilterStats:
     """Statistics for a single filter."""
@@ -216,7 +240,7 @@ class PipelineAnalytics:
                 stats.reason_counts[reason] += 1
                 
                 # Extract score if present
-                score_match = re.search(r"score:\s*([-\d.]+)", reason)
+                score_match = _SCORE_RE.search(reason)
                 if score_match:
                     score = float(score_match.group(1))
                     self.score_distribution.append(score)
@@ -292,36 +316,18 @@ class PipelineAnalytics:
 
     def _extract_domain(self, from_header: str) -> str:
         """Extract domain from From header."""
-        match = re.search(r"@([A-Z0-9.-]+\.[A-Z]{2,})", from_header, re.I)
+        match = _DOMAIN_RE.search(from_header)
         return match.group(1).lower() if match else ""
 
     def _extract_sender_pattern(self, from_header: str) -> str:
         """Extract sender pattern (local part category) from From header."""
-        match = re.search(r"([A-Z0-9._%+-]+)@", from_header, re.I)
+        match = _LOCAL_PART_RE.search(from_header)
         if not match:
             return ""
         
-        local_part = match.group(1).lower()
-        
         # Categorize sender patterns
-        patterns = {
-            "noreply": r"^(no-?reply|do-?not-?reply)",
-            "marketing": r"^(marketing|promo|promotions?|campaign)",
-            "newsletter": r"^(newsletter|news|updates?)",
-            "notifications": r"^(notification|alert|notify)",
-            "info": r"^(info|contact|hello|hi)",
-            "support": r"^(support|help|service)",
-            "team": r"^team",
-            "recruiting": r"^(recruit|talent|hiring|careers?|jobs?)",
-            "billing": r"^(billing|invoice|payment|account)",
-            "personal": r"^[a-z]+\.[a-z]+",  # firstname.lastname pattern
-        }
-        
-        for pattern_name, pattern in patterns.items():
-            if re.search(pattern, local_part):
-                return pattern_name
-        
-        return "other"
+        category = _SENDER_PATTERN_RE.search(match.group(1).lower())
+        return category.lastgroup if category else "other"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert analytics to dictionary for JSON serialization."""
@@ -1,21 +1,27 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import os
+import shutil
+import sys
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
-from .analytics import (
-    PipelineAnalytics,
-    generate_report,
-    save_analytics,
-    save_report,
-)
 from .config import DEFAULT_WINDOW
 from .io import (
     read_messages,
+    iter_messages,
     read_opportunities,
+    iter_job_analyses,
+    iter_match_results,
+    iter_opportunities,
     write_messages,
     write_opportunities,
     read_resume,
+    read_resume_name,
     write_match_results,
     write_single_match_result,
     read_match_results,
@@ -23,6 +29,7 @@ from .io import (
     read_job_analyses,
     write_tailoring_report,
     write_tailoring_results,
+    write_tailored_resume,
     read_tailoring_results,
     read_questionnaire,
     write_drafts,
@@ -31,22 +38,33 @@ from .io import (
     read_reply_results,
     write_correlation,
     read_correlation,
+    write_markdown,
     write_tracking,
     read_tracking,
+    tracking_events_path,
+    append_tracking_event,
+    read_tracking_replayed,
+    clear_tracking_events,
 )
-from .pipeline import (
-    build_filter_pipeline,
-    extract_opportunities,
-    filter_messages_with_outcomes,
-    render_markdown_files,
-    run_pipeline,
-)
-from .providers.gmail import GmailProvider
 from .time_window import parse_window
 
+# Width-64 rule used by the console summaries
+_BANNER = "=" * 64
+
+
+def _safe_id(job_id: str) -> str:
+    """Turn *job_id* into a filename stem (path separators -> ``_``, 60 chars).
+
+    Truncates before replacing; chained ``str.replace`` beats ``str.translate``
+    here because ids rarely contain a separator.
+    """
+    return job_id[:60].replace("/", "_").replace("\\", "_")
+
 
 def _build_provider(name: str):
     if name == "gmail":
+        from .providers.gmail import GmailProvider
+
         return GmailProvider()
     raise ValueError(f"Unknown provider: {name}")
 
@@ -67,32 +85,40 @@ def _cmd_fetch(args: argparse.Namespace) -> None:
 
 
 def _cmd_filter(args: argparse.Namespace) -> None:
-    messages = list(read_messages(args.input))
+    from .analytics import PipelineAnalytics, save_analytics, save_report
+    from .pipeline import build_filter_pipeline
+
     pipeline = build_filter_pipeline(
         rules_path=args.rules,
         use_llm=args.llm_filter,
         llm_model=args.llm_model,
+        cache=_llm_cache(args),
     )
     
     # Track analytics if requested
     analytics = PipelineAnalytics() if args.analytics else None
     if analytics:
         analytics.start()
-        for msg in messages:
-            analytics.record_email_fetch(msg)
     
-    results = filter_messages_with_outcomes(pipeline, messages)
-    filtered = []
-    for msg, outcome in results:
-        if analytics:
-            analytics.record_filter_result(msg, outcome)
-        if outcome.passed:
-            filtered.append(msg)
+    # One streaming pass from reader to writer: each passing message is
+    # serialised as it is produced, so no EmailMessage list is held at all.
+    messages = iter_messages(args.input)
+    if analytics:
+        def _passing():
+            for msg in messages:
+                outcome = pipeline.apply(msg)
+                analytics.record_email_fetch(msg)
+                analytics.record_filter_result(msg, outcome)
+                if outcome.passed:
+                    yield msg
+        passing = _passing()
+    else:
+        passing = (msg for msg in messages if pipeline.apply(msg).passed)
     
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    write_messages(out_path, filtered)
-    print(f"Wrote {len(filtered)} filtered messages to {out_path}")
+    n_filtered = write_messages(out_path, passing)
+    print(f"Wrote {n_filtered} filtered messages to {out_path}")
     
     # Save analytics if requested
     if analytics:
@@ -102,19 +128,30 @@ def _cmd_filter(args: argparse.Namespace) -> None:
         report_path = analytics_dir / "filter_analytics_report.txt"
         save_analytics(analytics, analytics_path)
         save_report(analytics, report_path)
-        print(f"Analytics saved to {analytics_path}")
-        print(f"Report saved to {report_path}")
         
-        # Print summary
-        print(f"\n--- Filter Summary ---")
-        print(f"Total processed: {analytics.total_emails_filtered}")
-        print(f"Passed: {analytics.emails_passed_filter} ({analytics.filter_pass_rate:.1f}%)")
-        print(f"Failed: {analytics.emails_failed_filter} ({analytics.filter_fail_rate:.1f}%)")
+        # Paths and summary go out in one write
+        sys.stdout.write(
+            f"Analytics saved to {analytics_path}\n"
+            f"Report saved to {report_path}\n"
+            f"\n--- Filter Summary ---\n"
+            f"Total processed: {analytics.total_emails_filtered}\n"
+            f"Passed: {analytics.emails_passed_filter} ({analytics.filter_pass_rate:.1f}%)\n"
+            f"Failed: {analytics.emails_failed_filter} ({analytics.filter_fail_rate:.1f}%)\n"
+        )
 
 
 def _cmd_extract(args: argparse.Namespace) -> None:
+    from .pipeline import extract_opportunities
+
     messages = read_messages(args.input)
-    opportunities = extract_opportunities(messages, use_llm=args.llm_extract, llm_model=args.llm_model)
+    opportunities = extract_opportunities(
+        messages,
+        use_llm=args.llm_extract,
+        llm_model=args.llm_model,
+        workers=args.workers,
+        cache=_llm_cache(args),
+        pack_size=args.pack_size,
+    )
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     write_opportunities(out_path, opportunities)
@@ -122,6 +159,8 @@ def _cmd_extract(args: argparse.Namespace) -> None:
 
 
 def _cmd_render(args: argparse.Namespace) -> None:
+    from .pipeline import render_markdown_files
+
     opportunities = read_opportunities(args.input)
     out_dir = Path(args.out)
     render_markdown_files(opportunities, out_dir)
@@ -129,9 +168,13 @@ def _cmd_render(args: argparse.Namespace) -> None:
 
 
 def _cmd_run(args: argparse.Namespace) -> None:
+    from .pipeline import prefetch, run_pipeline
+
     provider = _build_provider(args.provider)
     window = parse_window(args.window)
-    messages = list(
+    # Keep fetching in the background while run_pipeline filters what has
+    # already arrived
+    messages = prefetch(
         provider.fetch_messages(
             window=window,
             max_results=args.max_results,
@@ -149,54 +192,63 @@ def _cmd_run(args: argparse.Namespace) -> None:
         use_llm_extract=args.llm_extract,
         llm_model=args.llm_model,
         enable_analytics=not args.no_analytics,
+        workers=args.workers,
+        cache=_llm_cache(args),
     )
 
-    print("Pipeline complete:")
-    print(f"  Messages: {outputs.messages_path}")
-    print(f"  Filtered: {outputs.filtered_path}")
-    print(f"  Opportunities: {outputs.opportunities_path}")
-    print(f"  Markdown: {outputs.markdown_dir}")
-    
-    if outputs.analytics_path and outputs.report_path:
-        print(f"  Analytics: {outputs.analytics_path}")
-        print(f"  Report: {outputs.report_path}")
-        
-        # Print the report to console if requested
-        if args.show_report:
-            print("\n")
-            print(outputs.report_path.read_text(encoding="utf-8"))
+    lines = [
+        "Pipeline complete:",
+        f"  Messages: {outputs.messages_path}",
+        f"  Filtered: {outputs.filtered_path}",
+        f"  Opportunities: {outputs.opportunities_path}",
+        f"  Markdown: {outputs.markdown_dir}",
+    ]
+    has_report = bool(outputs.analytics_path and outputs.report_path)
+    if has_report:
+        lines.append(f"  Analytics: {outputs.analytics_path}")
+        lines.append(f"  Report: {outputs.report_path}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    # Print the report to console if requested
+    if has_report and args.show_report:
+        print("\n")
+        with outputs.report_path.open(encoding="utf-8") as report:
+            shutil.copyfileobj(report, sys.stdout)
+        print()
 
 
 def _cmd_analytics(args: argparse.Namespace) -> None:
     """Generate analytics from existing data files."""
+    from .analytics import (
+        PipelineAnalytics,
+        generate_report,
+        save_analytics,
+        save_report,
+    )
+    from .pipeline import build_filter_pipeline
+
     analytics = PipelineAnalytics()
     analytics.start()
     
-    messages = []
-    
-    # Load messages
+    # Load messages and run filter analysis on them in a single pass
     if args.messages:
-        messages = list(read_messages(args.messages))
-        for msg in messages:
-            analytics.record_email_fetch(msg)
-        print(f"Loaded {len(messages)} messages from {args.messages}")
-    
-    # Run filter analysis on messages (always run if we have messages)
-    if messages:
         pipeline = build_filter_pipeline(rules_path=args.rules if args.rules else None)
-        results = filter_messages_with_outcomes(pipeline, messages)
-        
-        for msg, outcome in results:
-            analytics.record_filter_result(msg, outcome)
-        
-        print(f"Filtered {len(messages)} messages")
+        count = 0
+        for msg in iter_messages(args.messages):
+            analytics.record_email_fetch(msg)
+            analytics.record_filter_result(msg, pipeline.apply(msg))
+            count += 1
+        print(f"Loaded {count} messages from {args.messages}")
+        if count:
+            print(f"Filtered {count} messages")
     
     # Load and analyze opportunities
     if args.opportunities:
-        opportunities = read_opportunities(args.opportunities)
-        for opp in opportunities:
+        count = 0
+        for opp in iter_opportunities(args.opportunities):
             analytics.record_extraction(opp)
-        print(f"Loaded {len(opportunities)} opportunities from {args.opportunities}")
+            count += 1
+        print(f"Loaded {count} opportunities from {args.opportunities}")
     
     analytics.finish()
     
@@ -223,6 +275,24 @@ def _cmd_analytics(args: argparse.Namespace) -> None:
 # Job Analysis and Resume Matching Commands
 # ============================================================================
 
+def _llm_cache(args: argparse.Namespace):
+    """Return the ResponseCache selected by --cache-dir/--no-cache, or None."""
+    from .llm_cache import ResponseCache, default_cache_dir
+
+    if args.no_cache:
+        return None
+    return ResponseCache(args.cache_dir or default_cache_dir())
+
+
+def _llm_limiter(args: argparse.Namespace):
+    """Return an AdaptiveLimiter for --workers/--rpm, or None for one serial worker."""
+    from .llm_limiter import AdaptiveLimiter
+
+    if args.workers <= 1 and not args.rpm:
+        return None
+    return AdaptiveLimiter(maximum=args.workers, rpm=args.rpm)
+
+
 def _cmd_analyze(args: argparse.Namespace) -> None:
     """Analyze job opportunities to extract structured requirements."""
     from .matching import JobAnalyzer
@@ -230,16 +300,25 @@ def _cmd_analyze(args: argparse.Namespace) -> None:
     opportunities = read_opportunities(args.input)
     print(f"Loaded {len(opportunities)} opportunities from {args.input}")
     
-    analyzer = JobAnalyzer(model=args.llm_model)
+    analyzer = JobAnalyzer(
+        model=args.llm_model, cache=_llm_cache(args), limiter=_llm_limiter(args)
+    )
     analyses = []
     
-    for i, opp in enumerate(opportunities, 1):
-        title = opp.get("job_title", "Unknown")
-        company = opp.get("company", "Unknown")
-        print(f"Analyzing [{i}/{len(opportunities)}]: {title} at {company}...")
-        
-        analysis = analyzer.analyze(opp)
-        analyses.append(analysis)
+    if args.workers > 1 or args.pack_size > 1:
+        print(f"Analyzing {len(opportunities)} opportunities "
+              f"({args.workers} concurrent requests, {args.pack_size} per request)...")
+        analyses = analyzer.analyze_batch(
+            opportunities, workers=args.workers, pack_size=args.pack_size
+        )
+    else:
+        for i, opp in enumerate(opportunities, 1):
+            title = opp.get("job_title", "Unknown")
+            company = opp.get("company", "Unknown")
+            print(f"Analyzing [{i}/{len(opportunities)}]: {title} at {company}...")
+            
+            analysis = analyzer.analyze(opp)
+            analyses.append(analysis)
     
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -271,31 +350,39 @@ def _cmd_match(args: argparse.Namespace) -> None:
     resume = read_resume(args.resume)
     print(f"Loaded resume for: {resume.personal.name}")
     
-    # Load opportunities
-    opportunities = read_opportunities(args.opportunities)
-    print(f"Loaded {len(opportunities)} opportunities")
-    
-    # Optionally load pre-computed analyses
-    job_analyses = None
-    if args.analyses:
-        job_analyses = read_job_analyses(args.analyses)
-        print(f"Loaded {len(job_analyses)} pre-computed analyses")
-    
     # Initialize matcher
-    matcher = ResumeMatcher(model=args.llm_model)
+    matcher = ResumeMatcher(
+        model=args.llm_model, cache=_llm_cache(args), limiter=_llm_limiter(args)
+    )
     
     # Single job or batch match
     if args.job_index is not None:
-        # Match single job
-        if args.job_index < 0 or args.job_index >= len(opportunities):
-            print(f"Error: job-index {args.job_index} out of range (0-{len(opportunities)-1})")
+        # Match single job: stop reading the inputs at the requested index
+        job = None
+        if args.job_index >= 0:
+            job = next(islice(iter_opportunities(args.opportunities), args.job_index, None), None)
+        if job is None:
+            count = len(read_opportunities(args.opportunities))
+            print(f"Error: job-index {args.job_index} out of range (0-{count-1})")
             return
+        print(f"Loaded opportunity {args.job_index} from {args.opportunities}")
         
-        job = opportunities[args.job_index]
-        analysis = job_analyses[args.job_index] if job_analyses else None
+        analysis = None
+        if args.analyses:
+            analysis = next(islice(iter_job_analyses(args.analyses), args.job_index, None), None)
+            if analysis is not None:
+                print(f"Loaded pre-computed analysis {args.job_index}")
         
         print(f"Matching against: {job.get('job_title', 'Unknown')} at {job.get('company', 'Unknown')}")
-        result = matcher.match(resume, job, analysis)
+        on_delta = None
+        if args.stream:
+            def on_delta(delta: str) -> None:
+                sys.stdout.write(delta)
+                sys.stdout.flush()
+        
+        result = matcher.match(resume, job, analysis, on_delta=on_delta)
+        if args.stream:
+            print()
         
         # Output
         out_path = Path(args.out)
@@ -305,15 +392,26 @@ def _cmd_match(args: argparse.Namespace) -> None:
             write_single_match_result(out_path, result)
         else:  # markdown
             md = render_match_markdown(result, job)
-            out_path.write_text(md, encoding="utf-8")
+            write_markdown(out_path, md)
         
         print(f"\nMatch result saved to {out_path}")
         _print_match_summary(result, job)
     
     else:
         # Batch match all jobs
+        opportunities = read_opportunities(args.opportunities)
+        print(f"Loaded {len(opportunities)} opportunities")
+        
+        # Optionally load pre-computed analyses
+        job_analyses = None
+        if args.analyses:
+            job_analyses = read_job_analyses(args.analyses)
+            print(f"Loaded {len(job_analyses)} pre-computed analyses")
+        
         print(f"\nMatching against all {len(opportunities)} opportunities...")
-        results = matcher.match_batch(resume, opportunities, job_analyses)
+        results = matcher.match_batch(
+            resume, opportunities, job_analyses, workers=args.workers
+        )
         
         # Output
         out_dir = Path(args.out)
@@ -327,20 +425,29 @@ def _cmd_match(args: argparse.Namespace) -> None:
         # Save summary report
         summary_path = out_dir / "match_summary.md"
         summary_md = render_match_summary(results, opportunities)
-        summary_path.write_text(summary_md, encoding="utf-8")
+        write_markdown(summary_path, summary_md)
         print(f"Summary report saved to {summary_path}")
         
         # Save individual match reports if requested
         if args.individual_reports:
             reports_dir = out_dir / "match_reports"
             reports_dir.mkdir(parents=True, exist_ok=True)
+            jobs_map = _jobs_by_message_id(opportunities)
             
-            for result in results:
-                job = next((o for o in opportunities 
-                           if o.get("source_email", {}).get("message_id") == result.job_id), {})
+            def _write_report(result) -> None:
+                job = jobs_map.get(result.job_id, {})
                 md = render_match_markdown(result, job)
                 report_path = reports_dir / f"{result.job_id}.md"
-                report_path.write_text(md, encoding="utf-8")
+                write_markdown(report_path, md)
+
+            if args.workers > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                    list(pool.map(_write_report, results))
+            else:
+                for result in results:
+                    _write_report(result)
             
             print(f"Individual reports saved to {reports_dir}")
         
@@ -348,6 +455,14 @@ def _cmd_match(args: argparse.Namespace) -> None:
         _print_batch_summary(results, opportunities)
 
 
+def _jobs_by_message_id(opportunities: list) -> dict:
+    """Index opportunities by source message id, keeping the first of any duplicates."""
+    jobs_map: dict = {}
+    for opp in opportunities:
+        jobs_map.setdefault(opp.get("source_email", {}).get("message_id"), opp)
+    return jobs_map
+
+
 def _print_match_summary(result, job: dict) -> None:
     """Print a brief match summary to console."""
     print("\n" + "=" * 60)
@@ -374,69 +489,77 @@ def _print_match_summary(result, job: dict) -> None:
 
 def _print_batch_summary(results, opportunities: list) -> None:
     """Print a batch match summary to console."""
-    print("\n" + "=" * 60)
-    print(f"MATCH SUMMARY - {len(results)} Jobs Analyzed")
-    print("=" * 60)
+    lines = ["\n" + "=" * 60, f"MATCH SUMMARY - {len(results)} Jobs Analyzed", "=" * 60]
     
     # Grade distribution
     grades = {}
     for r in results:
         grades[r.match_grade] = grades.get(r.match_grade, 0) + 1
     
-    print("\nGrade Distribution:")
+    lines.append("\nGrade Distribution:")
     for grade in ["excellent", "good", "fair", "poor", "unqualified"]:
         count = grades.get(grade, 0)
         if count:
-            print(f"  {grade.title()}: {count}")
+            lines.append(f"  {grade.title()}: {count}")
     
     # Top matches
     top = results[:5]
     if top:
-        print("\nTop 5 Matches:")
+        lines.append("\nTop 5 Matches:")
+        jobs_map = _jobs_by_message_id(opportunities)
         for i, r in enumerate(top, 1):
-            job = next((o for o in opportunities 
-                       if o.get("source_email", {}).get("message_id") == r.job_id), {})
+            job = jobs_map.get(r.job_id, {})
             title = job.get("job_title", "Unknown")[:40]
             company = job.get("company", "Unknown")[:20]
-            print(f"  {i}. [{r.overall_score:.0f}] {title} at {company}")
+            lines.append(f"  {i}. [{r.overall_score:.0f}] {title} at {company}")
     
     # Action items
     strong = sum(1 for r in results if r.recommendation == "strong_apply")
     apply = sum(1 for r in results if r.recommendation == "apply")
     
-    print(f"\nRecommended Actions:")
-    print(f"  Strong Apply: {strong}")
-    print(f"  Apply: {apply}")
+    lines.append(f"\nRecommended Actions:")
+    lines.append(f"  Strong Apply: {strong}")
+    lines.append(f"  Apply: {apply}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _cmd_rank(args: argparse.Namespace) -> None:
     """Rank and filter previously computed match results."""
-    results = read_match_results(args.input)
-    print(f"Loaded {len(results)} match results")
-    
-    # Filter by minimum score
-    if args.min_score:
-        results = [r for r in results if r.overall_score >= args.min_score]
-        print(f"After min-score filter: {len(results)} results")
-    
-    # Filter by grade
-    if args.grade:
-        grades = set(args.grade.split(","))
-        results = [r for r in results if r.match_grade in grades]
-        print(f"After grade filter: {len(results)} results")
-    
-    # Filter by recommendation
-    if args.recommendation:
-        recs = set(args.recommendation.split(","))
-        results = [r for r in results if r.recommendation in recs]
-        print(f"After recommendation filter: {len(results)} results")
-    
-    # Sort
-    results.sort(key=lambda r: r.overall_score, reverse=True)
-    
-    # Limit
+    grades = set(args.grade.split(",")) if args.grade else None
+    recs = set(args.recommendation.split(",")) if args.recommendation else None
+
+    # Stream the file and apply every filter in one pass, counting the
+    # survivors of each stage so the per-filter report is unchanged.
+    counts = {"loaded": 0, "score": 0, "grade": 0, "kept": 0}
+
+    def _passing():
+        for r in iter_match_results(args.input):
+            counts["loaded"] += 1
+            if args.min_score and r.overall_score < args.min_score:
+                continue
+            counts["score"] += 1
+            if grades is not None and r.match_grade not in grades:
+                continue
+            counts["grade"] += 1
+            if recs is not None and r.recommendation not in recs:
+                continue
+            counts["kept"] += 1
+            yield r
+
+    # With --top only the best N survivors are ever held (a bounded heap);
+    # otherwise every survivor is sorted.
     if args.top:
-        results = results[:args.top]
+        results = heapq.nlargest(args.top, _passing(), key=lambda r: r.overall_score)
+    else:
+        results = sorted(_passing(), key=lambda r: r.overall_score, reverse=True)
+
+    print(f"Loaded {counts['loaded']} match results")
+    if args.min_score:
+        print(f"After min-score filter: {counts['score']} results")
+    if grades is not None:
+        print(f"After grade filter: {counts['grade']} results")
+    if recs is not None:
+        print(f"After recommendation filter: {counts['kept']} results")
     
     # Output
     if args.out:
@@ -445,18 +568,16 @@ def _cmd_rank(args: argparse.Namespace) -> None:
         write_match_results(out_path, results)
         print(f"\nFiltered results saved to {out_path}")
     
-    # Print
-    print("\n" + "=" * 60)
-    print("RANKED RESULTS")
-    print("=" * 60)
-    
+    # Print (collected and written once; --top 1000 is thousands of lines)
+    lines = ["\n" + "=" * 60, "RANKED RESULTS", "=" * 60]
     for i, r in enumerate(results, 1):
-        print(f"\n{i}. Score: {r.overall_score:.0f} | Grade: {r.match_grade} | Rec: {r.recommendation}")
-        print(f"   Job ID: {r.job_id}")
+        lines.append(f"\n{i}. Score: {r.overall_score:.0f} | Grade: {r.match_grade} | Rec: {r.recommendation}")
+        lines.append(f"   Job ID: {r.job_id}")
         if r.insights.strengths:
-            print(f"   Strength: {r.insights.strengths[0][:60]}...")
+            lines.append(f"   Strength: {r.insights.strengths[0][:60]}...")
         if r.skills_match.missing_mandatory:
-            print(f"   Gap: {r.skills_match.missing_mandatory[0]}")
+            lines.append(f"   Gap: {r.skills_match.missing_mandatory[0]}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================================================
@@ -508,6 +629,8 @@ def _cmd_tailor(args: argparse.Namespace) -> None:
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
     engine = TailoringEngine(output_dir=out_dir)
+    report_dir = out_dir / "tailoring_reports"
+    report_dir.mkdir(parents=True, exist_ok=True)
 
     build_docx = not args.no_docx
     tailored_resumes = []
@@ -522,10 +645,6 @@ def _cmd_tailor(args: argparse.Namespace) -> None:
             tailored = engine.tailor(resume, match_result, job, build_docx=build_docx)
             tailored_resumes.append(tailored)
 
-            # Save individual report
-            report_dir = out_dir / "tailoring_reports"
-            report_dir.mkdir(parents=True, exist_ok=True)
-
             # JSON report
             json_path = report_dir / f"{match_result.job_id}_report.json"
             write_tailoring_report(json_path, tailored.report.to_dict())
@@ -533,15 +652,11 @@ def _cmd_tailor(args: argparse.Namespace) -> None:
             # Markdown report
             md_path = report_dir / f"{match_result.job_id}_report.md"
             md = render_tailoring_report(tailored.report)
-            md_path.write_text(md, encoding="utf-8")
+            write_markdown(md_path, md)
 
             # Save tailored resume JSON
             resume_json_path = report_dir / f"{match_result.job_id}_resume.json"
-            import json as _json
-            resume_json_path.write_text(
-                _json.dumps(tailored.resume_data, indent=2),
-                encoding="utf-8",
-            )
+            write_tailored_resume(resume_json_path, tailored.resume_data)
 
             print(f"  Changes: {tailored.report.total_changes}")
             if tailored.docx_path:
@@ -620,8 +735,13 @@ def _cmd_run_all(args: argparse.Namespace) -> None:
     Every intermediate artifact is persisted under ``--work-dir`` so you
     can re-run downstream stages without refetching.
     """
-    import json as _json
-
+    from .analytics import PipelineAnalytics, save_analytics, save_report
+    from .pipeline import (
+        build_filter_pipeline,
+        extract_opportunities,
+        filter_messages_with_outcomes,
+        render_markdown_files,
+    )
     from .matching import JobAnalyzer, ResumeMatcher
     from .matching.report import render_match_summary
     from .tailoring import TailoringEngine
@@ -803,6 +923,8 @@ def _cmd_run_all(args: argparse.Namespace) -> None:
     # ==================================================================
     tailored_dir.mkdir(parents=True, exist_ok=True)
     engine = TailoringEngine(output_dir=tailored_dir)
+    report_dir = tailored_dir / "tailoring_reports"
+    report_dir.mkdir(parents=True, exist_ok=True)
     build_docx = not args.no_docx
     tailored_resumes = []
 
@@ -816,16 +938,14 @@ def _cmd_run_all(args: argparse.Namespace) -> None:
             tailored = engine.tailor(resume, mr, job, build_docx=build_docx)
             tailored_resumes.append(tailored)
 
-            report_dir = tailored_dir / "tailoring_reports"
-            report_dir.mkdir(parents=True, exist_ok=True)
             write_tailoring_report(
                 report_dir / f"{mr.job_id}_report.json",
                 tailored.report.to_dict(),
             )
             md = render_tailoring_report(tailored.report)
-            (report_dir / f"{mr.job_id}_report.md").write_text(md, encoding="utf-8")
-            (report_dir / f"{mr.job_id}_resume.json").write_text(
-                _json.dumps(tailored.resume_data, indent=2), encoding="utf-8"
+            write_markdown(report_dir / f"{mr.job_id}_report.md", md)
+            write_tailored_resume(
+                report_dir / f"{mr.job_id}_resume.json", tailored.resume_data
             )
         except Exception as e:
             print(f"              Error tailoring: {e}")
@@ -1075,7 +1195,7 @@ def _cmd_compose(args: argparse.Namespace) -> None:
     # Save preview report
     preview_path = out_dir / "drafts_preview.md"
     preview_md = render_batch_preview(drafts)
-    preview_path.write_text(preview_md, encoding="utf-8")
+    write_markdown(preview_path, preview_md)
     print(f"Preview report saved to {preview_path}")
 
     # Save individual previews
@@ -1083,9 +1203,7 @@ def _cmd_compose(args: argparse.Namespace) -> None:
     previews_dir.mkdir(parents=True, exist_ok=True)
     for draft in drafts:
         md = render_draft_preview(draft)
-        safe_id = draft.job_id.replace("/", "_").replace("\\", "_")[:60]
-        preview_file = previews_dir / f"{safe_id}_preview.md"
-        preview_file.write_text(md, encoding="utf-8")
+        write_markdown(previews_dir / f"{_safe_id(draft.job_id)}_preview.md", md)
     print(f"Individual previews saved to {previews_dir}")
 
     # Console summary
@@ -1223,36 +1341,58 @@ def _print_reply_summary(results: list, dry_run: bool) -> None:
 # Application Tracking Commands
 # ============================================================================
 
+# track-update journals events next to tracking.json and only rewrites the
+# full snapshot once this many events are pending.
+_TRACKING_COMPACT_THRESHOLD = 50
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    """Whether *a* and *b* name one file, through relative parts or symlinks."""
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return a.resolve() == b.resolve()
+
+
 def _cmd_track(args: argparse.Namespace) -> None:
     """Initialise application tracking from correlation data and/or display
     the current tracking state."""
     from .tracking import (
         ApplicationTracker,
+        iter_tracking_report,
         render_tracking_report,
         render_application_card,
+        tracking_summary_digest,
     )
 
     tracker = ApplicationTracker()
+    out_path = Path(args.out)
+    json_path = out_path / "tracking.json"
 
-    # Load existing tracking data (idempotent merge)
-    tracking_file = args.tracking_file
-    if not tracking_file:
-        out_path = Path(args.out)
-        candidate = out_path / "tracking.json"
-        if candidate.exists():
-            tracking_file = str(candidate)
+    # Load existing tracking data (idempotent merge); one stat per candidate
+    tracking_file = args.tracking_file or str(json_path)
+    tracking_exists = Path(tracking_file).exists()
 
-    if tracking_file and Path(tracking_file).exists():
-        existing_apps, _ = read_tracking(tracking_file)
+    if args.compact:
+        if not tracking_exists:
+            print("Error: no tracking file to compact; provide --tracking-file.")
+            return
+        apps, summary, pending = read_tracking_replayed(tracking_file)
+        write_tracking(tracking_file, apps, summary)
+        clear_tracking_events(tracking_events_path(tracking_file))
+        print(f"Compacted {pending} journalled update(s) into {tracking_file}")
+        return
+
+    existing_summary = None
+    if tracking_exists:
+        existing_apps, existing_summary = read_tracking(tracking_file)
         tracker.load_existing(existing_apps)
         print(f"Loaded {len(existing_apps)} existing tracked applications from {tracking_file}")
 
     # Discover or use explicit correlation file
     correlation_path = args.correlation
-    if not correlation_path:
-        out_dir = Path(args.out_dir) if args.out_dir else None
-        if out_dir and (out_dir / "correlation" / "correlation.json").exists():
-            correlation_path = str(out_dir / "correlation" / "correlation.json")
+    if not correlation_path and args.out_dir:
+        correlation_path = str(Path(args.out_dir) / "correlation" / "correlation.json")
 
     if correlation_path and Path(correlation_path).exists():
         correlated, _ = read_correlation(correlation_path)
@@ -1267,38 +1407,45 @@ def _cmd_track(args: argparse.Namespace) -> None:
         new_count = tracker.init_from_correlation(correlated, min_stage=min_stage)
         print(f"Initialised {new_count} new application(s) from correlation data")
     else:
-        if not tracking_file:
+        if not tracking_exists:
             print("No correlation data or existing tracking file found.")
             print("Run 'correlate' first, or provide --correlation / --tracking-file.")
             return
 
-    all_apps = tracker.get_all()
-    if not all_apps:
+    full_apps = tracker.get_all()
+    if not full_apps:
         print("No applications to track.")
         return
 
-    # Filter by status if requested
+    # Filter by status if requested (the JSON snapshot keeps every app)
+    all_apps = full_apps
     if args.status:
-        from .tracking.models import ApplicationStatus
         statuses = set(args.status.split(","))
-        all_apps = [a for a in all_apps if a.status.value in statuses]
+        all_apps = tracker.get_by_statuses(statuses)
         print(f"After status filter: {len(all_apps)} applications")
 
-    summary = tracker.build_summary()
+    summary = tracker.build_summary(
+        full_apps, display_statuses=statuses if args.status else None
+    )
+    summary.render_hash = tracking_summary_digest(summary, all_apps)
+    replaces_source = tracking_exists and _same_file(Path(tracking_file), json_path)
+    if replaces_source:
+        summary.journal_seq = existing_summary.journal_seq
 
     # Output
-    out_path = Path(args.out)
     out_path.mkdir(parents=True, exist_ok=True)
 
     # JSON
-    json_path = out_path / "tracking.json"
-    write_tracking(json_path, tracker.get_all(), summary)
+    write_tracking(json_path, full_apps, summary)
+    if replaces_source:
+        # The snapshot now includes every journalled update
+        clear_tracking_events(tracking_events_path(tracking_file))
     print(f"\nTracking data saved to {json_path}")
 
     # Summary report
     summary_path = out_path / "tracking_summary.md"
     summary_md = render_tracking_report(summary, all_apps, include_cards=False)
-    summary_path.write_text(summary_md, encoding="utf-8")
+    write_markdown(summary_path, summary_md)
     print(f"Summary report saved to {summary_path}")
 
     # Individual cards
@@ -1307,33 +1454,24 @@ def _cmd_track(args: argparse.Namespace) -> None:
         cards_dir.mkdir(parents=True, exist_ok=True)
         for app in all_apps:
             card_md = render_application_card(app)
-            safe_id = app.job_id.replace("/", "_").replace("\\", "_")[:60]
-            card_path = cards_dir / f"{safe_id}.md"
-            card_path.write_text(card_md, encoding="utf-8")
+            write_markdown(cards_dir / f"{_safe_id(app.job_id)}.md", card_md)
         print(f"Individual cards saved to {cards_dir}")
 
     # Full report
     if args.full_report:
         full_path = out_path / "tracking_full_report.md"
-        full_md = render_tracking_report(summary, all_apps, include_cards=True)
-        full_path.write_text(full_md, encoding="utf-8")
+        with open(full_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            f.writelines(iter_tracking_report(summary, all_apps, include_cards=True))
         print(f"Full report saved to {full_path}")
 
     # Console summary
-    _print_tracking_summary(summary, all_apps)
+    _print_tracking_summary(summary)
 
 
 def _cmd_track_update(args: argparse.Namespace) -> None:
     """Update status, notes, interviews, or offers for a tracked application."""
-    from .tracking import ApplicationTracker
-    from .tracking.models import (
-        ApplicationStatus,
-        FinalOutcome,
-        InterviewRecord,
-        InterviewType,
-        OfferDetails,
-    )
-    from .tracking.report import render_tracking_report
+    from .tracking.tracker import ApplicationTracker
+    from .tracking.report import tracking_summary_digest
 
     # Load existing tracking data
     tracking_file = Path(args.tracking_file)
@@ -1341,32 +1479,42 @@ def _cmd_track_update(args: argparse.Namespace) -> None:
         print(f"Error: tracking file not found: {tracking_file}")
         return
 
-    existing_apps, _ = read_tracking(tracking_file)
+    journal_path = tracking_events_path(tracking_file)
+    existing_apps, existing_summary, pending_events = read_tracking_replayed(tracking_file)
     tracker = ApplicationTracker()
     tracker.load_existing(existing_apps)
     print(f"Loaded {len(existing_apps)} tracked applications")
 
     job_id = args.job_id
     action = args.action
+    now = datetime.now(tz=timezone.utc).isoformat()
 
     try:
         if action == "status":
             if not args.status:
                 print("Error: --status is required for action=status")
                 return
+            from .tracking.models import ApplicationStatus
+
             new_status = ApplicationStatus(args.status)
-            tracker.update_status(job_id, new_status, note=args.note)
+            tracker.update_status(job_id, new_status, note=args.note, at=now)
+            payload = {"status": new_status.value, "note": args.note}
             print(f"Updated {job_id} -> {new_status.value}")
 
         elif action == "outcome":
             if not args.outcome:
                 print("Error: --outcome is required for action=outcome")
                 return
+            from .tracking.models import FinalOutcome
+
             outcome = FinalOutcome(args.outcome)
-            tracker.set_outcome(job_id, outcome, note=args.note)
+            tracker.set_outcome(job_id, outcome, note=args.note, at=now)
+            payload = {"outcome": outcome.value, "note": args.note}
             print(f"Set outcome for {job_id} -> {outcome.value}")
 
         elif action == "interview":
+            from .tracking.models import InterviewRecord, InterviewType
+
             interview_type_str = args.interview_type or "other"
             try:
                 interview_type = InterviewType(interview_type_str)
@@ -1380,10 +1528,13 @@ def _cmd_track_update(args: argparse.Namespace) -> None:
                 interviewer_name=args.interviewer,
                 notes=args.note,
             )
-            tracker.add_interview(job_id, record)
+            tracker.add_interview(job_id, record, at=now)
+            payload = record.to_dict()
             print(f"Added interview for {job_id}: {interview_type.value}")
 
         elif action == "offer":
+            from .tracking.models import OfferDetails
+
             offer = OfferDetails(
                 salary=args.salary,
                 equity=args.equity,
@@ -1391,14 +1542,16 @@ def _cmd_track_update(args: argparse.Namespace) -> None:
                 start_date=args.start_date,
                 notes=args.note,
             )
-            tracker.set_offer(job_id, offer)
+            tracker.set_offer(job_id, offer, at=now)
+            payload = offer.to_dict()
             print(f"Set offer for {job_id}")
 
         elif action == "note":
             if not args.note:
                 print("Error: --note is required for action=note")
                 return
-            tracker.add_note(job_id, args.note)
+            tracker.add_note(job_id, args.note, at=now)
+            payload = {"note": args.note}
             print(f"Added note to {job_id}")
 
         else:
@@ -1412,18 +1565,49 @@ def _cmd_track_update(args: argparse.Namespace) -> None:
         print(f"Error: invalid value: {e}")
         return
 
-    # Write back
-    summary = tracker.build_summary()
+    # Write back: journal the event in place, or rewrite the full snapshot
+    # when writing elsewhere or once enough events have accumulated
+    all_apps = tracker.get_all()
+    summary = tracker.build_summary(all_apps)
+    summary.render_hash = tracking_summary_digest(summary, all_apps)
     out_dir = Path(args.out) if args.out else tracking_file.parent
     out_dir.mkdir(parents=True, exist_ok=True)
+    json_path = out_dir / "tracking.json"
+    in_place = _same_file(json_path, tracking_file)
+
+    if in_place and pending_events + 1 < _TRACKING_COMPACT_THRESHOLD:
+        append_tracking_event(journal_path, {
+            "seq": existing_summary.journal_seq + 1,
+            "ts": now,
+            "job_id": job_id,
+            "action": action,
+            "payload": payload,
+            "render_hash": summary.render_hash,
+        })
+        print(f"Update journalled to {journal_path}")
+    else:
+        if in_place:
+            summary.journal_seq = existing_summary.journal_seq
+        write_tracking(json_path, all_apps, summary)
+        if in_place:
+            clear_tracking_events(journal_path)
+        print(f"Tracking data saved to {json_path}")
+
+    # Regenerate summary report (skipped when nothing it displays changed)
+    summary_path = out_dir / "tracking_summary.md"
+    unchanged = (
+        in_place
+        and summary.render_hash == existing_summary.render_hash
+        and summary_path.exists()
+    )
+    if unchanged:
+        print(f"Summary report unchanged at {summary_path}")
+    else:
+        from .tracking.report import render_tracking_report
 
-    write_tracking(out_dir / "tracking.json", tracker.get_all(), summary)
-    print(f"Tracking data saved to {out_dir / 'tracking.json'}")
-
-    # Regenerate summary report
-    summary_md = render_tracking_report(summary, tracker.get_all(), include_cards=False)
-    (out_dir / "tracking_summary.md").write_text(summary_md, encoding="utf-8")
-    print(f"Summary report updated at {out_dir / 'tracking_summary.md'}")
+        summary_md = render_tracking_report(summary, all_apps, include_cards=False)
+        write_markdown(summary_path, summary_md)
+        print(f"Summary report updated at {summary_path}")
 
     # Show updated application
     app = tracker.get_application(job_id)
@@ -1436,55 +1620,60 @@ def _cmd_track_update(args: argparse.Namespace) -> None:
         print(f"  Offer: {'Yes' if app.offer else 'No'}")
 
 
-def _print_tracking_summary(
-    summary: "TrackingSummary",
-    applications: list,
-) -> None:
-    """Print a brief tracking summary to console."""
-    print()
-    print("=" * 64)
-    print("  APPLICATION TRACKING SUMMARY")
-    print("=" * 64)
-    print()
+_ACTIVE_ROW = "    {i}. [{score}] {status:14s} {title} at {company}".format
 
-    print(f"  Total Tracked:        {summary.total_tracked}")
-    print(f"  Active:               {summary.active_count}")
-    print(f"  Total Interviews:     {summary.total_interviews}")
-    print(f"  Offers Received:      {summary.offers_received}")
+
+def _print_tracking_summary(summary: "TrackingSummary") -> None:
+    """Print a brief tracking summary to console."""
+    lines = [
+        "",
+        _BANNER,
+        "  APPLICATION TRACKING SUMMARY",
+        _BANNER,
+        "",
+        f"  Total Tracked:        {summary.total_tracked}",
+        f"  Active:               {summary.active_count}",
+        f"  Total Interviews:     {summary.total_interviews}",
+        f"  Offers Received:      {summary.offers_received}",
+    ]
 
     if summary.avg_match_score > 0:
-        print(f"  Avg Match Score:      {summary.avg_match_score:.1f}")
+        lines.append(f"  Avg Match Score:      {summary.avg_match_score:.1f}")
 
     # Status breakdown
     if summary.by_status:
-        print()
-        print("  By Status:")
+        lines.append("")
+        lines.append("  By Status:")
         for status in ["applied", "interviewing", "offered", "closed"]:
             count = summary.by_status.get(status, 0)
             if count:
-                print(f"    {status.title():16s} {count}")
+                lines.append(f"    {status.title():16s} {count}")
 
     # Outcome breakdown
     if summary.by_outcome:
-        print()
-        print("  Outcomes:")
+        lines.append("")
+        lines.append("  Outcomes:")
         for outcome in ["accepted", "declined", "rejected", "withdrawn", "ghosted"]:
             count = summary.by_outcome.get(outcome, 0)
             if count:
-                print(f"    {outcome.title():16s} {count}")
+                lines.append(f"    {outcome.title():16s} {count}")
 
     # Top applications
-    active = [a for a in applications if a.is_active][:5]
-    if active:
-        print()
-        print("  Active Applications:")
-        for i, a in enumerate(active, 1):
+    if summary.top_active:
+        lines.append("")
+        lines.append("  Active Applications:")
+        for i, a in enumerate(summary.top_active, 1):
             score = f"{a.match_score:.0f}" if a.match_score is not None else "--"
-            company = a.company[:25] if a.company else "Unknown"
-            title = a.job_title[:30] if a.job_title else "Unknown"
-            print(f"    {i}. [{score}] {a.status.value.title():14s} {title} at {company}")
+            lines.append(_ACTIVE_ROW(
+                i=i,
+                score=score,
+                status=a.status.value.title(),
+                title=a.job_title[:30] if a.job_title else "Unknown",
+                company=a.company[:25] if a.company else "Unknown",
+            ))
 
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================================================
@@ -1492,7 +1681,11 @@ def _print_tracking_summary(
 # ============================================================================
 
 def _cmd_ui(args: argparse.Namespace) -> None:
-    """Launch the Streamlit web dashboard."""
+    """Launch the Streamlit web dashboard.
+
+    Streamlit is imported here rather than at module level so the other
+    sub-commands never pay for its import chain.
+    """
     try:
         import streamlit.web.cli as stcli
     except ImportError:
@@ -1503,12 +1696,7 @@ def _cmd_ui(args: argparse.Namespace) -> None:
         )
         return
 
-    import sys
-    from pathlib import Path as _Path
-
-    app_path = str(
-        _Path(__file__).resolve().parent / "ui" / "app.py"
-    )
+    app_path = str(Path(__file__).resolve().parent / "ui" / "app.py")
 
     sys.argv = [
         "streamlit",
@@ -1521,6 +1709,49 @@ def _cmd_ui(args: argparse.Namespace) -> None:
     stcli.main()
 
 
+# Auto-discovered correlate inputs: key -> (base, relative dir, name, is_dir)
+_CORRELATE_ARTIFACTS = {
+    "messages": ("work", "", "messages.json", False),
+    "opportunities": ("work", "", "opportunities.json", False),
+    "match_results": ("out", "matches", "match_results.json", False),
+    "tailored": ("out", "", "tailored", True),
+    "drafts": ("out", "replies", "drafts.json", False),
+    "reply_results": ("out", "replies", "reply_results.json", False),
+}
+
+
+def _discover_artifacts(
+    work_dir: Optional[Path],
+    out_dir: Optional[Path],
+    keys: Iterable[str],
+) -> Dict[str, Path]:
+    """Locate the standard correlate inputs under *work_dir* / *out_dir*.
+
+    Each directory involved is listed once with :func:`os.scandir` and the
+    cached ``DirEntry`` type is used instead of a ``stat()`` per candidate.
+    Only the artifacts named in *keys* are looked up.
+    """
+    bases = {"work": work_dir, "out": out_dir}
+    listings: Dict[Path, Dict[str, os.DirEntry]] = {}
+    found: Dict[str, Path] = {}
+    for key in keys:
+        base_name, sub, name, is_dir = _CORRELATE_ARTIFACTS[key]
+        base = bases[base_name]
+        if base is None:
+            continue
+        directory = base / sub if sub else base
+        if directory not in listings:
+            try:
+                with os.scandir(directory) as it:
+                    listings[directory] = {e.name: e for e in it}
+            except OSError:
+                listings[directory] = {}
+        entry = listings[directory].get(name)
+        if entry is not None and (entry.is_dir() if is_dir else entry.is_file()):
+            found[key] = directory / name
+    return found
+
+
 def _cmd_correlate(args: argparse.Namespace) -> None:
     """Correlate job opportunities with emails, resumes, and reply status.
 
@@ -1529,6 +1760,7 @@ def _cmd_correlate(args: argparse.Namespace) -> None:
     """
     from .correlation import (
         OpportunityCorrelator,
+        join_correlation_report,
         render_correlation_report,
         render_opportunity_card,
     )
@@ -1540,60 +1772,71 @@ def _cmd_correlate(args: argparse.Namespace) -> None:
 
     # ------------------------------------------------------------------
     # Load artifacts (explicit paths take priority over auto-discovery)
+    #
+    # Loaded one after another: decoding (json or orjson) and from_dict()
+    # both hold the GIL, so a thread pool would only add overhead.
     # ------------------------------------------------------------------
 
+    explicit = {
+        "messages": args.messages,
+        "opportunities": args.opportunities,
+        "match_results": args.match_results,
+        "tailored": args.tailored_dir,
+        "drafts": args.drafts,
+        "reply_results": args.reply_results,
+    }
+    discovered = _discover_artifacts(
+        work_dir, out_dir, [key for key, value in explicit.items() if not value]
+    )
+
+    def _artifact(key: str) -> Optional[str]:
+        if explicit[key]:
+            return explicit[key]
+        path = discovered.get(key)
+        return str(path) if path is not None else None
+
     # Messages
-    messages_path = args.messages
-    if not messages_path and work_dir and (work_dir / "messages.json").exists():
-        messages_path = str(work_dir / "messages.json")
+    messages_path = _artifact("messages")
     if messages_path:
-        messages = list(read_messages(messages_path))
-        correlator.add_messages(messages)
-        print(f"Loaded {len(messages)} messages from {messages_path}")
+        n_messages = correlator.add_messages(iter_messages(messages_path))
+        print(f"Loaded {n_messages} messages from {messages_path}")
 
     # Opportunities
-    opportunities_path = args.opportunities
-    if not opportunities_path and work_dir and (work_dir / "opportunities.json").exists():
-        opportunities_path = str(work_dir / "opportunities.json")
+    opportunities_path = _artifact("opportunities")
     if opportunities_path:
         opportunities = read_opportunities(opportunities_path)
         correlator.add_opportunities(opportunities)
         print(f"Loaded {len(opportunities)} opportunities from {opportunities_path}")
 
     # Match results
-    match_path = args.match_results
-    if not match_path and out_dir and (out_dir / "matches" / "match_results.json").exists():
-        match_path = str(out_dir / "matches" / "match_results.json")
+    match_path = _artifact("match_results")
     if match_path:
         match_results = read_match_results(match_path)
         correlator.add_match_results(match_results)
         print(f"Loaded {len(match_results)} match results from {match_path}")
 
     # Tailoring results
-    tailored_dir_path = args.tailored_dir
-    if not tailored_dir_path and out_dir and (out_dir / "tailored").exists():
-        tailored_dir_path = str(out_dir / "tailored")
+    tailored_dir_path = _artifact("tailored")
     if tailored_dir_path:
         tailored_dir = Path(tailored_dir_path)
         results_file = tailored_dir / "tailoring_results.json"
-        if results_file.exists():
+        try:
             tailoring_results = read_tailoring_results(results_file)
+        except OSError:  # missing file, or --tailored-dir is not a readable dir
+            pass
+        else:
             correlator.add_tailoring_results(tailoring_results, tailored_dir)
             print(f"Loaded {len(tailoring_results)} tailoring results from {results_file}")
 
     # Drafts
-    drafts_path = args.drafts
-    if not drafts_path and out_dir and (out_dir / "replies" / "drafts.json").exists():
-        drafts_path = str(out_dir / "replies" / "drafts.json")
+    drafts_path = _artifact("drafts")
     if drafts_path:
         drafts = read_drafts(drafts_path)
         correlator.add_drafts(drafts)
         print(f"Loaded {len(drafts)} drafts from {drafts_path}")
 
     # Reply results
-    reply_path = args.reply_results
-    if not reply_path and out_dir and (out_dir / "replies" / "reply_results.json").exists():
-        reply_path = str(out_dir / "replies" / "reply_results.json")
+    reply_path = _artifact("reply_results")
     if reply_path:
         reply_results = read_reply_results(reply_path)
         correlator.add_reply_results(reply_results)
@@ -1603,8 +1846,34 @@ def _cmd_correlate(args: argparse.Namespace) -> None:
     # Correlate
     # ------------------------------------------------------------------
 
+    # Filters are (label, predicate) pairs applied below in a single pass;
+    # the first failing predicate is charged with the drop so the per-filter
+    # counts match applying them one after another.  They are built before
+    # correlating because, without any, --top is pushed down into
+    # correlate() and only the top rows are assembled.
+    predicates = []
+    if args.min_score is not None:
+        min_score = args.min_score
+        predicates.append((
+            f"After min-score filter ({min_score})",
+            lambda c: c.match and c.match.overall_score >= min_score,
+        ))
+    if args.recommendation:
+        recs = frozenset(args.recommendation.split(","))
+        predicates.append((
+            "After recommendation filter",
+            lambda c: c.match and c.match.recommendation in recs,
+        ))
+    if args.stage:
+        stages = frozenset(args.stage.split(","))
+        predicates.append((
+            "After stage filter",
+            lambda c: c.stage.value in stages,
+        ))
+
     print("\nCorrelating artifacts...")
-    correlated = correlator.correlate()
+    pushdown_top = None if predicates else (args.top or None)
+    correlated = correlator.correlate(top=pushdown_top)
 
     if not correlated:
         print("No opportunities found to correlate.")
@@ -1614,25 +1883,21 @@ def _cmd_correlate(args: argparse.Namespace) -> None:
     # Filter
     # ------------------------------------------------------------------
 
-    if args.min_score is not None:
-        correlated = [
-            c for c in correlated
-            if c.match and c.match.overall_score >= args.min_score
-        ]
-        print(f"After min-score filter ({args.min_score}): {len(correlated)}")
-
-    if args.recommendation:
-        recs = set(args.recommendation.split(","))
-        correlated = [
-            c for c in correlated
-            if c.match and c.match.recommendation in recs
-        ]
-        print(f"After recommendation filter: {len(correlated)}")
-
-    if args.stage:
-        stages = set(args.stage.split(","))
-        correlated = [c for c in correlated if c.stage.value in stages]
-        print(f"After stage filter: {len(correlated)}")
+    if predicates:
+        dropped = [0] * len(predicates)
+        kept = []
+        for c in correlated:
+            for i, (_, predicate) in enumerate(predicates):
+                if not predicate(c):
+                    dropped[i] += 1
+                    break
+            else:
+                kept.append(c)
+        remaining = len(correlated)
+        for (label, _), n_dropped in zip(predicates, dropped):
+            remaining -= n_dropped
+            print(f"{label}: {remaining}")
+        correlated = kept
 
     if args.top:
         correlated = correlated[:args.top]
@@ -1649,8 +1914,7 @@ def _cmd_correlate(args: argparse.Namespace) -> None:
     resume_file = None
     if args.resume:
         try:
-            resume = read_resume(args.resume)
-            resume_name = resume.personal.name
+            resume_name = read_resume_name(args.resume)
             resume_file = args.resume
         except Exception:
             resume_file = args.resume
@@ -1680,25 +1944,28 @@ def _cmd_correlate(args: argparse.Namespace) -> None:
     # Summary report
     summary_path = out_path / "correlation_summary.md"
     summary_md = render_correlation_report(summary, correlated, include_cards=False)
-    summary_path.write_text(summary_md, encoding="utf-8")
+    write_markdown(summary_path, summary_md)
     print(f"Summary report saved to {summary_path}")
 
     # Individual cards
+    cards = None
     if args.individual_cards:
         cards_dir = out_path / "opportunity_cards"
         cards_dir.mkdir(parents=True, exist_ok=True)
-        for c in correlated:
-            card_md = render_opportunity_card(c)
-            safe_id = c.job_id.replace("/", "_").replace("\\", "_")[:60]
-            card_path = cards_dir / f"{safe_id}.md"
-            card_path.write_text(card_md, encoding="utf-8")
+        # Rendered in-process on purpose: a card takes tens of microseconds,
+        # less than pickling its CorrelatedOpportunity to a worker would.
+        cards = [render_opportunity_card(c) for c in correlated]
+        for c, card_md in zip(correlated, cards):
+            write_markdown(cards_dir / f"{_safe_id(c.job_id)}.md", card_md)
         print(f"Individual cards saved to {cards_dir}")
 
-    # Full report (summary + cards in one file)
+    # Full report (summary + cards in one file), reusing what was rendered
     if args.full_report:
         full_path = out_path / "correlation_full_report.md"
-        full_md = render_correlation_report(summary, correlated, include_cards=True)
-        full_path.write_text(full_md, encoding="utf-8")
+        if cards is None:
+            cards = map(render_opportunity_card, correlated)
+        full_md = join_correlation_report(summary_md, cards)
+        write_markdown(full_path, full_md)
         print(f"Full report saved to {full_path}")
 
     # ------------------------------------------------------------------
@@ -1708,61 +1975,76 @@ def _cmd_correlate(args: argparse.Namespace) -> None:
     _print_correlation_summary(summary, correlated)
 
 
+_TOP_MATCH_ROW = "    {i}. [{score}] {grade:12s} {title} at {company}".format
+
+
 def _print_correlation_summary(
     summary: "CorrelationSummary",
     correlated: list,
 ) -> None:
     """Print a brief correlation summary to console."""
-    print()
-    print("=" * 64)
-    print("  JOB OPPORTUNITY CORRELATION SUMMARY")
-    print("=" * 64)
-    print()
+    lines = [
+        "",
+        _BANNER,
+        "  JOB OPPORTUNITY CORRELATION SUMMARY",
+        _BANNER,
+        "",
+    ]
 
     if summary.resume_name:
-        print(f"  Candidate:            {summary.resume_name}")
-    print(f"  Total Opportunities:  {summary.total_opportunities}")
-    print(f"  Matched:              {summary.matched_count}")
-    print(f"  Tailored Resumes:     {summary.tailored_count}")
+        lines.append(f"  Candidate:            {summary.resume_name}")
+    lines.append(f"  Total Opportunities:  {summary.total_opportunities}")
+    lines.append(f"  Matched:              {summary.matched_count}")
+    lines.append(f"  Tailored Resumes:     {summary.tailored_count}")
 
     replies_total = (
         summary.replies_sent + summary.replies_dry_run
         + summary.replies_drafted + summary.replies_failed
     )
-    print(f"  Replies:              {replies_total}")
-    print(f"  Pipeline Complete:    {summary.pipeline_complete_count}")
+    lines.append(f"  Replies:              {replies_total}")
+    lines.append(f"  Pipeline Complete:    {summary.pipeline_complete_count}")
 
     if summary.matched_count > 0:
-        print()
-        print(f"  Avg Match Score:      {summary.avg_match_score:.1f} / 100")
-        print(f"  Best Score:           {summary.max_match_score:.1f} / 100")
+        lines.append("")
+        lines.append(f"  Avg Match Score:      {summary.avg_match_score:.1f} / 100")
+        lines.append(f"  Best Score:           {summary.max_match_score:.1f} / 100")
 
-    # Top matches
-    top = [c for c in correlated if c.match][:5]
+    # Top matches (correlated is already ordered by score)
+    top = list(islice((c for c in correlated if c.match), 5))
     if top:
-        print()
-        print("  Top Matches:")
+        lines.append("")
+        lines.append("  Top Matches:")
         for i, c in enumerate(top, 1):
-            score = f"{c.match.overall_score:.0f}" if c.match else "--"
-            grade = c.match.match_grade if c.match else "--"
-            company = c.company[:25] if c.company else "Unknown"
-            title = c.job_title[:30] if c.job_title else "Unknown"
-            print(f"    {i}. [{score}] {grade.title():12s} {title} at {company}")
-
-    # Stage breakdown
+            lines.append(_TOP_MATCH_ROW(
+                i=i,
+                score=f"{c.match.overall_score:.0f}",
+                grade=c.match.match_grade.title(),
+                title=c.job_title[:30] if c.job_title else "Unknown",
+                company=c.company[:25] if c.company else "Unknown",
+            ))
+
+    # Stage breakdown, in pipeline order
     if summary.by_stage:
-        print()
-        print("  Pipeline Stages:")
-        for stage, count in sorted(summary.by_stage.items()):
-            print(f"    {stage.title():12s} {count}")
+        from .correlation.models import STAGE_ORDER
 
-    print()
+        lines.append("")
+        lines.append("  Pipeline Stages:")
+        for stage in STAGE_ORDER:
+            count = summary.by_stage.get(stage)
+            if count:
+                lines.append(f"    {stage.title():12s} {count}")
 
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Email opportunity pipeline")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+# ============================================================================
+# Argument Parsing
+# ============================================================================
+#
+# Each sub-command's parser is built by its own function so main() only
+# constructs the one being invoked.
 
+def _add_fetch_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Fetch command
     fetch = subparsers.add_parser("fetch", help="Fetch emails from a provider")
     fetch.add_argument("--provider", default="gmail", choices=["gmail"])
@@ -1773,6 +2055,8 @@ def main() -> None:
     fetch.add_argument("--out", required=True, help="Output JSON path")
     fetch.set_defaults(func=_cmd_fetch)
 
+
+def _add_filter_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Filter command
     filt = subparsers.add_parser("filter", help="Filter emails by keyword rules")
     filt.add_argument("--in", dest="input", required=True, help="Input messages JSON")
@@ -1781,22 +2065,43 @@ def main() -> None:
     filt.add_argument("--llm-filter", action="store_true")
     filt.add_argument("--llm-model", default="gpt-4o-mini")
     filt.add_argument("--analytics", action="store_true", help="Generate analytics report")
+    _add_llm_cache_arguments(filt)
     filt.set_defaults(func=_cmd_filter)
 
+
+def _add_extract_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Extract command
     extract = subparsers.add_parser("extract", help="Extract opportunities to schema JSON")
     extract.add_argument("--in", dest="input", required=True, help="Input messages JSON")
     extract.add_argument("--out", required=True, help="Output opportunities JSON")
     extract.add_argument("--llm-extract", action="store_true")
     extract.add_argument("--llm-model", default="gpt-4o-mini")
+    extract.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Concurrent LLM requests with --llm-extract (default: 1)",
+    )
+    extract.add_argument(
+        "--pack-size",
+        type=int,
+        default=1,
+        help="Messages sent per LLM request with --llm-extract; the system "
+             "prompt and schema are sent once per pack (default: 1)",
+    )
+    _add_llm_cache_arguments(extract)
     extract.set_defaults(func=_cmd_extract)
 
+
+def _add_render_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Render command
     render = subparsers.add_parser("render", help="Render markdown from opportunities JSON")
     render.add_argument("--in", dest="input", required=True, help="Input opportunities JSON")
     render.add_argument("--out", required=True, help="Output directory for markdown")
     render.set_defaults(func=_cmd_render)
 
+
+def _add_run_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Run command (full pipeline)
     run = subparsers.add_parser("run", help="Fetch + filter + extract + render")
     run.add_argument("--provider", default="gmail", choices=["gmail"])
@@ -1807,16 +2112,26 @@ def main() -> None:
     run.add_argument("--llm-filter", action="store_true")
     run.add_argument("--llm-extract", action="store_true")
     run.add_argument("--llm-model", default="gpt-4o-mini")
+    run.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Concurrent LLM extraction requests with --llm-extract, started "
+             "while later messages are still being fetched and filtered (default: 1)",
+    )
     run.add_argument("--work-dir", default="data", help="Where to write JSON artifacts")
     run.add_argument("--out-dir", default="out", help="Where to write markdown files")
     run.add_argument("--no-analytics", action="store_true", help="Disable analytics generation")
     run.add_argument("--show-report", action="store_true", help="Print analytics report to console")
+    _add_llm_cache_arguments(run)
     run.set_defaults(func=_cmd_run)
 
-    # =========================================================================
-    # Full End-to-End Pipeline Command
-    # =========================================================================
 
+# ============================================================================
+# Full End-to-End Pipeline Command
+# ============================================================================
+
+def _add_run_all_parser(subparsers: "argparse._SubParsersAction") -> None:
     run_all = subparsers.add_parser(
         "run-all",
         help="Full e2e pipeline: fetch -> filter -> extract -> analyze -> "
@@ -1924,6 +2239,8 @@ def main() -> None:
 
     run_all.set_defaults(func=_cmd_run_all)
 
+
+def _add_analytics_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Analytics command (standalone)
     analytics = subparsers.add_parser("analytics", help="Generate analytics from existing data")
     analytics.add_argument("--messages", help="Path to messages JSON file")
@@ -1933,10 +2250,24 @@ def main() -> None:
     analytics.add_argument("--out-dir", default=".", help="Output directory for analytics files")
     analytics.set_defaults(func=_cmd_analytics)
 
-    # =========================================================================
-    # Job Analysis and Resume Matching Commands
-    # =========================================================================
 
+# ============================================================================
+# Job Analysis and Resume Matching Commands
+# ============================================================================
+
+def _add_llm_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="Directory for cached LLM responses "
+             "(default: ~/.cache/email_opportunity_pipeline/llm)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Always call the LLM; do not read or write cached responses"
+    )
+
+
+def _add_analyze_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Analyze command - Extract structured requirements from jobs
     analyze = subparsers.add_parser(
         "analyze",
@@ -1954,8 +2285,24 @@ def main() -> None:
         "--llm-model", default="gpt-4o-mini",
         help="LLM model to use for analysis"
     )
+    analyze.add_argument(
+        "--workers", type=int, default=1,
+        help="Concurrent LLM requests (default: 1)"
+    )
+    analyze.add_argument(
+        "--rpm", type=float, default=None,
+        help="Cap on LLM requests per minute; with --workers, concurrency "
+             "also backs off automatically on HTTP 429"
+    )
+    analyze.add_argument(
+        "--pack-size", type=int, default=1,
+        help="Opportunities analyzed per LLM request (default: 1)"
+    )
+    _add_llm_cache_arguments(analyze)
     analyze.set_defaults(func=_cmd_analyze)
 
+
+def _add_match_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Match command - Match resume against job opportunities
     match = subparsers.add_parser(
         "match",
@@ -1989,12 +2336,28 @@ def main() -> None:
         "--individual-reports", action="store_true",
         help="Generate individual markdown reports for each job (batch mode)"
     )
+    match.add_argument(
+        "--stream", action="store_true",
+        help="Print the LLM response as it is generated (single-job mode)"
+    )
     match.add_argument(
         "--llm-model", default="gpt-4o-mini",
         help="LLM model to use for matching"
     )
+    match.add_argument(
+        "--workers", type=int, default=1,
+        help="Concurrent LLM requests and report writes in batch mode (default: 1)"
+    )
+    match.add_argument(
+        "--rpm", type=float, default=None,
+        help="Cap on LLM requests per minute; with --workers, concurrency "
+             "also backs off automatically on HTTP 429"
+    )
+    _add_llm_cache_arguments(match)
     match.set_defaults(func=_cmd_match)
 
+
+def _add_rank_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Rank command - Filter and rank match results
     rank = subparsers.add_parser(
         "rank",
@@ -2026,10 +2389,12 @@ def main() -> None:
     )
     rank.set_defaults(func=_cmd_rank)
 
-    # =========================================================================
-    # Resume Tailoring Command
-    # =========================================================================
 
+# ============================================================================
+# Resume Tailoring Command
+# ============================================================================
+
+def _add_tailor_parser(subparsers: "argparse._SubParsersAction") -> None:
     tailor = subparsers.add_parser(
         "tailor",
         help="Tailor a resume for job opportunities using match results"
@@ -2068,10 +2433,12 @@ def main() -> None:
     )
     tailor.set_defaults(func=_cmd_tailor)
 
-    # =========================================================================
-    # Recruiter Reply Commands
-    # =========================================================================
 
+# ============================================================================
+# Recruiter Reply Commands
+# ============================================================================
+
+def _add_compose_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Compose command -- generate reply drafts
     compose = subparsers.add_parser(
         "compose",
@@ -2119,6 +2486,8 @@ def main() -> None:
     )
     compose.set_defaults(func=_cmd_compose)
 
+
+def _add_reply_parser(subparsers: "argparse._SubParsersAction") -> None:
     # Reply command -- send composed drafts
     reply = subparsers.add_parser(
         "reply",
@@ -2158,10 +2527,12 @@ def main() -> None:
     )
     reply.set_defaults(func=_cmd_reply)
 
-    # =========================================================================
-    # Correlation Command
-    # =========================================================================
 
+# ============================================================================
+# Correlation Command
+# ============================================================================
+
+def _add_correlate_parser(subparsers: "argparse._SubParsersAction") -> None:
     correlate = subparsers.add_parser(
         "correlate",
         help="Correlate job opportunities with emails, resumes, and replies",
@@ -2268,10 +2639,12 @@ def main() -> None:
 
     correlate.set_defaults(func=_cmd_correlate)
 
-    # =========================================================================
-    # Application Tracking Commands
-    # =========================================================================
 
+# ============================================================================
+# Application Tracking Commands
+# ============================================================================
+
+def _add_track_parser(subparsers: "argparse._SubParsersAction") -> None:
     track = subparsers.add_parser(
         "track",
         help="Initialise and view application tracking from correlation data",
@@ -2338,9 +2711,16 @@ def main() -> None:
         "--full-report", action="store_true",
         help="Generate a single comprehensive report with all cards included"
     )
+    track_output.add_argument(
+        "--compact", action="store_true",
+        help="Only fold pending track-update events (tracking.events.jsonl) "
+             "into tracking.json, then exit"
+    )
 
     track.set_defaults(func=_cmd_track)
 
+
+def _add_track_update_parser(subparsers: "argparse._SubParsersAction") -> None:
     # -- track-update command --
     track_update = subparsers.add_parser(
         "track-update",
@@ -2442,10 +2822,12 @@ def main() -> None:
 
     track_update.set_defaults(func=_cmd_track_update)
 
-    # =========================================================================
-    # Streamlit UI Command
-    # =========================================================================
 
+# ============================================================================
+# Streamlit UI Command
+# ============================================================================
+
+def _add_ui_parser(subparsers: "argparse._SubParsersAction") -> None:
     ui_parser = subparsers.add_parser(
         "ui",
         help="Launch the Streamlit web dashboard",
@@ -2462,7 +2844,87 @@ def main() -> None:
     )
     ui_parser.set_defaults(func=_cmd_ui)
 
-    args = parser.parse_args()
+
+# Sub-command name -> parser builder, in --help order
+_SUBCOMMANDS = {
+    "fetch": _add_fetch_parser,
+    "filter": _add_filter_parser,
+    "extract": _add_extract_parser,
+    "render": _add_render_parser,
+    "run": _add_run_parser,
+    "run-all": _add_run_all_parser,
+    "analytics": _add_analytics_parser,
+    "analyze": _add_analyze_parser,
+    "match": _add_match_parser,
+    "rank": _add_rank_parser,
+    "tailor": _add_tailor_parser,
+    "compose": _add_compose_parser,
+    "reply": _add_reply_parser,
+    "correlate": _add_correlate_parser,
+    "track": _add_track_parser,
+    "track-update": _add_track_update_parser,
+    "ui": _add_ui_parser,
+}
+
+
+class _FastParser(argparse.ArgumentParser):
+    """ArgumentParser that reuses one HelpFormatter while arguments are added.
+
+    ``add_argument`` builds a throwaway formatter for every argument just to
+    validate its metavar, and each construction queries the terminal size
+    (plus the colour environment on Python 3.14+).  Usage and help output
+    still get a fresh formatter, so they reflect the current terminal.
+    """
+
+    _adding_argument = False
+    _setup_formatter: Optional[argparse.HelpFormatter] = None
+
+    def add_argument(self, *args, **kwargs):
+        self._adding_argument = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._adding_argument = False
+
+    def _get_formatter(self) -> argparse.HelpFormatter:
+        if not self._adding_argument:
+            return super()._get_formatter()
+        if self._setup_formatter is None:
+            self._setup_formatter = super()._get_formatter()
+        return self._setup_formatter
+
+
+# Formatter construction only became expensive with the 3.14 colour support;
+# on older interpreters the extra method layer costs more than it saves.
+_PARSER_CLASS = (
+    _FastParser if sys.version_info >= (3, 14) else argparse.ArgumentParser
+)
+
+
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    When *command* names a known sub-command only its sub-parser is
+    constructed; otherwise (``--help``, a typo, no arguments) all of them
+    are, so the top-level usage and error messages list every choice.
+    """
+    parser = _PARSER_CLASS(description="Email opportunity pipeline")
+    subparsers = parser.add_subparsers(
+        dest="command", required=True, parser_class=_PARSER_CLASS
+    )
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
     args.func(args)
 
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 DEFAULT_MAX_RESULTS = 500
+# messages.get calls bundled into one Gmail batch HTTP request (API max 100;
+# Google recommends at most 50 to stay clear of per-user rate limits).
+GMAIL_BATCH_SIZE = 50
 DEFAULT_WINDOW = "1d"
 
 GMAIL_SCOPES = [
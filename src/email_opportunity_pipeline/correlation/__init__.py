@@ -34,7 +34,9 @@ __all__ = [
     "OpportunityStage",
     "ReplyOutcome",
     "ReplySummary",
+    "STAGE_ORDER",
     "TailoringSummary",
+    "join_correlation_report",
     "render_correlation_report",
     "render_correlation_summary",
     "render_opportunity_card",
@@ -49,9 +51,11 @@ from .models import (
     OpportunityStage,
     ReplyOutcome,
     ReplySummary,
+    STAGE_ORDER,
     TailoringSummary,
 )
 from .report import (
+    join_correlation_report,
     render_correlation_report,
     render_correlation_summary,
     render_opportunity_card,
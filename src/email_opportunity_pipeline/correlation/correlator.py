@@ -8,10 +8,11 @@ every job found across the provided data sources.
 """
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from .models import (
     CorrelatedOpportunity,
@@ -29,6 +30,15 @@ if TYPE_CHECKING:
     from ..models import EmailMessage
     from ..reply.models import EmailDraft, ReplyResult
 
+# ReplyStatus value -> ReplyOutcome.  Keyed by value so this module does not
+# import the reply package (which pulls in the composer and Gmail sender).
+_OUTCOME_BY_REPLY_STATUS: Dict[str, ReplyOutcome] = {
+    "draft": ReplyOutcome.DRAFTED,
+    "dry_run": ReplyOutcome.DRY_RUN,
+    "sent": ReplyOutcome.SENT,
+    "failed": ReplyOutcome.FAILED,
+}
+
 
 class OpportunityCorrelator:
     """Build correlated views of job opportunities across pipeline artifacts.
@@ -61,11 +71,17 @@ class OpportunityCorrelator:
     # Data ingestion
     # ------------------------------------------------------------------
 
-    def add_messages(self, messages: List["EmailMessage"]) -> None:
-        """Register source email messages."""
-        for msg in messages:
+    def add_messages(self, messages: Iterable["EmailMessage"]) -> int:
+        """Register source email messages.
+
+        *messages* may be any iterable, including a streaming reader; the
+        number of messages consumed is returned.
+        """
+        count = 0
+        for count, msg in enumerate(messages, 1):
             if msg.message_id:
                 self._emails[msg.message_id] = msg
+        return count
 
     def add_opportunities(self, opportunities: List[Dict[str, Any]]) -> None:
         """Register extracted job opportunities."""
@@ -114,12 +130,18 @@ class OpportunityCorrelator:
     # Correlation
     # ------------------------------------------------------------------
 
-    def correlate(self) -> List[CorrelatedOpportunity]:
+    def correlate(self, top: Optional[int] = None) -> List[CorrelatedOpportunity]:
         """Build correlated opportunities from all registered artifacts.
 
         Returns a list of :class:`CorrelatedOpportunity` objects, one per
         unique ``job_id`` found across *any* data source, sorted by match
         score descending (unmatched opportunities come last).
+
+        Each ``add_*`` method indexes its artifacts by ``job_id``, so this is
+        a hash join: every row is assembled with one dict probe per source.
+
+        With *top*, only the *top* best-scoring rows are returned -- the same
+        rows as ``correlate()[:top]`` -- and only those rows are assembled.
         """
         # Collect all known job_ids across every data source
         all_ids: set[str] = set()
@@ -130,15 +152,24 @@ class OpportunityCorrelator:
         all_ids.update(self._drafts.keys())
         all_ids.update(self._reply_results.keys())
 
-        correlated: List[CorrelatedOpportunity] = []
-        for job_id in all_ids:
-            correlated.append(self._build_one(job_id))
+        build_one = self._build_one
 
-        # Sort: matched opportunities first (by score desc), then unmatched
+        if top is not None:
+            match_results = self._match_results
+
+            def score(job_id: str) -> float:
+                result = match_results.get(job_id)
+                return result.overall_score if result is not None else -1
+
+            # nlargest keeps ties in input order, like the stable sort below
+            return [build_one(job_id) for job_id in heapq.nlargest(top, all_ids, key=score)]
+
+        correlated = [build_one(job_id) for job_id in all_ids]
+
+        # Sort: matched opportunities first (by score desc), then unmatched.
+        # A bare number as key: Timsort compares floats far faster than tuples.
         correlated.sort(
-            key=lambda c: (
-                c.match.overall_score if c.match else -1,
-            ),
+            key=lambda c: c.match.overall_score if c.match else -1,
             reverse=True,
         )
         return correlated
@@ -164,7 +195,8 @@ class OpportunityCorrelator:
         stage_counts: Dict[str, int] = defaultdict(int)
         grade_counts: Dict[str, int] = defaultdict(int)
         rec_counts: Dict[str, int] = defaultdict(int)
-        company_counts: Dict[str, int] = defaultdict(int)
+        company_counts: Counter[str] = Counter()
+        reply_counts: Counter[ReplyOutcome] = Counter()
         scores: List[float] = []
 
         for c in correlated:
@@ -194,31 +226,25 @@ class OpportunityCorrelator:
 
             # Reply stats
             if c.reply:
-                if c.reply.status == ReplyOutcome.DRAFTED:
-                    summary.replies_drafted += 1
-                elif c.reply.status == ReplyOutcome.SENT:
-                    summary.replies_sent += 1
-                elif c.reply.status == ReplyOutcome.FAILED:
-                    summary.replies_failed += 1
-                elif c.reply.status == ReplyOutcome.DRY_RUN:
-                    summary.replies_dry_run += 1
+                reply_counts[c.reply.status] += 1
 
         summary.by_stage = dict(stage_counts)
         summary.by_grade = dict(grade_counts)
         summary.by_recommendation = dict(rec_counts)
+        summary.replies_drafted = reply_counts[ReplyOutcome.DRAFTED]
+        summary.replies_sent = reply_counts[ReplyOutcome.SENT]
+        summary.replies_failed = reply_counts[ReplyOutcome.FAILED]
+        summary.replies_dry_run = reply_counts[ReplyOutcome.DRY_RUN]
 
         if scores:
             summary.avg_match_score = sum(scores) / len(scores)
             summary.max_match_score = max(scores)
             summary.min_match_score = min(scores)
 
-        # Top companies
-        sorted_companies = sorted(
-            company_counts.items(), key=lambda x: x[1], reverse=True
-        )
+        # Top companies (most_common selects with a heap; ties keep first-seen order)
         summary.top_companies = [
             {"company": name, "count": count}
-            for name, count in sorted_companies[:10]
+            for name, count in company_counts.most_common(10)
         ]
 
         return summary
@@ -321,15 +347,9 @@ class OpportunityCorrelator:
             error = None
 
             if reply_result:
-                from ..reply.models import ReplyStatus
-
-                status_map = {
-                    ReplyStatus.DRAFT: ReplyOutcome.DRAFTED,
-                    ReplyStatus.DRY_RUN: ReplyOutcome.DRY_RUN,
-                    ReplyStatus.SENT: ReplyOutcome.SENT,
-                    ReplyStatus.FAILED: ReplyOutcome.FAILED,
-                }
-                status = status_map.get(reply_result.status, ReplyOutcome.DRAFTED)
+                status = _OUTCOME_BY_REPLY_STATUS.get(
+                    reply_result.status.value, ReplyOutcome.DRAFTED
+                )
                 gmail_id = reply_result.gmail_message_id
                 error = reply_result.error
                 if reply_result.timestamp:
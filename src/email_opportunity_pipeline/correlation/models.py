@@ -35,6 +35,10 @@ class OpportunityStage(enum.Enum):
     CLOSED = "closed"
 
 
+#: Stage values in pipeline order, for listing per-stage counts.
+STAGE_ORDER = tuple(stage.value for stage in OpportunityStage)
+
+
 class ReplyOutcome(enum.Enum):
     """Simplified reply state for the correlation view."""
 
@@ -49,7 +53,7 @@ class ReplyOutcome(enum.Enum):
 # Email summary (lightweight view of the source email)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class EmailSummary:
     """Lightweight summary of the source email for the correlation view."""
 
@@ -92,7 +96,7 @@ class EmailSummary:
 # Match summary (lightweight view of the match result)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class MatchSummary:
     """Lightweight summary of match result for the correlation view."""
 
@@ -156,7 +160,7 @@ class MatchSummary:
 # Tailoring summary
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class TailoringSummary:
     """Lightweight summary of tailoring result for the correlation view."""
 
@@ -187,7 +191,7 @@ class TailoringSummary:
 # Reply summary
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ReplySummary:
     """Lightweight summary of the reply draft and send result."""
 
@@ -239,7 +243,7 @@ class ReplySummary:
 # Core: Correlated Opportunity
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CorrelatedOpportunity:
     """A unified view of a single job opportunity across the entire pipeline.
 
@@ -344,7 +348,7 @@ class CorrelatedOpportunity:
 # Correlation Summary (aggregate statistics)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CorrelationSummary:
     """Aggregate statistics across all correlated opportunities."""
 
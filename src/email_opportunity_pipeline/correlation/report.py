@@ -7,13 +7,14 @@ and reply status -- all in a single unified view.
 """
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from .models import (
     CorrelatedOpportunity,
     CorrelationSummary,
     OpportunityStage,
     ReplyOutcome,
+    STAGE_ORDER,
 )
 
 
@@ -156,12 +157,7 @@ def render_correlation_summary(
         lines.append("")
         lines.append("| Stage | Count |")
         lines.append("|-------|-------|")
-        stage_order = [
-            "fetched", "filtered", "extracted", "analyzed",
-            "matched", "tailored", "composed", "replied",
-            "applied", "interviewing", "offered", "closed",
-        ]
-        for stage_name in stage_order:
+        for stage_name in STAGE_ORDER:
             count = summary.by_stage.get(stage_name, 0)
             if count:
                 try:
@@ -384,13 +380,22 @@ def render_correlation_report(
     When *include_cards* is ``True``, individual opportunity cards are
     appended after the summary for a single-file comprehensive report.
     """
-    parts = [render_correlation_summary(summary, correlated)]
+    summary_md = render_correlation_summary(summary, correlated)
+    if not (include_cards and correlated):
+        return summary_md
+    return join_correlation_report(
+        summary_md, (render_opportunity_card(c) for c in correlated)
+    )
 
-    if include_cards and correlated:
-        parts.append("\n---\n")
-        parts.append("# Detailed Opportunity Cards\n")
-        for c in correlated:
-            parts.append(render_opportunity_card(c))
-            parts.append("\n---\n")
 
+def join_correlation_report(summary_md: str, cards: Iterable[str]) -> str:
+    """Assemble a full report from an already rendered summary and cards.
+
+    Gives the same text as ``render_correlation_report(..., include_cards=True)``
+    without rendering the summary or any card a second time.
+    """
+    parts = [summary_md, "\n---\n", "# Detailed Opportunity Cards\n"]
+    for card in cards:
+        parts.append(card)
+        parts.append("\n---\n")
     return "\n".join(parts)
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+from typing import List, Optional, TYPE_CHECKING
 
 from ..models import EmailMessage
 from .extractor import BaseExtractor
 from .schema import JOB_SCHEMA
 
+if TYPE_CHECKING:
+    from ..llm_cache import ResponseCache
+
 # Schema name for OpenAI API
 JOB_SCHEMA_NAME = "job_opportunity"
 
+# Several emails per request: one opportunity per email, in input order
+JOB_PACK_SCHEMA_NAME = "job_opportunity_pack"
+
+JOB_PACK_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "opportunities": {
+            "type": "array",
+            "items": {k: v for k, v in JOB_SCHEMA.items() if k != "$schema"},
+        },
+    },
+    "required": ["opportunities"],
+}
+
 SYSTEM_INSTRUCTIONS = (
     "Extract job opportunity data from recruiter/job emails into the provided JSON schema. "
     "Rules: do not invent details, use null/[] when missing. Identify all engagement options "
@@ -20,7 +38,12 @@ SYSTEM_INSTRUCTIONS = (
 
 
 class LLMExtractor(BaseExtractor):
-    def __init__(self, model: str = "gpt-4o-mini", api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
         try:
             from openai import OpenAI
         except ImportError as exc:
@@ -28,29 +51,139 @@ class LLMExtractor(BaseExtractor):
 
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.cache = cache
 
     def extract(self, email: EmailMessage) -> dict:
-        prompt = {
-            "message_id": email.message_id,
-            "thread_id": email.thread_id,
-            "headers": email.headers.to_dict(),
+        cache_key = None
+        extracted = None
+        if self.cache is not None:
+            cache_key = self._cache_key(email)
+            extracted = self.cache.get(cache_key)
+
+        if extracted is None:
+            response = self.client.responses.create(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": SYSTEM_INSTRUCTIONS},
+                    {"role": "user", "content": self._build_prompt(email)},
+                ],
+                text={
+                    "format": {
+                        "type": "json_schema",
+                        "name": JOB_SCHEMA_NAME,
+                        "schema": JOB_SCHEMA,
+                    }
+                },
+            )
+            extracted = json.loads(response.output_text)
+            if cache_key is not None:
+                self.cache.put(cache_key, extracted)
+
+        extracted["source_email"] = self._source_email(email)
+        return extracted
+
+    def extract_pack(self, emails: List[EmailMessage]) -> List[dict]:
+        """Extract several emails with a single LLM request.
+
+        Works like :meth:`JobAnalyzer.analyze_pack
+        <email_opportunity_pipeline.matching.analyzer.JobAnalyzer.analyze_pack>`:
+        the system prompt and schema are sent once per pack, cached emails
+        are left out, packed answers are cached under the same keys
+        :meth:`extract` uses, and a reply that cannot be parsed or has the
+        wrong number of opportunities falls back to one request per email.
+        """
+        extracted: List[Optional[dict]] = [None] * len(emails)
+        if self.cache is not None:
+            for i, email in enumerate(emails):
+                extracted[i] = self.cache.get(self._cache_key(email))
+
+        pending = [i for i, opp in enumerate(extracted) if opp is None]
+        if len(pending) == 1:
+            extracted[pending[0]] = self.extract(emails[pending[0]])
+            pending = []
+
+        if pending:
+            sections = "\n\n".join(
+                f"### Email {n}\n\n{self._build_prompt(emails[i])}"
+                for n, i in enumerate(pending, 1)
+            )
+            response = self.client.responses.create(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": SYSTEM_INSTRUCTIONS},
+                    {
+                        "role": "user",
+                        "content": (
+                            f"Extract each of these {len(pending)} emails. "
+                            f"Return exactly one opportunity per email, in the same order.\n\n"
+                            f"{sections}"
+                        ),
+                    },
+                ],
+                text={
+                    "format": {
+                        "type": "json_schema",
+                        "name": JOB_PACK_SCHEMA_NAME,
+                        "schema": JOB_PACK_SCHEMA,
+                    }
+                },
+            )
+
+            try:
+                packed = json.loads(response.output_text).get("opportunities")
+            except (json.JSONDecodeError, AttributeError):
+                packed = None
+
+            if isinstance(packed, list) and len(packed) == len(pending):
+                for i, opp in zip(pending, packed):
+                    if self.cache is not None:
+                        self.cache.put(self._cache_key(emails[i]), opp)
+                    extracted[i] = opp
+            else:
+                for i in pending:
+                    extracted[i] = self.extract(emails[i])
+
+        for opp, email in zip(extracted, emails):
+            opp["source_email"] = self._source_email(email)
+        return extracted
+
+    @staticmethod
+    def _build_prompt(email: EmailMessage) -> str:
+        return json.dumps(
+            {
+                "message_id": email.message_id,
+                "thread_id": email.thread_id,
+                "headers": email.headers.to_dict(),
+                "snippet": email.snippet,
+                "body_text": (email.body_text or "")[:6000],
+                "attachments": [att.to_dict() for att in email.attachments],
+            },
+            ensure_ascii=True,
+        )
+
+    def _cache_key(self, email: EmailMessage) -> str:
+        """Key an extraction by the email's content, not its delivery.
+
+        Recruiters re-send the same template (reposts, follow-up blasts) as
+        new messages.  Leaving out the ids, recipients, date and per-message
+        attachment ids lets those copies share one cached extraction; each
+        result's ``source_email`` is then rebuilt from the message itself.
+        """
+        content = {
+            "subject": email.headers.subject,
+            "from": email.headers.from_,
             "snippet": email.snippet,
             "body_text": (email.body_text or "")[:6000],
-            "attachments": [att.to_dict() for att in email.attachments],
+            "attachments": [[a.filename, a.mime_type, a.size] for a in email.attachments],
         }
+        return self.cache.key(self.model, SYSTEM_INSTRUCTIONS, content, JOB_SCHEMA)
 
-        response = self.client.responses.create(
-            model=self.model,
-            input=[
-                {"role": "system", "content": SYSTEM_INSTRUCTIONS},
-                {"role": "user", "content": json.dumps(prompt, ensure_ascii=True)},
-            ],
-            text={
-                "format": {
-                    "type": "json_schema",
-                    "name": JOB_SCHEMA_NAME,
-                    "schema": JOB_SCHEMA,
-                }
-            },
-        )
-        return json.loads(response.output_text)
+    @staticmethod
+    def _source_email(email: EmailMessage) -> dict:
+        return {
+            "message_id": email.message_id,
+            "thread_id": email.thread_id,
+            "subject": email.headers.subject or None,
+            "from": email.headers.from_ or None,
+            "date": email.headers.date or None,
+        }
@@ -1,30 +1,35 @@
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from typing import List, Pattern, Tuple
 
 from ..models import EmailMessage, FilterDecision
 from .base import EmailFilter
 from .rules import FilterRules
 
 
-def _matches_any(patterns: List[str], text: str) -> List[str]:
+_EMAIL_ADDRESS_RE = re.compile(r"([A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})", re.I)
+_OA_RE = re.compile(r"\boa\b", re.I)
+
+
+def _compile_patterns(patterns: List[str]) -> List[Pattern[str]]:
+    """Compile rule patterns case-insensitively, once per filter."""
+    return [re.compile(pattern, re.I) for pattern in patterns]
+
+
+def _matches_any(patterns: List[Pattern[str]], text: str) -> List[str]:
     """Return list of patterns that match the text."""
-    hits: List[str] = []
-    for pattern in patterns:
-        if re.search(pattern, text, flags=re.I):
-            hits.append(pattern)
-    return hits
+    return [pattern.pattern for pattern in patterns if pattern.search(text)]
 
 
-def _count_matches(patterns: List[str], text: str) -> int:
+def _count_matches(patterns: List[Pattern[str]], text: str) -> int:
     """Return count of how many patterns match the text."""
     return len(_matches_any(patterns, text))
 
 
 def _extract_email_address(from_header: str) -> str:
     """Extract email address from From header."""
-    match = re.search(r"([A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})", from_header, re.I)
+    match = _EMAIL_ADDRESS_RE.search(from_header)
     return match.group(1).lower() if match else ""
 
 
@@ -42,7 +47,7 @@ def _local_part_of(email_addr: str) -> str:
     return email_addr.split("@", 1)[0].lower()
 
 
-def _is_promotional_sender(email_addr: str, patterns: List[str]) -> bool:
+def _is_promotional_sender(email_addr: str, patterns: List[Pattern[str]]) -> bool:
     """Check if the email local part matches promotional sender patterns."""
     local_part = _local_part_of(email_addr)
     if not local_part:
@@ -50,20 +55,14 @@ def _is_promotional_sender(email_addr: str, patterns: List[str]) -> bool:
     # Patterns are designed to match the local part (e.g., ^noreply@)
     # We prepend the local part with nothing and append @ to match properly
     test_str = local_part + "@"
-    for pattern in patterns:
-        if re.search(pattern, test_str, flags=re.I):
-            return True
-    return False
+    return any(pattern.search(test_str) for pattern in patterns)
 
 
-def _is_commercial_domain(domain: str, patterns: List[str]) -> bool:
+def _is_commercial_domain(domain: str, patterns: List[Pattern[str]]) -> bool:
     """Check if domain matches commercial subdomain patterns (e.g., em.*, marketing.*)."""
     if not domain:
         return False
-    for pattern in patterns:
-        if re.search(pattern, domain, flags=re.I):
-            return True
-    return False
+    return any(pattern.search(domain) for pattern in patterns)
 
 
 def _is_known_job_board_domain(domain: str, job_source_domains: List[str]) -> bool:
@@ -115,6 +114,19 @@ class KeywordFilter(EmailFilter):
 
     def __init__(self, rules: FilterRules | None = None) -> None:
         self.rules = rules or FilterRules.default()
+        # Rule patterns are compiled once here rather than looked up in the
+        # ``re`` module cache on every search of every email.
+        rules = self.rules
+        self._strong_signal_patterns = _compile_patterns(rules.strong_job_signal_patterns)
+        self._role_title_patterns = _compile_patterns(rules.role_title_patterns)
+        self._interview_context_patterns = _compile_patterns(rules.interview_context_patterns)
+        self._oa_assessment_patterns = _compile_patterns(rules.oa_assessment_patterns)
+        self._promotional_sender_patterns = _compile_patterns(rules.promotional_sender_patterns)
+        self._commercial_domain_patterns = _compile_patterns(rules.commercial_domain_patterns)
+        self._promo_negative_patterns = _compile_patterns(rules.promo_negative_patterns)
+        self._transactional_patterns = _compile_patterns(rules.transactional_patterns)
+        self._marketing_footer_patterns = _compile_patterns(rules.marketing_footer_patterns)
+        self._edu_negative_patterns = _compile_patterns(rules.edu_negative_patterns)
 
     def _calculate_score(
         self, email: EmailMessage
@@ -146,13 +158,13 @@ class KeywordFilter(EmailFilter):
             positive_reasons.append(f"job source domain: {domain}")
 
         # 2. Strong job signal patterns
-        strong_hits = _matches_any(self.rules.strong_job_signal_patterns, text)
+        strong_hits = _matches_any(self._strong_signal_patterns, text)
         if strong_hits:
             score += self.STRONG_SIGNAL_SCORE
             positive_reasons.append(f"strong job signals: {len(strong_hits)} matches")
 
         # 3. Role title patterns
-        role_hits = _matches_any(self.rules.role_title_patterns, text)
+        role_hits = _matches_any(self._role_title_patterns, text)
         if role_hits:
             score += self.ROLE_TITLE_SCORE
             positive_reasons.append("role/title mentioned")
@@ -165,11 +177,11 @@ class KeywordFilter(EmailFilter):
 
         # Context-aware keyword detection
         if "schedule" in text:
-            if _matches_any(self.rules.interview_context_patterns, text):
+            if _matches_any(self._interview_context_patterns, text):
                 strong_kw_hits.append("schedule(interview-context)")
 
-        if re.search(r"\boa\b", text, flags=re.I):
-            if _matches_any(self.rules.oa_assessment_patterns, text):
+        if _OA_RE.search(text):
+            if _matches_any(self._oa_assessment_patterns, text):
                 strong_kw_hits.append("oa(assessment-context)")
 
         if strong_kw_hits:
@@ -209,7 +221,7 @@ class KeywordFilter(EmailFilter):
         # === NEGATIVE SIGNALS ===
 
         # 1. Promotional sender patterns (noreply@, marketing@, etc.)
-        if _is_promotional_sender(email_addr, self.rules.promotional_sender_patterns):
+        if _is_promotional_sender(email_addr, self._promotional_sender_patterns):
             # Only penalize if NOT from a known job source domain
             if not _is_known_job_board_domain(domain, self.rules.job_source_domains):
                 score += self.PROMO_SENDER_PENALTY
@@ -217,26 +229,26 @@ class KeywordFilter(EmailFilter):
                 negative_reasons.append(f"promotional sender pattern: {local_part}@")
 
         # 2. Commercial domain patterns (em.*, marketing.*, etc.)
-        if _is_commercial_domain(domain, self.rules.commercial_domain_patterns):
+        if _is_commercial_domain(domain, self._commercial_domain_patterns):
             # Only penalize if NOT from a known job source domain
             if not _is_known_job_board_domain(domain, self.rules.job_source_domains):
                 score += self.COMMERCIAL_DOMAIN_PENALTY
                 negative_reasons.append(f"commercial domain pattern: {domain}")
 
         # 3. Promotional content patterns
-        promo_hits = _matches_any(self.rules.promo_negative_patterns, text)
+        promo_hits = _matches_any(self._promo_negative_patterns, text)
         if promo_hits:
             score += self.PROMO_CONTENT_PENALTY
             negative_reasons.append(f"promotional content: {len(promo_hits)} patterns")
 
         # 4. Transactional patterns
-        transactional_hits = _matches_any(self.rules.transactional_patterns, text)
+        transactional_hits = _matches_any(self._transactional_patterns, text)
         if transactional_hits:
             score += self.TRANSACTIONAL_PENALTY
             negative_reasons.append(f"transactional content: {len(transactional_hits)} patterns")
 
         # 5. Marketing footer patterns
-        footer_hits = _matches_any(self.rules.marketing_footer_patterns, text)
+        footer_hits = _matches_any(self._marketing_footer_patterns, text)
         if footer_hits:
             score += self.MARKETING_FOOTER_PENALTY
             negative_reasons.append("marketing footer detected")
@@ -262,8 +274,8 @@ class KeywordFilter(EmailFilter):
             )
 
         # === EDUCATION/ADMISSIONS BLOCK ===
-        edu_hits = _matches_any(self.rules.edu_negative_patterns, text)
-        strong_hits = _matches_any(self.rules.strong_job_signal_patterns, text)
+        edu_hits = _matches_any(self._edu_negative_patterns, text)
+        strong_hits = _matches_any(self._strong_signal_patterns, text)
         
         if edu_hits and not strong_hits:
             # Block education emails unless they have strong job signals
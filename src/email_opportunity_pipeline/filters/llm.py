@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from ..models import EmailMessage, FilterDecision
 from .base import EmailFilter
 
+if TYPE_CHECKING:
+    from ..llm_cache import ResponseCache
+
+SYSTEM_PROMPT = (
+    "Decide if this email is a job opportunity. "
+    "Return JSON with keys: keep (boolean) and reason (string). "
+    "Keep only real job opportunities or recruiter outreach."
+)
+
 
 class LLMFilter(EmailFilter):
     name = "llm"
 
-    def __init__(self, model: str = "gpt-4o-mini", api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
         try:
             from openai import OpenAI
         except ImportError as exc:
@@ -18,6 +32,7 @@ class LLMFilter(EmailFilter):
 
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.cache = cache
 
     def evaluate(self, email: EmailMessage) -> FilterDecision:
         body = email.body_text or ""
@@ -30,25 +45,30 @@ class LLMFilter(EmailFilter):
             "body": body,
         }
 
-        system = (
-            "Decide if this email is a job opportunity. "
-            "Return JSON with keys: keep (boolean) and reason (string). "
-            "Keep only real job opportunities or recruiter outreach."
-        )
+        user_prompt = json.dumps(prompt, ensure_ascii=True)
+        cache_key = None
+        data = None
+        if self.cache is not None:
+            cache_key = self.cache.key(self.model, SYSTEM_PROMPT, user_prompt)
+            data = self.cache.get(cache_key)
 
-        response = self.client.responses.create(
-            model=self.model,
-            input=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": json.dumps(prompt, ensure_ascii=True)},
-            ],
-            text={"format": {"type": "json_object"}},
-        )
+        if data is None:
+            response = self.client.responses.create(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                text={"format": {"type": "json_object"}},
+            )
 
-        try:
-            data = json.loads(response.output_text)
-        except json.JSONDecodeError:
-            data = {"keep": False, "reason": "invalid LLM response"}
+            try:
+                data = json.loads(response.output_text)
+            except json.JSONDecodeError:
+                data = {"keep": False, "reason": "invalid LLM response"}
+            else:
+                if cache_key is not None:
+                    self.cache.put(cache_key, data)
 
         return FilterDecision(
             filter_name=self.name,
@@ -1,51 +1,210 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, TYPE_CHECKING
 
 from .models import EmailMessage
 
+try:
+    import orjson
+except ImportError:  # optional speed-up: pip install -e '.[fast]'
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional streaming reader: pip install -e '.[fast]'
+    ijson = None
+
 if TYPE_CHECKING:
     from .matching.models import Resume, MatchResult
     from .reply.models import EmailDraft, QuestionnaireConfig, ReplyResult
 
+logger = logging.getLogger(__name__)
+
 
 def _utc_now_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
 
-def write_messages(path: str | Path, messages: Iterable[EmailMessage]) -> None:
+def _dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """Encode *obj* as UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_json(data: bytes | str) -> Any:
+    """Decode JSON text or bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_jsonl(path: str | Path) -> bool:
+    """True when *path* names a JSON Lines file (``.jsonl`` suffix)."""
+    return Path(path).suffix == ".jsonl"
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* with raw ``os.open``/``os.write`` calls.
+
+    Bypasses the buffered/text layers of :meth:`Path.write_text`, whose
+    per-file setup dominates when many small report files are written.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_markdown(path: str | Path, text: str) -> None:
+    """Write a rendered Markdown report or card as UTF-8 (``\\n`` newlines)."""
+    _write_bytes(Path(path), text.encode("utf-8"))
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to *path* so readers see either the old or new file.
+
+    The bytes go to a sibling ``.tmp`` file which is fsync'd and then
+    renamed over *path*; a crash mid-write leaves the original untouched.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _write_jsonl(path: Path, records: Iterable[Dict[str, Any]]) -> int:
+    """Write *records* as JSON Lines, one at a time; return the count.
+
+    *records* is usually a generator still reading its input, which may be
+    *path* itself (``filter --in x.jsonl --out x.jsonl``).  Lines therefore
+    go to a sibling ``.tmp`` file that replaces *path* only once the
+    stream is exhausted; an error mid-stream leaves *path* untouched.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    n = 0
+    try:
+        with open(tmp, "wb", buffering=1 << 16) as f:
+            for record in records:
+                f.write(_dumps_json(record, indent=False))
+                f.write(b"\n")
+                n += 1
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return n
+
+
+def _iter_jsonl(path: str | Path) -> Iterator[Any]:
+    """Yield the decoded records of a JSON Lines file, skipping blank lines."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield _loads_json(line)
+
+
+def write_messages(path: str | Path, messages: Iterable[EmailMessage]) -> int:
+    """Write *messages* (any iterable, including a generator); return the count.
+
+    A path ending in ``.jsonl`` is written as JSON Lines (one message per
+    line, no header) and consumed one message at a time, so a generator of
+    messages is never materialised.
+    """
+    if _is_jsonl(path):
+        return _write_jsonl(Path(path), (m.to_dict() for m in messages))
     data = [m.to_dict() for m in messages]
     payload = {
         "fetched_at_utc": _utc_now_iso(),
         "count": len(data),
         "messages": data,
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
+    return len(data)
 
 
 def read_messages(path: str | Path) -> List[EmailMessage]:
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if _is_jsonl(path):
+        return list(iter_messages(path))
+    raw = _loads_json(Path(path).read_bytes())
     messages = raw.get("messages", []) or []
     return [EmailMessage.from_dict(m) for m in messages]
 
 
+def iter_messages(path: str | Path) -> Iterator[EmailMessage]:
+    """Yield messages from a ``messages.json`` file one at a time.
+
+    With ijson installed the file is pull-parsed incrementally, so only one
+    message dict is alive at a time; otherwise this falls back to
+    :func:`read_messages`.  ``.jsonl`` files are read line by line.
+    """
+    if _is_jsonl(path):
+        for m in _iter_jsonl(path):
+            yield EmailMessage.from_dict(m)
+        return
+    if ijson is None:
+        yield from read_messages(path)
+        return
+    with open(path, "rb") as f:
+        for m in ijson.items(f, "messages.item", use_float=True):
+            yield EmailMessage.from_dict(m)
+
+
 def write_opportunities(path: str | Path, opportunities: List[Dict[str, Any]]) -> None:
+    if _is_jsonl(path):
+        _write_jsonl(Path(path), opportunities)
+        return
     payload = {
         "created_at_utc": _utc_now_iso(),
         "count": len(opportunities),
         "opportunities": opportunities,
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 def read_opportunities(path: str | Path) -> List[Dict[str, Any]]:
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if _is_jsonl(path):
+        return list(_iter_jsonl(path))
+    raw = _loads_json(Path(path).read_bytes())
     return raw.get("opportunities", []) or []
 
 
+def iter_opportunities(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Yield opportunity dicts from an ``opportunities.json`` file one at a time.
+
+    Streams with ijson when installed, like :func:`iter_messages`; otherwise
+    falls back to :func:`read_opportunities`.  ``.jsonl`` files are read
+    line by line.
+    """
+    if _is_jsonl(path):
+        yield from _iter_jsonl(path)
+        return
+    if ijson is None:
+        yield from read_opportunities(path)
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "opportunities.item", use_float=True)
+
+
 # Resume I/O
 
 def read_resume(path: str | Path) -> "Resume":
@@ -62,6 +221,20 @@ def read_resume(path: str | Path) -> "Resume":
     return parse_resume_file(path)
 
 
+def read_resume_name(path: str | Path) -> str:
+    """
+    Read just the candidate name from a resume file (JSON or Markdown).
+
+    Args:
+        path: Path to the resume file
+
+    Returns:
+        Candidate name, as ``read_resume(path).personal.name`` would give
+    """
+    from .matching.resume_parser import parse_resume_name
+    return parse_resume_name(path)
+
+
 def write_resume(path: str | Path, resume: "Resume") -> None:
     """
     Write a resume to a JSON file.
@@ -74,7 +247,7 @@ def write_resume(path: str | Path, resume: "Resume") -> None:
         "created_at_utc": _utc_now_iso(),
         "resume": resume.to_dict(),
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 # Match Result I/O
@@ -87,18 +260,25 @@ def write_match_results(
     """
     Write match results to a JSON file.
     
+    A path ending in ``.jsonl`` is written as JSON Lines instead: one
+    compact result per line and no header (``created_at_utc``,
+    ``resume_id``, ``count``), so readers can stream it without ijson.
+    
     Args:
         path: Output path
         results: List of MatchResult objects
         resume_id: Optional resume identifier
     """
+    if _is_jsonl(path):
+        _write_jsonl(Path(path), (r.to_dict() for r in results))
+        return
     payload = {
         "created_at_utc": _utc_now_iso(),
         "resume_id": resume_id,
         "count": len(results),
         "match_results": [r.to_dict() for r in results],
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 def read_match_results(path: str | Path) -> List["MatchResult"]:
@@ -111,13 +291,36 @@ def read_match_results(path: str | Path) -> List["MatchResult"]:
     Returns:
         List of MatchResult objects
     """
+    if _is_jsonl(path):
+        return list(iter_match_results(path))
     from .matching.models import MatchResult
     
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     results_data = raw.get("match_results", []) or []
     return [MatchResult.from_dict(r) for r in results_data]
 
 
+def iter_match_results(path: str | Path) -> Iterator["MatchResult"]:
+    """Yield :class:`MatchResult` objects from a match results file one at a time.
+
+    ``.jsonl`` files are read line by line.  Otherwise streams with ijson
+    when installed, like :func:`iter_opportunities`, and falls back to
+    :func:`read_match_results`.
+    """
+    from .matching.models import MatchResult
+
+    if _is_jsonl(path):
+        for r in _iter_jsonl(path):
+            yield MatchResult.from_dict(r)
+        return
+    if ijson is None:
+        yield from read_match_results(path)
+        return
+    with open(path, "rb") as f:
+        for r in ijson.items(f, "match_results.item", use_float=True):
+            yield MatchResult.from_dict(r)
+
+
 def write_single_match_result(path: str | Path, result: "MatchResult") -> None:
     """
     Write a single match result to a JSON file.
@@ -130,7 +333,7 @@ def write_single_match_result(path: str | Path, result: "MatchResult") -> None:
         "created_at_utc": _utc_now_iso(),
         **result.to_dict(),
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 # Job Analysis I/O
@@ -151,7 +354,7 @@ def write_job_analyses(
         "count": len(analyses),
         "analyses": analyses,
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 def read_job_analyses(path: str | Path) -> List[Dict[str, Any]]:
@@ -164,10 +367,23 @@ def read_job_analyses(path: str | Path) -> List[Dict[str, Any]]:
     Returns:
         List of job analysis dictionaries
     """
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     return raw.get("analyses", []) or []
 
 
+def iter_job_analyses(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Yield job analysis dicts one at a time.
+
+    Streams with ijson when installed, like :func:`iter_opportunities`;
+    otherwise falls back to :func:`read_job_analyses`.
+    """
+    if ijson is None:
+        yield from read_job_analyses(path)
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "analyses.item", use_float=True)
+
+
 # Tailoring I/O
 
 def write_tailoring_report(
@@ -185,7 +401,18 @@ def write_tailoring_report(
         "created_at_utc": _utc_now_iso(),
         **report_data,
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
+
+
+def write_tailored_resume(path: str | Path, resume_data: Dict[str, Any]) -> None:
+    """
+    Write a tailored resume (the raw resume dict, no envelope) to a JSON file.
+
+    Args:
+        path: Output path
+        resume_data: Tailored resume dict (``TailoredResume.resume_data``)
+    """
+    _write_bytes(Path(path), _dumps_json(resume_data))
 
 
 def write_tailoring_results(
@@ -204,7 +431,7 @@ def write_tailoring_results(
         "count": len(results),
         "tailoring_results": results,
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 # =========================================================================
@@ -222,7 +449,7 @@ def read_questionnaire(path: str | Path) -> "QuestionnaireConfig":
     """
     from .reply.models import QuestionnaireConfig
 
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     return QuestionnaireConfig.from_dict(raw)
 
 
@@ -233,10 +460,7 @@ def write_questionnaire(path: str | Path, config: "QuestionnaireConfig") -> None
         path: Output path.
         config: QuestionnaireConfig to serialise.
     """
-    Path(path).write_text(
-        json.dumps(config.to_dict(), indent=2),
-        encoding="utf-8",
-    )
+    _write_bytes(Path(path), _dumps_json(config.to_dict()))
 
 
 def write_drafts(path: str | Path, drafts: List["EmailDraft"]) -> None:
@@ -251,7 +475,7 @@ def write_drafts(path: str | Path, drafts: List["EmailDraft"]) -> None:
         "count": len(drafts),
         "drafts": [d.to_dict() for d in drafts],
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 def read_drafts(path: str | Path) -> List["EmailDraft"]:
@@ -265,7 +489,7 @@ def read_drafts(path: str | Path) -> List["EmailDraft"]:
     """
     from .reply.models import EmailDraft
 
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     drafts_data = raw.get("drafts", []) or []
     return [EmailDraft.from_dict(d) for d in drafts_data]
 
@@ -285,7 +509,7 @@ def write_reply_results(
         "count": len(results),
         "reply_results": [r.to_dict() for r in results],
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 def read_reply_results(path: str | Path) -> List["ReplyResult"]:
@@ -299,7 +523,7 @@ def read_reply_results(path: str | Path) -> List["ReplyResult"]:
     """
     from .reply.models import ReplyResult
 
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     results_data = raw.get("reply_results", []) or []
     return [ReplyResult.from_dict(r) for r in results_data]
 
@@ -330,7 +554,7 @@ def write_correlation(
         "summary": summary_dict,
         "correlated_opportunities": items,
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes(Path(path), _dumps_json(payload))
 
 
 def read_correlation(path: str | Path) -> Tuple[List[Any], Any]:
@@ -344,7 +568,7 @@ def read_correlation(path: str | Path) -> Tuple[List[Any], Any]:
     """
     from .correlation.models import CorrelatedOpportunity, CorrelationSummary
 
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     items_data = raw.get("correlated_opportunities", []) or []
     summary_data = raw.get("summary", {}) or {}
 
@@ -362,7 +586,7 @@ def read_tailoring_results(path: str | Path) -> List[Dict[str, Any]]:
     Returns:
         List of tailoring result dicts.
     """
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     return raw.get("tailoring_results", []) or []
 
 
@@ -377,6 +601,9 @@ def write_tracking(
 ) -> None:
     """Write application tracking data to a JSON file.
 
+    The file is replaced atomically, so a crashed write never leaves a
+    truncated snapshot behind for the next ``track-update`` to read.
+
     Args:
         path: Output path.
         applications: List of TrackedApplication objects (or dicts).
@@ -392,24 +619,142 @@ def write_tracking(
         "summary": summary_dict,
         "tracked_applications": items,
     }
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_bytes_atomic(Path(path), _dumps_json(payload))
 
 
-def read_tracking(path: str | Path) -> Tuple[List[Any], Any]:
+def read_tracking(
+    path: str | Path,
+    replay_journal: bool = True,
+) -> Tuple[List[Any], Any]:
     """Read application tracking data from a JSON file.
 
+    Updates journalled by ``track-update`` in the sibling
+    :func:`tracking_events_path` journal are replayed on top of the snapshot unless
+    *replay_journal* is false; the summary is then rebuilt from the
+    replayed applications.  Only events whose ``seq`` is above the
+    snapshot's ``summary.journal_seq`` are replayed, and the returned
+    summary carries the highest ``seq`` applied, so writing it back and
+    then clearing the journal is safe to interrupt.
+
     Args:
         path: Path to the tracking JSON file.
+        replay_journal: Whether to apply pending journalled events.
 
     Returns:
         Tuple of (list of TrackedApplication, TrackingSummary).
     """
+    applications, summary, _ = _read_tracking(path, replay_journal)
+    return applications, summary
+
+
+def read_tracking_replayed(path: str | Path) -> Tuple[List[Any], Any, int]:
+    """Like :func:`read_tracking`, also returning how many journalled
+    events were replayed (the pending count behind ``track-update``'s
+    compaction threshold) without reading the journal a second time.
+    """
+    return _read_tracking(path, True)
+
+
+def _read_tracking(
+    path: str | Path,
+    replay_journal: bool,
+) -> Tuple[List[Any], Any, int]:
     from .tracking.models import TrackedApplication, TrackingSummary
 
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = _loads_json(Path(path).read_bytes())
     items_data = raw.get("tracked_applications", []) or []
     summary_data = raw.get("summary", {}) or {}
 
     applications = [TrackedApplication.from_dict(d) for d in items_data]
     summary = TrackingSummary.from_dict(summary_data)
-    return applications, summary
+
+    events = read_tracking_events(tracking_events_path(path)) if replay_journal else []
+    # Events at or below the snapshot's watermark were already folded in
+    # (a crash between write_tracking and clear_tracking_events)
+    watermark = summary.journal_seq
+    pending = [
+        e for e in events
+        if not isinstance(e.get("seq"), int) or e["seq"] > watermark
+    ]
+    if pending:
+        from .tracking.tracker import ApplicationTracker
+
+        tracker = ApplicationTracker()
+        tracker.load_existing(applications)
+        tracker.replay_events(pending)
+        applications = tracker.get_all()
+        render_hash = pending[-1].get("render_hash", summary.render_hash)
+        summary = tracker.build_summary(applications)
+        summary.render_hash = render_hash
+        summary.journal_seq = max(
+            [watermark] + [e["seq"] for e in pending if isinstance(e.get("seq"), int)]
+        )
+
+    return applications, summary, len(pending)
+
+
+def tracking_events_path(tracking_path: str | Path) -> Path:
+    """Return the event-journal sidecar path for a tracking file.
+
+    Named after the tracking file (``tracking.json`` ->
+    ``tracking.events.jsonl``) so two tracking files in one directory
+    never share a journal.
+    """
+    path = Path(tracking_path)
+    return path.with_name(path.stem + ".events.jsonl")
+
+
+def append_tracking_event(path: str | Path, event: Dict[str, Any]) -> None:
+    """Durably append one ``track-update`` event to a JSONL journal.
+
+    The line is written unbuffered and fsync'd so a crash never leaves a
+    half-applied update behind.  A torn final line left by an earlier
+    interrupted append is cut off first, so the new event starts on a
+    line of its own.
+
+    Args:
+        path: Path to the ``*.events.jsonl`` journal.
+        event: Event dict (``ts``, ``job_id``, ``action``, ``payload``).
+    """
+    line = _dumps_json(event, indent=False) + b"\n"
+    with open(path, "a+b", buffering=0) as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                f.seek(0)
+                f.truncate(f.read().rfind(b"\n") + 1)
+        f.write(line)
+        os.fsync(f.fileno())
+
+
+def read_tracking_events(path: str | Path) -> List[Dict[str, Any]]:
+    """Read journalled ``track-update`` events, oldest first.
+
+    Returns an empty list when the journal does not exist.  Lines that
+    cannot be decoded (an interrupted write) are skipped with a warning.
+
+    Args:
+        path: Path to the ``*.events.jsonl`` journal.
+
+    Returns:
+        List of event dicts.
+    """
+    journal = Path(path)
+    if not journal.exists():
+        return []
+    events: List[Dict[str, Any]] = []
+    for lineno, line in enumerate(journal.read_bytes().splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            events.append(_loads_json(line))
+        except json.JSONDecodeError:
+            logger.warning("Skipping undecodable line %d in %s", lineno, journal)
+    return events
+
+
+def clear_tracking_events(path: str | Path) -> None:
+    """Remove a tracking event journal once it has been folded into
+    ``tracking.json``."""
+    Path(path).unlink(missing_ok=True)
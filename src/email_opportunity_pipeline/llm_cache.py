@@ -0,0 +1,63 @@
+"""On-disk cache for LLM responses.
+
+Responses are stored as one JSON file per request, named by a BLAKE2b hash
+of everything that determines the model's input (model name, prompts and
+output schema).  Re-running ``analyze`` or ``match`` on unchanged inputs
+then reads the previous answers instead of calling the API again; editing
+a job, the resume, or a prompt changes the key and misses naturally.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def default_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/email_opportunity_pipeline/llm`` (or ``~/.cache/...``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "email_opportunity_pipeline" / "llm"
+
+
+class ResponseCache:
+    """Content-addressed store of parsed LLM responses.
+
+    Safe to share between threads: each entry is written to a temporary
+    file and renamed into place, so readers never see a partial file.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Hash *parts* (JSON-serializable) into a cache key."""
+        material = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for *key*, or ``None`` on a miss."""
+        try:
+            data = (self.directory / f"{key}.json").read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store *value* under *key*, replacing any previous entry."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp, self.directory / f"{key}.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
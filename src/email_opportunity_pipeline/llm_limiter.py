@@ -0,0 +1,109 @@
+"""Adaptive rate limiting for concurrent LLM requests.
+
+``--workers N`` starts N threads, but a provider that is throttling will
+answer some of them with HTTP 429.  :class:`AdaptiveLimiter` sits between
+those threads and the API: it halves the number of requests allowed in
+flight when one is rate-limited (retrying it after a back-off) and grows
+the allowance back by one per round of successes, up to N.  An optional
+requests-per-minute budget is enforced with a token bucket so a known
+quota is never exceeded in the first place.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for an HTTP 429 from the OpenAI client (``openai.RateLimitError``)."""
+    return getattr(exc, "status_code", None) == 429
+
+
+class AdaptiveLimiter:
+    """AIMD cap on in-flight requests plus an optional token bucket.
+
+    Args:
+        maximum: Upper bound on requests in flight (the worker count).
+        minimum: Lower bound the cap is never halved below.
+        rpm: Optional requests-per-minute budget.  The bucket holds five
+            seconds' worth of requests so a burst can start immediately.
+        retries: How many times a rate-limited request is retried before
+            the error is raised.
+        backoff: Seconds to wait after the first 429; doubles per retry.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        rpm: Optional[float] = None,
+        retries: int = 5,
+        backoff: float = 1.0,
+    ) -> None:
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = self.maximum
+        self.retries = retries
+        self.backoff = backoff
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+        self._rate = rpm / 60.0 if rpm else None
+        self._capacity = max(1.0, self._rate * 5) if self._rate else 0.0
+        self._tokens = self._capacity
+        self._refilled = time.monotonic()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` within the current limits."""
+        attempt = 0
+        while True:
+            self._acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                throttled = is_rate_limit_error(exc)
+                self._release(throttled=throttled)
+                if not throttled or attempt >= self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                attempt += 1
+            else:
+                self._release(throttled=False)
+                return result
+
+    def _acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            wait = self._take_token()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _take_token(self) -> float:
+        """Reserve one request from the bucket; return how long to wait for it."""
+        if self._rate is None:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._refilled) * self._rate)
+        self._refilled = now
+        self._tokens -= 1
+        return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+    def _release(self, throttled: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
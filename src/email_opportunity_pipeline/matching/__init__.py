@@ -15,7 +15,7 @@ from .models import (
     ApplicationStrategy,
     CategoryScore,
 )
-from .resume_parser import ResumeParser, parse_resume_file
+from .resume_parser import ResumeParser, parse_resume_file, parse_resume_name
 from .analyzer import JobAnalyzer, analyze_job
 from .matcher import ResumeMatcher, match_resume_to_job
 from .report import render_match_markdown, render_match_summary
@@ -33,6 +33,7 @@ __all__ = [
     # Resume parsing
     "ResumeParser",
     "parse_resume_file",
+    "parse_resume_name",
     # Analysis
     "JobAnalyzer",
     "analyze_job",
@@ -4,8 +4,12 @@ Job Analyzer - Extracts and structures job requirements for matching.
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+from ..llm_cache import ResponseCache
+from ..llm_limiter import AdaptiveLimiter
+
 
 # Schema name for OpenAI API
 JOB_ANALYSIS_SCHEMA_NAME = "job_analysis"
@@ -120,6 +124,19 @@ JOB_ANALYSIS_SCHEMA = {
     ],
 }
 
+# Schema for several analyses returned by one request (see analyze_pack).
+# Structured outputs need an object at the root, so the array is wrapped.
+JOB_ANALYSIS_PACK_SCHEMA_NAME = "job_analysis_pack"
+
+JOB_ANALYSIS_PACK_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "analyses": {"type": "array", "items": JOB_ANALYSIS_SCHEMA},
+    },
+    "required": ["analyses"],
+}
+
 
 ANALYZER_SYSTEM_PROMPT = """You are an expert job analyst. Analyze job opportunities and extract structured information.
 
@@ -148,7 +165,13 @@ class JobAnalyzer:
     Analyzes job opportunities using LLM to extract structured requirements.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ) -> None:
         try:
             from openai import OpenAI
         except ImportError as exc:
@@ -156,6 +179,14 @@ class JobAnalyzer:
 
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.cache = cache
+        self.limiter = limiter
+
+    def _create_response(self, **request: Any) -> Any:
+        """Call the Responses API, through the rate limiter when one is set."""
+        if self.limiter is None:
+            return self.client.responses.create(**request)
+        return self.limiter.call(self.client.responses.create, **request)
 
     def analyze(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -167,36 +198,128 @@ class JobAnalyzer:
         Returns:
             Structured job analysis dictionary
         """
-        # Build context from job data
-        job_context = self._build_job_context(job)
+        user_prompt = self._build_user_prompt(job)
         
-        response = self.client.responses.create(
-            model=self.model,
-            input=[
-                {"role": "system", "content": ANALYZER_SYSTEM_PROMPT},
-                {"role": "user", "content": f"Analyze this job opportunity:\n\n{job_context}"},
-            ],
-            text={
-                "format": {
-                    "type": "json_schema",
-                    "name": JOB_ANALYSIS_SCHEMA_NAME,
-                    "schema": JOB_ANALYSIS_SCHEMA,
-                }
-            },
-        )
+        cache_key = None
+        analysis = None
+        if self.cache is not None:
+            cache_key = self._cache_key(user_prompt)
+            analysis = self.cache.get(cache_key)
         
-        try:
-            analysis = json.loads(response.output_text)
-        except json.JSONDecodeError:
-            analysis = self._create_fallback_analysis(job)
+        if analysis is None:
+            response = self._create_response(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": ANALYZER_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                text={
+                    "format": {
+                        "type": "json_schema",
+                        "name": JOB_ANALYSIS_SCHEMA_NAME,
+                        "schema": JOB_ANALYSIS_SCHEMA,
+                    }
+                },
+            )
+            
+            try:
+                analysis = json.loads(response.output_text)
+            except json.JSONDecodeError:
+                analysis = self._create_fallback_analysis(job)
+            else:
+                if cache_key is not None:
+                    self.cache.put(cache_key, analysis)
+        
+        return self._attach_source(analysis, job)
+
+    def analyze_pack(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several job opportunities with a single LLM request.
         
-        # Merge with original job data
+        The system prompt is sent once for the whole pack instead of once
+        per job.  Jobs already in the cache are not sent at all, and each
+        packed answer is cached under the same key :meth:`analyze` uses, so
+        either path reuses the other's results.  If the reply cannot be
+        parsed or has the wrong number of analyses, the uncached jobs are
+        analyzed one at a time instead.
+        
+        Args:
+            jobs: List of job opportunity dictionaries
+            
+        Returns:
+            List of job analysis dictionaries, in the order of ``jobs``
+        """
+        prompts = [self._build_user_prompt(job) for job in jobs]
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        if self.cache is not None:
+            for i, prompt in enumerate(prompts):
+                analyses[i] = self.cache.get(self._cache_key(prompt))
+        
+        pending = [i for i, analysis in enumerate(analyses) if analysis is None]
+        if len(pending) == 1:
+            analyses[pending[0]] = self.analyze(jobs[pending[0]])
+            pending = []
+        
+        if pending:
+            sections = "\n\n".join(
+                f"### Job {n}\n\n{self._build_job_context(jobs[i])}"
+                for n, i in enumerate(pending, 1)
+            )
+            response = self._create_response(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": ANALYZER_SYSTEM_PROMPT},
+                    {
+                        "role": "user",
+                        "content": (
+                            f"Analyze each of these {len(pending)} job opportunities. "
+                            f"Return exactly one analysis per job, in the same order.\n\n"
+                            f"{sections}"
+                        ),
+                    },
+                ],
+                text={
+                    "format": {
+                        "type": "json_schema",
+                        "name": JOB_ANALYSIS_PACK_SCHEMA_NAME,
+                        "schema": JOB_ANALYSIS_PACK_SCHEMA,
+                    }
+                },
+            )
+            
+            try:
+                packed = json.loads(response.output_text).get("analyses")
+            except (json.JSONDecodeError, AttributeError):
+                packed = None
+            
+            if isinstance(packed, list) and len(packed) == len(pending):
+                for i, analysis in zip(pending, packed):
+                    if self.cache is not None:
+                        self.cache.put(self._cache_key(prompts[i]), analysis)
+                    analyses[i] = analysis
+            else:
+                for i in pending:
+                    analyses[i] = self.analyze(jobs[i])
+        
+        return [self._attach_source(analysis, job) for analysis, job in zip(analyses, jobs)]
+
+    def _build_user_prompt(self, job: Dict[str, Any]) -> str:
+        """Build the single-job user prompt (also the basis of its cache key)."""
+        return f"Analyze this job opportunity:\n\n{self._build_job_context(job)}"
+
+    def _cache_key(self, user_prompt: str) -> str:
+        return self.cache.key(
+            self.model, ANALYZER_SYSTEM_PROMPT, user_prompt, JOB_ANALYSIS_SCHEMA
+        )
+
+    @staticmethod
+    def _attach_source(analysis: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge identifying fields of the original job into *analysis*."""
         analysis["source_job"] = {
             "message_id": job.get("source_email", {}).get("message_id"),
             "job_title": job.get("job_title"),
             "company": job.get("company"),
         }
-        
         return analysis
 
     def _build_job_context(self, job: Dict[str, Any]) -> str:
@@ -300,16 +423,31 @@ class JobAnalyzer:
             },
         }
 
-    def analyze_batch(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def analyze_batch(
+        self, jobs: List[Dict[str, Any]], workers: int = 1, pack_size: int = 1
+    ) -> List[Dict[str, Any]]:
         """
         Analyze multiple job opportunities.
         
         Args:
             jobs: List of job opportunity dictionaries
+            workers: Number of LLM requests to keep in flight at once
+            pack_size: Jobs per LLM request (see :meth:`analyze_pack`)
             
         Returns:
-            List of job analysis dictionaries
+            List of job analysis dictionaries, in the order of ``jobs``
         """
+        if pack_size > 1:
+            packs = [jobs[i:i + pack_size] for i in range(0, len(jobs), pack_size)]
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(self.analyze_pack, packs))
+            else:
+                results = [self.analyze_pack(pack) for pack in packs]
+            return [analysis for pack in results for analysis in pack]
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(self.analyze, jobs))
         return [self.analyze(job) for job in jobs]
 
 
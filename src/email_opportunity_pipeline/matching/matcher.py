@@ -5,8 +5,11 @@ from __future__ import annotations
 
 import json
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
+from ..llm_cache import ResponseCache
+from ..llm_limiter import AdaptiveLimiter
 from .models import (
     Resume,
     MatchResult,
@@ -231,7 +234,13 @@ class ResumeMatcher:
     Matches resumes against job opportunities using LLM analysis.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ) -> None:
         try:
             from openai import OpenAI
         except ImportError as exc:
@@ -239,12 +248,21 @@ class ResumeMatcher:
 
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.cache = cache
+        self.limiter = limiter
+
+    def _create_response(self, **request: Any) -> Any:
+        """Call the Responses API, through the rate limiter when one is set."""
+        if self.limiter is None:
+            return self.client.responses.create(**request)
+        return self.limiter.call(self.client.responses.create, **request)
 
     def match(
         self,
         resume: Resume,
         job: Dict[str, Any],
         job_analysis: Optional[Dict[str, Any]] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> MatchResult:
         """
         Match a resume against a job opportunity.
@@ -253,6 +271,9 @@ class ResumeMatcher:
             resume: Resume object
             job: Job opportunity dictionary
             job_analysis: Optional pre-computed job analysis
+            on_delta: If given, the response is streamed and this is called
+                with each chunk of output text as it arrives (not called on
+                a cache hit)
             
         Returns:
             MatchResult with scores and insights
@@ -262,27 +283,43 @@ class ResumeMatcher:
         # Build context for the LLM
         context = self._build_match_context(resume, job, job_analysis)
         
-        response = self.client.responses.create(
-            model=self.model,
-            input=[
-                {"role": "system", "content": MATCHER_SYSTEM_PROMPT},
-                {"role": "user", "content": context},
-            ],
-            text={
-                "format": {
-                    "type": "json_schema",
-                    "name": MATCH_ANALYSIS_SCHEMA_NAME,
-                    "schema": MATCH_ANALYSIS_SCHEMA,
-                }
-            },
-        )
+        cache_key = None
+        analysis = None
+        if self.cache is not None:
+            cache_key = self.cache.key(
+                self.model, MATCHER_SYSTEM_PROMPT, context, MATCH_ANALYSIS_SCHEMA
+            )
+            analysis = self.cache.get(cache_key)
         
-        processing_time = (time.time() - start_time) * 1000
+        if analysis is None:
+            request = dict(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": MATCHER_SYSTEM_PROMPT},
+                    {"role": "user", "content": context},
+                ],
+                text={
+                    "format": {
+                        "type": "json_schema",
+                        "name": MATCH_ANALYSIS_SCHEMA_NAME,
+                        "schema": MATCH_ANALYSIS_SCHEMA,
+                    }
+                },
+            )
+            if on_delta is None:
+                output_text = self._create_response(**request).output_text
+            else:
+                output_text = self._stream_output_text(request, on_delta)
+            
+            try:
+                analysis = json.loads(output_text)
+            except json.JSONDecodeError:
+                analysis = self._create_fallback_analysis()
+            else:
+                if cache_key is not None:
+                    self.cache.put(cache_key, analysis)
         
-        try:
-            analysis = json.loads(response.output_text)
-        except json.JSONDecodeError:
-            analysis = self._create_fallback_analysis()
+        processing_time = (time.time() - start_time) * 1000
         
         return self._build_match_result(
             analysis=analysis,
@@ -291,6 +328,17 @@ class ResumeMatcher:
             processing_time=processing_time,
         )
 
+    def _stream_output_text(
+        self, request: Dict[str, Any], on_delta: Callable[[str], None]
+    ) -> str:
+        """Send *request* with streaming on, forwarding text deltas to *on_delta*."""
+        chunks: List[str] = []
+        for event in self._create_response(stream=True, **request):
+            if event.type == "response.output_text.delta":
+                chunks.append(event.delta)
+                on_delta(event.delta)
+        return "".join(chunks)
+
     def _build_match_context(
         self,
         resume: Resume,
@@ -577,6 +625,7 @@ class ResumeMatcher:
         resume: Resume,
         jobs: List[Dict[str, Any]],
         job_analyses: Optional[List[Dict[str, Any]]] = None,
+        workers: int = 1,
     ) -> List[MatchResult]:
         """
         Match a resume against multiple job opportunities.
@@ -585,16 +634,22 @@ class ResumeMatcher:
             resume: Resume object
             jobs: List of job opportunity dictionaries
             job_analyses: Optional pre-computed job analyses
+            workers: Number of LLM requests to keep in flight at once
             
         Returns:
             List of MatchResults sorted by overall_score descending
         """
-        results = []
         analyses = job_analyses or [None] * len(jobs)
         
-        for job, analysis in zip(jobs, analyses):
-            result = self.match(resume, job, analysis)
-            results.append(result)
+        def _match(pair) -> MatchResult:
+            job, analysis = pair
+            return self.match(resume, job, analysis)
+        
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_match, zip(jobs, analyses)))
+        else:
+            results = [_match(pair) for pair in zip(jobs, analyses)]
         
         # Sort by score descending
         results.sort(key=lambda r: r.overall_score, reverse=True)
@@ -401,3 +401,45 @@ def parse_resume_file(file_path: str | Path) -> Resume:
     """
     parser = ResumeParser()
     return parser.parse(file_path)
+
+
+def parse_resume_name(file_path: str | Path) -> str:
+    """
+    Read only the candidate name from a resume file.
+
+    Cheaper than :func:`parse_resume_file` when nothing else is needed: JSON
+    is decoded without building a Resume, and Markdown is only scanned for
+    its ``# Name`` heading.  Returns the same name a full parse would.
+
+    Args:
+        file_path: Path to the resume file (.json or .md)
+
+    Returns:
+        The candidate name
+
+    Raises:
+        ValueError: If file format is not supported or the JSON is invalid
+        FileNotFoundError: If file does not exist
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Resume file not found: {path}")
+
+    content = path.read_text(encoding="utf-8")
+    suffix = path.suffix.lower()
+
+    if suffix == ".json":
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in resume file: {e}")
+        return (data.get("personal", {}) or {}).get("name", "")
+    elif suffix in (".md", ".markdown"):
+        name = "Unknown"
+        for line in content.split("\n"):
+            stripped = line.strip()
+            if stripped.startswith("# "):
+                name = stripped[2:].strip()
+        return name
+    else:
+        raise ValueError(f"Unsupported file format: {suffix}")
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from .analytics import PipelineAnalytics, save_analytics, save_report
 from .filters import FilterPipeline, KeywordFilter, LLMFilter, FilterRules, load_rules
-from .io import write_messages, write_opportunities
+from .io import write_markdown, write_messages, write_opportunities
+from .llm_cache import ResponseCache
 from .models import EmailMessage, FilterOutcome
 from .extraction import RuleBasedExtractor, LLMExtractor, render_markdown
 
 
+T = TypeVar("T")
+
+
+class _PrefetchEnd:
+    """Queue marker for the end of a prefetched stream (and its error)."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Optional[BaseException] = None) -> None:
+        self.error = error
+
+
 @dataclass
 class PipelineOutputs:
     messages_path: Path
@@ -25,14 +41,64 @@ def build_filter_pipeline(
     rules_path: Optional[str] = None,
     use_llm: bool = False,
     llm_model: str = "gpt-4o-mini",
+    cache: Optional[ResponseCache] = None,
 ) -> FilterPipeline:
     rules = load_rules(rules_path) if rules_path else FilterRules.default()
     filters = [KeywordFilter(rules=rules)]
     if use_llm:
-        filters.append(LLMFilter(model=llm_model))
+        filters.append(LLMFilter(model=llm_model, cache=cache))
     return FilterPipeline(filters=filters)
 
 
+def prefetch(items: Iterable[T], maxsize: int = 128) -> Iterator[T]:
+    """Iterate *items* on a background thread, at most *maxsize* ahead.
+
+    Lets a network-bound producer (e.g. a provider's ``fetch_messages``)
+    keep downloading while the consumer processes what has arrived.  An
+    exception raised by the producer is re-raised in the consumer.  If the
+    consumer stops early (an error, or the generator is closed) the
+    producer stops too and closes *items*.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in items:
+                if not _put(item):
+                    break
+        except BaseException as exc:
+            _put(_PrefetchEnd(exc))
+        else:
+            _put(_PrefetchEnd())
+        finally:
+            if stop.is_set():
+                close = getattr(items, "close", None)
+                if close is not None:
+                    close()
+
+    threading.Thread(target=_produce, daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, _PrefetchEnd):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
 def filter_messages(
     pipeline: FilterPipeline, messages: Iterable[EmailMessage]
 ) -> List[EmailMessage]:
@@ -52,8 +118,32 @@ def extract_opportunities(
     messages: Iterable[EmailMessage],
     use_llm: bool = False,
     llm_model: str = "gpt-4o-mini",
+    workers: int = 1,
+    cache: Optional[ResponseCache] = None,
+    pack_size: int = 1,
 ) -> List[dict]:
-    extractor = LLMExtractor(model=llm_model) if use_llm else RuleBasedExtractor()
+    """Extract one opportunity dict per message, in input order.
+
+    With ``use_llm`` and ``workers > 1`` the API calls are issued from a
+    thread pool so their network latency overlaps; ``pack_size > 1`` sends
+    that many messages per call (see :meth:`LLMExtractor.extract_pack`).
+    Rule-based extraction stays serial: it is cheap enough that shipping
+    messages to worker processes costs more than it saves.  A *cache*
+    serves repeated LLM extractions of the same message from disk.
+    """
+    extractor = LLMExtractor(model=llm_model, cache=cache) if use_llm else RuleBasedExtractor()
+    if use_llm and pack_size > 1:
+        messages = list(messages)
+        packs = [messages[i:i + pack_size] for i in range(0, len(messages), pack_size)]
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(extractor.extract_pack, packs))
+        else:
+            results = [extractor.extract_pack(pack) for pack in packs]
+        return [opp for pack in results for opp in pack]
+    if use_llm and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(extractor.extract, messages))
     return [extractor.extract(msg) for msg in messages]
 
 
@@ -63,7 +153,7 @@ def render_markdown_files(opportunities: List[dict], output_dir: Path) -> None:
         source = job.get("source_email", {}) or {}
         msg_id = source.get("message_id") or "unknown"
         markdown = render_markdown(job)
-        (output_dir / f"{msg_id}.md").write_text(markdown, encoding="utf-8")
+        write_markdown(output_dir / f"{msg_id}.md", markdown)
 
 
 def run_pipeline(
@@ -75,7 +165,16 @@ def run_pipeline(
     use_llm_extract: bool = False,
     llm_model: str = "gpt-4o-mini",
     enable_analytics: bool = True,
+    workers: int = 1,
+    cache: Optional[ResponseCache] = None,
 ) -> PipelineOutputs:
+    """Fetch-to-markdown in one pass over *messages*.
+
+    With ``use_llm_extract`` and ``workers > 1`` each message is submitted
+    for LLM extraction as soon as it passes the filter, so the API calls
+    overlap with fetching and filtering the rest of the stream.  *cache*
+    is shared by the LLM filter and extractor.
+    """
     work_dir.mkdir(parents=True, exist_ok=True)
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -91,33 +190,49 @@ def run_pipeline(
     if analytics:
         analytics.start()
 
-    # Convert to list if needed and record fetch metrics
-    messages_list = list(messages)
-    if analytics:
-        for msg in messages_list:
-            analytics.record_email_fetch(msg)
-    
-    write_messages(messages_path, messages_list)
-
-    # Filter with analytics tracking
-    pipeline = build_filter_pipeline(rules_path=rules_path, use_llm=use_llm_filter, llm_model=llm_model)
-    filter_results = filter_messages_with_outcomes(pipeline, messages_list)
-    
+    # Record fetch metrics and filter each message as it arrives, so a lazy
+    # (or prefetched) source overlaps with filtering
+    pipeline = build_filter_pipeline(
+        rules_path=rules_path, use_llm=use_llm_filter, llm_model=llm_model, cache=cache
+    )
+    pool = None
+    if use_llm_extract and workers > 1:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        extractor = LLMExtractor(model=llm_model, cache=cache)
+    messages_list = []
     filtered_messages = []
-    for email, outcome in filter_results:
-        if analytics:
-            analytics.record_filter_result(email, outcome)
-        if outcome.passed:
-            filtered_messages.append(email)
-    
-    write_messages(filtered_path, filtered_messages)
+    pending = []
+    try:
+        try:
+            for email in messages:
+                messages_list.append(email)
+                outcome = pipeline.apply(email)
+                if analytics:
+                    analytics.record_email_fetch(email)
+                    analytics.record_filter_result(email, outcome)
+                if outcome.passed:
+                    filtered_messages.append(email)
+                    if pool is not None:
+                        pending.append(pool.submit(extractor.extract, email))
+        finally:
+            # Keep everything fetched so far even when filtering fails part
+            # way (e.g. an --llm-filter API error), so a rerun need not refetch
+            write_messages(messages_path, messages_list)
+        write_messages(filtered_path, filtered_messages)
 
-    # Extract opportunities with analytics tracking
-    opportunities = extract_opportunities(
-        filtered_messages,
-        use_llm=use_llm_extract,
-        llm_model=llm_model,
-    )
+        # Extract opportunities with analytics tracking
+        if pool is not None:
+            opportunities = [future.result() for future in pending]
+        else:
+            opportunities = extract_opportunities(
+                filtered_messages,
+                use_llm=use_llm_extract,
+                llm_model=llm_model,
+                cache=cache,
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
     
     if analytics:
         for opp in opportunities:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -9,7 +9,7 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from ..config import DEFAULT_MAX_RESULTS, GMAIL_SCOPES
+from ..config import DEFAULT_MAX_RESULTS, GMAIL_BATCH_SIZE, GMAIL_SCOPES
 from ..models import Attachment, EmailHeaders, EmailMessage, EmailSource
 from ..time_window import TimeWindow, to_gmail_query
 from .base import EmailProvider
@@ -75,61 +75,90 @@ class GmailProvider(EmailProvider):
                 break
         return msg_ids
 
+    def _get_request(self, service, msg_id: str, fmt: str):
+        return (
+            service.users()
+            .messages()
+            .get(
+                userId=self.user_id,
+                id=msg_id,
+                format=fmt,
+                metadataHeaders=["From", "To", "Cc", "Bcc", "Date", "Subject", "Message-Id", "In-Reply-To", "References"],
+            )
+        )
+
+    def _get_messages(self, service, msg_ids: List[str], fmt: str) -> List[Dict[str, Any]]:
+        """Fetch *msg_ids* with one batch HTTP request, returned in input order.
+
+        A sub-request that fails inside the batch (typically a 429 when the
+        per-user quota is hit) is retried on its own with back-off.
+        """
+        responses: Dict[str, Dict[str, Any]] = {}
+        failed: List[str] = []
+
+        def _collect(request_id, response, exception) -> None:
+            if exception is not None:
+                failed.append(request_id)
+            else:
+                responses[request_id] = response
+
+        batch = service.new_batch_http_request(callback=_collect)
+        for msg_id in msg_ids:
+            batch.add(self._get_request(service, msg_id, fmt), request_id=msg_id)
+        batch.execute()
+
+        for msg_id in failed:
+            responses[msg_id] = self._get_request(service, msg_id, fmt).execute(num_retries=3)
+        return [responses[msg_id] for msg_id in msg_ids]
+
+    def _to_email(self, msg: Dict[str, Any], include_body: bool) -> EmailMessage:
+        headers = (msg.get("payload", {}) or {}).get("headers", []) or []
+        body_info = extract_body_text(msg) if include_body else {"text": "", "text_html": ""}
+        attachments = list_attachments(msg.get("payload", {}) or {}) if include_body else []
+
+        return EmailMessage(
+            message_id=msg.get("id", ""),
+            thread_id=msg.get("threadId", ""),
+            internal_date=parse_internal_date_ms(msg.get("internalDate")),
+            headers=EmailHeaders(
+                from_=get_header(headers, "From"),
+                to=get_header(headers, "To"),
+                cc=get_header(headers, "Cc"),
+                bcc=get_header(headers, "Bcc"),
+                date=get_header(headers, "Date"),
+                subject=get_header(headers, "Subject"),
+                message_id=get_header(headers, "Message-Id"),
+                in_reply_to=get_header(headers, "In-Reply-To"),
+                references=get_header(headers, "References"),
+            ),
+            snippet=msg.get("snippet", ""),
+            body_text=body_info.get("text", ""),
+            body_html=body_info.get("text_html", ""),
+            labels=msg.get("labelIds", []) or [],
+            attachments=[Attachment.from_dict(a) for a in attachments],
+            source=EmailSource(provider="gmail", user_id=self.user_id),
+        )
+
     def fetch_messages(
         self,
         window: TimeWindow,
         max_results: Optional[int] = None,
         query: Optional[str] = None,
         include_body: bool = True,
-    ) -> Iterable[EmailMessage]:
+    ) -> Iterator[EmailMessage]:
         service = self._build_service()
         search_query = query or to_gmail_query(window)
-        msg_ids = self._list_message_ids(service, search_query, max_results)
-
-        messages: List[EmailMessage] = []
-        for msg_id in msg_ids:
-            fmt = "full" if include_body else "metadata"
-            msg = (
-                service.users()
-                .messages()
-                .get(
-                    userId=self.user_id,
-                    id=msg_id,
-                    format=fmt,
-                    metadataHeaders=["From", "To", "Cc", "Bcc", "Date", "Subject", "Message-Id", "In-Reply-To", "References"],
-                )
-                .execute()
-            )
-
-            headers = (msg.get("payload", {}) or {}).get("headers", []) or []
-            body_info = extract_body_text(msg) if include_body else {"text": "", "text_html": ""}
-            attachments = list_attachments(msg.get("payload", {}) or {}) if include_body else []
-
-            email = EmailMessage(
-                message_id=msg.get("id", ""),
-                thread_id=msg.get("threadId", ""),
-                internal_date=parse_internal_date_ms(msg.get("internalDate")),
-                headers=EmailHeaders(
-                    from_=get_header(headers, "From"),
-                    to=get_header(headers, "To"),
-                    cc=get_header(headers, "Cc"),
-                    bcc=get_header(headers, "Bcc"),
-                    date=get_header(headers, "Date"),
-                    subject=get_header(headers, "Subject"),
-                    message_id=get_header(headers, "Message-Id"),
-                    in_reply_to=get_header(headers, "In-Reply-To"),
-                    references=get_header(headers, "References"),
-                ),
-                snippet=msg.get("snippet", ""),
-                body_text=body_info.get("text", ""),
-                body_html=body_info.get("text_html", ""),
-                labels=msg.get("labelIds", []) or [],
-                attachments=[Attachment.from_dict(a) for a in attachments],
-                source=EmailSource(provider="gmail", user_id=self.user_id),
-            )
-            messages.append(email)
-
-        return messages
+        # A mailbox that changes while it is being paged can list an id
+        # twice; a batch rejects duplicate request ids
+        msg_ids = list(dict.fromkeys(self._list_message_ids(service, search_query, max_results)))
+        fmt = "full" if include_body else "metadata"
+
+        # Fetch GMAIL_BATCH_SIZE messages per round trip instead of one, and
+        # yield each batch as it lands so callers can start processing
+        # while the remaining batches are still in flight.
+        for start in range(0, len(msg_ids), GMAIL_BATCH_SIZE):
+            for msg in self._get_messages(service, msg_ids[start:start + GMAIL_BATCH_SIZE], fmt):
+                yield self._to_email(msg, include_body)
 
 
 def build_gmail_provider() -> GmailProvider:
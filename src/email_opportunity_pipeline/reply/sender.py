@@ -167,6 +167,7 @@ class GmailSender:
         self.token_path = token_path or os.getenv(
             "GMAIL_TOKEN_PATH", "token.json"
         )
+        self._service = None
 
     # ------------------------------------------------------------------
     # Auth (mirrors GmailProvider but with send scope)
@@ -200,6 +201,17 @@ class GmailSender:
 
         return build("gmail", "v1", credentials=creds)
 
+    def _get_service(self):
+        """Return the Gmail service, authorising on first use only.
+
+        Loading the token and building the discovery client costs far more
+        than sending one message, so a batch reuses a single service (its
+        credentials refresh themselves when the access token expires).
+        """
+        if self._service is None:
+            self._service = self._build_service()
+        return self._service
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -260,7 +272,7 @@ class GmailSender:
 
         # Real send
         try:
-            service = self._build_service()
+            service = self._get_service()
             mime_msg = _build_mime_message(draft, from_address)
             raw = base64.urlsafe_b64encode(mime_msg.as_bytes()).decode("ascii")
 
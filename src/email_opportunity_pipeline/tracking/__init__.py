@@ -36,9 +36,11 @@ __all__ = [
     "StatusChange",
     "TrackedApplication",
     "TrackingSummary",
+    "iter_tracking_report",
     "render_application_card",
     "render_tracking_report",
     "render_tracking_summary",
+    "tracking_summary_digest",
 ]
 
 from .models import (
@@ -52,8 +54,10 @@ from .models import (
     TrackingSummary,
 )
 from .report import (
+    iter_tracking_report,
     render_application_card,
     render_tracking_report,
     render_tracking_summary,
+    tracking_summary_digest,
 )
 from .tracker import ApplicationTracker
@@ -315,6 +315,17 @@ class TrackingSummary:
     # Timestamp
     generated_at: Optional[str] = None
 
+    # Fingerprint of the inputs last rendered into tracking_summary.md
+    render_hash: Optional[str] = None
+
+    # ``seq`` of the last journalled event folded into this snapshot
+    journal_seq: int = 0
+
+    # First few active applications, collected while tallying (not serialized)
+    top_active: List[TrackedApplication] = field(
+        default_factory=list, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "total_tracked": self.total_tracked,
@@ -326,6 +337,8 @@ class TrackingSummary:
             "avg_match_score": round(self.avg_match_score, 1),
             "top_companies": self.top_companies,
             "generated_at": self.generated_at,
+            "render_hash": self.render_hash,
+            "journal_seq": self.journal_seq,
         }
 
     @classmethod
@@ -340,4 +353,6 @@ class TrackingSummary:
             avg_match_score=data.get("avg_match_score", 0.0),
             top_companies=data.get("top_companies", []),
             generated_at=data.get("generated_at"),
+            render_hash=data.get("render_hash"),
+            journal_seq=data.get("journal_seq", 0),
         )
@@ -6,7 +6,9 @@ application: status, interviews, offers, notes, and a full audit trail.
 """
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import json
+from typing import Iterator, List
 
 from .models import (
     ApplicationStatus,
@@ -284,19 +286,69 @@ def render_application_card(app: TrackedApplication) -> str:
 # Batch rendering
 # ---------------------------------------------------------------------------
 
+def iter_tracking_report(
+    summary: TrackingSummary,
+    applications: List[TrackedApplication],
+    include_cards: bool = False,
+) -> Iterator[str]:
+    """Yield the full tracking report in chunks (one per section or card).
+
+    Lets callers stream large reports straight to a file instead of holding
+    the whole document in memory; ``"".join()`` of the chunks equals
+    :func:`render_tracking_report`.
+    """
+    yield render_tracking_summary(summary, applications)
+
+    if include_cards and applications:
+        yield "\n\n---\n"
+        yield "\n# Detailed Application Cards\n"
+        for app in applications:
+            yield "\n"
+            yield render_application_card(app)
+            yield "\n\n---\n"
+
+
 def render_tracking_report(
     summary: TrackingSummary,
     applications: List[TrackedApplication],
     include_cards: bool = False,
 ) -> str:
     """Render the full tracking report: summary + optional detailed cards."""
-    parts = [render_tracking_summary(summary, applications)]
+    return "".join(iter_tracking_report(summary, applications, include_cards))
 
-    if include_cards and applications:
-        parts.append("\n---\n")
-        parts.append("# Detailed Application Cards\n")
-        for app in applications:
-            parts.append(render_application_card(app))
-            parts.append("\n---\n")
 
-    return "\n".join(parts)
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+def tracking_summary_digest(
+    summary: TrackingSummary,
+    applications: List[TrackedApplication],
+) -> str:
+    """Fingerprint everything :func:`render_tracking_summary` displays.
+
+    The ``generated_at`` timestamp is excluded so that two renders of the
+    same tracking state produce the same digest.  Callers compare it with
+    :attr:`TrackingSummary.render_hash` to skip re-rendering unchanged
+    summary reports.
+    """
+    summary_data = summary.to_dict()
+    summary_data.pop("generated_at", None)
+    summary_data.pop("render_hash", None)
+    summary_data.pop("journal_seq", None)
+
+    rows = [
+        (
+            app.company,
+            app.job_title,
+            app.status.value,
+            app.final_outcome.value if app.final_outcome else None,
+            app.match_score,
+            len(app.interviews),
+            app.last_updated_at[:10] if app.last_updated_at else None,
+        )
+        for app in applications
+    ]
+
+    payload = json.dumps([summary_data, rows], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
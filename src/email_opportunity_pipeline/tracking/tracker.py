@@ -9,7 +9,8 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from .models import (
     ApplicationStatus,
@@ -29,6 +30,10 @@ def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+#: Number of active applications kept in ``TrackingSummary.top_active``.
+TOP_ACTIVE_LIMIT = 5
+
+
 class ApplicationTracker:
     """Manage the post-reply lifecycle of job applications.
 
@@ -46,6 +51,8 @@ class ApplicationTracker:
 
     def __init__(self) -> None:
         self._applications: Dict[str, TrackedApplication] = {}
+        # status value -> {job_id: app}; maintained by every status mutation
+        self._by_status: Dict[str, Dict[str, TrackedApplication]] = defaultdict(dict)
 
     # ------------------------------------------------------------------
     # Data ingestion
@@ -53,9 +60,15 @@ class ApplicationTracker:
 
     def load_existing(self, applications: List[TrackedApplication]) -> None:
         """Load previously saved tracked applications."""
-        for app in applications:
-            if app.job_id:
-                self._applications[app.job_id] = app
+        loaded = {app.job_id: app for app in applications if app.job_id}
+        for job_id in loaded.keys() & self._applications.keys():
+            previous = self._applications[job_id]
+            self._by_status[previous.status.value].pop(job_id, None)
+
+        self._applications.update(loaded)
+        by_status = self._by_status
+        for job_id, app in loaded.items():
+            by_status[app.status.value][job_id] = app
 
     def init_from_correlation(
         self,
@@ -112,7 +125,7 @@ class ApplicationTracker:
                     ),
                 ],
             )
-            self._applications[c.job_id] = app
+            self._track(app)
             count += 1
 
         return count
@@ -126,10 +139,11 @@ class ApplicationTracker:
         job_id: str,
         new_status: ApplicationStatus,
         note: Optional[str] = None,
+        at: Optional[str] = None,
     ) -> TrackedApplication:
         """Transition an application to a new status with audit trail."""
         app = self._get_or_raise(job_id)
-        now = _utc_now()
+        now = at or _utc_now()
 
         app.status_history.append(
             StatusChange(
@@ -139,7 +153,9 @@ class ApplicationTracker:
                 note=note,
             )
         )
+        self._by_status[app.status.value].pop(job_id, None)
         app.status = new_status
+        self._by_status[new_status.value][job_id] = app
         app.last_updated_at = now
 
         if new_status == ApplicationStatus.CLOSED:
@@ -152,22 +168,24 @@ class ApplicationTracker:
         job_id: str,
         outcome: FinalOutcome,
         note: Optional[str] = None,
+        at: Optional[str] = None,
     ) -> TrackedApplication:
         """Set the final outcome and close the application."""
         app = self._get_or_raise(job_id)
         app.final_outcome = outcome
         status_note = note or f"Outcome: {outcome.value}"
-        self.update_status(job_id, ApplicationStatus.CLOSED, note=status_note)
+        self.update_status(job_id, ApplicationStatus.CLOSED, note=status_note, at=at)
         return app
 
     def add_interview(
         self,
         job_id: str,
         interview: InterviewRecord,
+        at: Optional[str] = None,
     ) -> TrackedApplication:
         """Record an interview.  Auto-promotes APPLIED to INTERVIEWING."""
         app = self._get_or_raise(job_id)
-        now = _utc_now()
+        now = at or _utc_now()
 
         if not interview.created_at:
             interview.created_at = now
@@ -182,6 +200,7 @@ class ApplicationTracker:
                 job_id,
                 ApplicationStatus.INTERVIEWING,
                 note=f"Interview added: {interview.interview_type.value}",
+                at=now,
             )
 
         return app
@@ -190,10 +209,11 @@ class ApplicationTracker:
         self,
         job_id: str,
         offer: OfferDetails,
+        at: Optional[str] = None,
     ) -> TrackedApplication:
         """Record an offer.  Auto-promotes to OFFERED."""
         app = self._get_or_raise(job_id)
-        now = _utc_now()
+        now = at or _utc_now()
 
         if not offer.received_at:
             offer.received_at = now
@@ -206,6 +226,7 @@ class ApplicationTracker:
                 job_id,
                 ApplicationStatus.OFFERED,
                 note="Offer received",
+                at=now,
             )
 
         return app
@@ -214,13 +235,64 @@ class ApplicationTracker:
         self,
         job_id: str,
         note: str,
+        at: Optional[str] = None,
     ) -> TrackedApplication:
         """Append a free-form note."""
         app = self._get_or_raise(job_id)
         app.notes.append(note)
-        app.last_updated_at = _utc_now()
+        app.last_updated_at = at or _utc_now()
         return app
 
+    # ------------------------------------------------------------------
+    # Event journal
+    # ------------------------------------------------------------------
+
+    def apply_event(self, event: Dict[str, Any]) -> TrackedApplication:
+        """Re-apply a journalled ``track-update`` event.
+
+        *event* is a dict with ``ts``, ``job_id``, ``action`` (one of
+        ``status``, ``outcome``, ``interview``, ``offer``, ``note``) and an
+        action-specific ``payload``.  The recorded ``ts`` is reused for every
+        timestamp so replaying a journal reproduces the original state.
+        """
+        job_id = event.get("job_id", "")
+        action = event.get("action")
+        payload = event.get("payload") or {}
+        at = event.get("ts")
+
+        if action == "status":
+            return self.update_status(
+                job_id, ApplicationStatus(payload["status"]),
+                note=payload.get("note"), at=at,
+            )
+        if action == "outcome":
+            return self.set_outcome(
+                job_id, FinalOutcome(payload["outcome"]),
+                note=payload.get("note"), at=at,
+            )
+        if action == "interview":
+            return self.add_interview(job_id, InterviewRecord.from_dict(payload), at=at)
+        if action == "offer":
+            return self.set_offer(job_id, OfferDetails.from_dict(payload), at=at)
+        if action == "note":
+            return self.add_note(job_id, payload.get("note", ""), at=at)
+        raise ValueError(f"Unknown tracking event action: {action!r}")
+
+    def replay_events(self, events: List[Dict[str, Any]]) -> int:
+        """Apply journalled events in order; returns the number applied.
+
+        Malformed events and events referring to applications that are no
+        longer tracked are skipped.
+        """
+        applied = 0
+        for event in events:
+            try:
+                self.apply_event(event)
+            except (KeyError, ValueError):
+                continue
+            applied += 1
+        return applied
+
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
@@ -238,13 +310,40 @@ class ApplicationTracker:
         )
         return apps
 
+    def get_by_statuses(self, statuses: Iterable[str]) -> List[TrackedApplication]:
+        """Return applications whose status value is in *statuses*.
+
+        Served from the status index, so the cost depends only on the number
+        of matching applications.  Ordered like :meth:`get_all`.
+        """
+        apps = list(chain.from_iterable(
+            self._by_status[s].values() for s in set(statuses) if s in self._by_status
+        ))
+        apps.sort(
+            key=lambda a: a.last_updated_at or "",
+            reverse=True,
+        )
+        return apps
+
     # ------------------------------------------------------------------
     # Summary
     # ------------------------------------------------------------------
 
-    def build_summary(self) -> TrackingSummary:
-        """Compute aggregate statistics across all tracked applications."""
-        apps = self.get_all()
+    def build_summary(
+        self,
+        applications: Optional[List[TrackedApplication]] = None,
+        display_statuses: Optional[Iterable[str]] = None,
+    ) -> TrackingSummary:
+        """Compute aggregate statistics across all tracked applications.
+
+        Pass the result of :meth:`get_all` as *applications* when it is
+        already at hand to avoid sorting the tracked set a second time.
+        The first :data:`TOP_ACTIVE_LIMIT` active applications are collected
+        into ``top_active`` in the same pass; *display_statuses* restricts
+        that list (not the counts) to the given status values.
+        """
+        apps = self.get_all() if applications is None else applications
+        shown = set(display_statuses) if display_statuses is not None else None
 
         status_counts: Dict[str, int] = defaultdict(int)
         outcome_counts: Dict[str, int] = defaultdict(int)
@@ -253,12 +352,17 @@ class ApplicationTracker:
         active = 0
         total_interviews = 0
         offers = 0
+        top_active: List[TrackedApplication] = []
 
         for app in apps:
             status_counts[app.status.value] += 1
 
             if app.is_active:
                 active += 1
+                if len(top_active) < TOP_ACTIVE_LIMIT and (
+                    shown is None or app.status.value in shown
+                ):
+                    top_active.append(app)
 
             if app.final_outcome:
                 outcome_counts[app.final_outcome.value] += 1
@@ -294,12 +398,21 @@ class ApplicationTracker:
             avg_match_score=avg_score,
             top_companies=top_companies,
             generated_at=_utc_now(),
+            top_active=top_active,
         )
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
+    def _track(self, app: TrackedApplication) -> None:
+        """Register *app*, replacing any application with the same job_id."""
+        previous = self._applications.get(app.job_id)
+        if previous is not None:
+            self._by_status[previous.status.value].pop(app.job_id, None)
+        self._applications[app.job_id] = app
+        self._by_status[app.status.value][app.job_id] = app
+
     def _get_or_raise(self, job_id: str) -> TrackedApplication:
         app = self._applications.get(job_id)
         if app is None:
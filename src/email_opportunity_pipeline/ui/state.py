@@ -3,8 +3,18 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+# Directory listings reused by discover_artifacts() while the directory's
+# mtime is unchanged: path -> (st_mtime_ns, entry names)
+_LISTINGS: Dict[Path, Tuple[int, FrozenSet[str]]] = {}
+
+# Listings of directories modified more recently than this are not cached,
+# since a file created within the same timestamp tick would go unnoticed.
+_LISTING_SETTLE_NS = 2_000_000_000
 
 
 def _read_json(path: Path) -> Any:
@@ -76,10 +86,20 @@ def load_correlation(path: Path) -> Dict[str, Any]:
 
 
 def load_tracking(path: Path) -> Dict[str, Any]:
-    """Load application tracking data."""
+    """Load application tracking data, including journalled updates."""
     data = _read_json(path)
     if data is None:
         return {}
+    from ..io import read_tracking, tracking_events_path
+
+    if tracking_events_path(path).exists():
+        applications, summary = read_tracking(path)
+        data = {
+            **data,
+            "count": len(applications),
+            "summary": summary.to_dict(),
+            "tracked_applications": [a.to_dict() for a in applications],
+        }
     return data
 
 
@@ -109,4 +129,34 @@ def discover_artifacts(work_dir: Path, out_dir: Path) -> Dict[str, Path]:
         "tracking": out_dir / "tracking" / "tracking.json",
         "tracking_summary": out_dir / "tracking" / "tracking_summary.md",
     }
-    return {name: path for name, path in candidates.items() if path.exists()}
+    return {
+        name: path for name, path in candidates.items()
+        if path.name in _listing(path.parent)
+    }
+
+
+def _listing(directory: Path) -> FrozenSet[str]:
+    """Return the entry names in *directory* (empty if it is missing).
+
+    Streamlit re-runs discovery on every interaction, so instead of one
+    ``stat()`` per candidate file, each directory is stat'ed once and only
+    re-listed when its mtime changes (files were added, removed or renamed).
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        _LISTINGS.pop(directory, None)
+        return frozenset()
+
+    cached = _LISTINGS.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with os.scandir(directory) as it:
+            names = frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+    if time.time_ns() - mtime >= _LISTING_SETTLE_NS:
+        _LISTINGS[directory] = (mtime, names)
+    return names
@@ -0,0 +1,46 @@
+"""Tests for email_opportunity_pipeline.cli parser construction."""
+
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+from email_opportunity_pipeline import cli
+
+
+def _run(monkeypatch, capsys, parser_class, argv):
+    monkeypatch.setattr(cli, "_PARSER_CLASS", parser_class)
+    parser = cli._build_parser(argv[0] if argv else None)
+    subparsers = parser._subparsers._group_actions[0].choices.values()
+    assert {type(p) for p in [parser, *subparsers]} == {parser_class}
+    with pytest.raises(SystemExit) as exc:
+        parser.parse_args(argv)
+    captured = capsys.readouterr()
+    return exc.value.code, captured.out, captured.err
+
+
+class TestFastParser:
+    @pytest.mark.parametrize("argv", [
+        ["--help"],
+        ["track-update", "--help"],
+        ["fetch", "--window", "1d", "--bogus"],
+        ["no-such-command"],
+        [],
+    ])
+    def test_output_matches_argparse(self, monkeypatch, capsys, argv):
+        monkeypatch.setenv("COLUMNS", "100")
+        monkeypatch.setenv("NO_COLOR", "1")
+        expected = _run(monkeypatch, capsys, argparse.ArgumentParser, argv)
+        assert _run(monkeypatch, capsys, cli._FastParser, argv) == expected
+
+    def test_help_and_error_output(self, monkeypatch, capsys):
+        monkeypatch.setenv("COLUMNS", "100")
+        code, out, _ = _run(monkeypatch, capsys, cli._FastParser, ["track-update", "--help"])
+        assert code == 0
+        assert out.startswith("usage: ")
+        assert "--interview-type" in out
+
+        code, _, err = _run(monkeypatch, capsys, cli._FastParser, ["fetch", "--out", "m.json", "--bogus"])
+        assert code == 2
+        assert "unrecognized arguments: --bogus" in err
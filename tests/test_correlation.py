@@ -36,6 +36,7 @@ from email_opportunity_pipeline.correlation.correlator import (
     _opp_job_id,
 )
 from email_opportunity_pipeline.correlation.report import (
+    join_correlation_report,
     render_correlation_report,
     render_correlation_summary,
     render_opportunity_card,
@@ -43,6 +44,11 @@ from email_opportunity_pipeline.correlation.report import (
 from email_opportunity_pipeline.io import (
     write_correlation,
     read_correlation,
+    write_messages,
+    read_messages,
+    iter_messages,
+    write_opportunities,
+    write_markdown,
 )
 from email_opportunity_pipeline.models import (
     EmailHeaders,
@@ -339,6 +345,15 @@ class TestCorrelatedOpportunity:
         assert restored.reply.status == ReplyOutcome.SENT
         assert restored.locations == ["SF", "NYC"]
 
+    def test_unhashable_enum_values_fall_back(self):
+        restored = CorrelatedOpportunity.from_dict({
+            "job_id": "x",
+            "stage": ["replied"],
+            "reply": {"status": {"value": "sent"}},
+        })
+        assert restored.stage == OpportunityStage.FETCHED
+        assert restored.reply.status == ReplyOutcome.NOT_STARTED
+
 
 class TestCorrelationSummary:
     def test_round_trip(self):
@@ -536,6 +551,20 @@ class TestOpportunityCorrelator:
             assert result[0].pipeline_complete is expected_complete, \
                 f"Expected pipeline_complete={expected_complete} for {status}"
 
+    @pytest.mark.parametrize("top", [1, 3, 5, 20])
+    def test_top_matches_sorted_prefix(self, top):
+        correlator = OpportunityCorrelator()
+        ids = [f"msg_{i}" for i in range(8)]
+        correlator.add_opportunities([_make_opportunity(i) for i in ids])
+        correlator.add_match_results([
+            _make_match_result("msg_1", 70.0),
+            _make_match_result("msg_2", 90.0),
+            _make_match_result("msg_3", 70.0),
+            _make_match_result("msg_4", 55.0),
+        ])
+        expected = [c.job_id for c in correlator.correlate()[:top]]
+        assert [c.job_id for c in correlator.correlate(top=top)] == expected
+
 
 class TestBuildSummary:
     def test_summary_statistics(self):
@@ -669,6 +698,15 @@ class TestReportRendering:
         for i in range(3):
             assert f"Corp {i}" in report
 
+    def test_join_matches_full_render(self):
+        correlated, summary = self._setup_correlated()
+        summary_md = render_correlation_report(summary, correlated)
+        cards = [render_opportunity_card(c) for c in correlated]
+
+        assert join_correlation_report(summary_md, cards) == render_correlation_report(
+            summary, correlated, include_cards=True
+        )
+
     def test_report_without_cards(self):
         correlated, summary = self._setup_correlated()
         report = render_correlation_report(summary, correlated, include_cards=False)
@@ -726,6 +764,61 @@ class TestCorrelationIO:
             assert restored_correlated == []
             assert restored_summary.total_opportunities == 0
 
+    @pytest.mark.parametrize("name, content", [
+        ("resume.json", '{"personal": {"name": "Alex Doe"}, "experience": []}'),
+        ("resume.json", '{"skills": {}}'),
+        ("resume.md", "# Alex Doe\n\n## Summary\nBackend engineer\n"),
+        ("resume.md", "## Summary\nNo heading\n"),
+    ])
+    def test_resume_name_matches_full_parse(self, tmp_path, name, content):
+        from email_opportunity_pipeline.io import read_resume, read_resume_name
+
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        assert read_resume_name(path) == read_resume(path).personal.name
+
+    def test_write_markdown_truncates_and_encodes(self, tmp_path):
+        path = tmp_path / "card.md"
+        write_markdown(path, "# A much longer first version\n")
+        write_markdown(path, "# Café\n")
+        assert path.read_bytes() == "# Café\n".encode("utf-8")
+
+    def test_streamed_messages_feed_correlator(self, tmp_path):
+        path = tmp_path / "messages.json"
+        write_messages(path, [_make_email("msg_a"), _make_email("msg_b")])
+
+        streamed = list(iter_messages(path))
+        assert [m.to_dict() for m in streamed] == [
+            m.to_dict() for m in read_messages(path)
+        ]
+
+        correlator = OpportunityCorrelator()
+        assert correlator.add_messages(iter_messages(path)) == 2
+        correlator.add_opportunities([_make_opportunity("msg_a")])
+        assert correlator.correlate()[0].email is not None
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson):
+        import email_opportunity_pipeline.io as io_mod
+
+        if not use_orjson:
+            monkeypatch.setattr(io_mod, "orjson", None)
+        elif io_mod.orjson is None:
+            pytest.skip("orjson not installed")
+
+        correlator = OpportunityCorrelator()
+        opp = _make_opportunity("msg_utf8")
+        opp["company"] = "Café Société"
+        correlator.add_opportunities([opp])
+        correlated = correlator.correlate()
+        summary = correlator.build_summary(correlated, resume_name="Zoë")
+
+        path = tmp_path / "correlation.json"
+        write_correlation(path, correlated, summary)
+        restored_correlated, restored_summary = read_correlation(path)
+        assert restored_correlated[0].company == "Café Société"
+        assert restored_summary.resume_name == "Zoë"
+
 
 # ===========================================================================
 # Stage Determination Tests
@@ -827,3 +920,21 @@ class TestCorrelationIntegration:
             md_content = (out_dir / "correlation_summary.md").read_text()
             assert "Test User" in md_content
             assert "Company 0" in md_content
+
+    def test_cli_skips_tailored_dir_that_is_a_file(self, tmp_path, capsys):
+        from email_opportunity_pipeline.cli import main
+
+        opportunities = tmp_path / "opportunities.json"
+        write_opportunities(opportunities, [_make_opportunity("cli_msg")])
+        not_a_dir = tmp_path / "tailored"
+        not_a_dir.write_text("", encoding="utf-8")
+
+        main([
+            "correlate",
+            "--opportunities", str(opportunities),
+            "--tailored-dir", str(not_a_dir),
+            "--out", str(tmp_path / "correlation"),
+        ])
+
+        assert (tmp_path / "correlation" / "correlation.json").exists()
+        assert "tailoring results" not in capsys.readouterr().out
@@ -359,6 +359,37 @@ class TestGmailSenderOverrides:
         assert results[0].draft.bcc == []
 
 
+class TestGmailSenderService:
+    """The Gmail service is built once per sender, not once per email."""
+
+    def test_batch_authorises_once(self, monkeypatch):
+        sent = []
+
+        class FakeService:
+            def users(self):
+                return self
+
+            def messages(self):
+                return self
+
+            def send(self, userId, body):
+                sent.append(body)
+                return self
+
+            def execute(self):
+                return {"id": f"gmail_{len(sent)}"}
+
+        builds = []
+        sender = GmailSender()
+        monkeypatch.setattr(sender, "_build_service", lambda: builds.append(1) or FakeService())
+
+        results = sender.send_batch([_make_draft(), _make_draft(), _make_draft()])
+
+        assert [r.status for r in results] == [ReplyStatus.SENT] * 3
+        assert len(sent) == 3
+        assert len(builds) == 1
+
+
 # ===========================================================================
 # Report rendering tests
 # ===========================================================================
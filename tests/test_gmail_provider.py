@@ -0,0 +1,135 @@
+"""Tests for email_opportunity_pipeline.providers.gmail (against a stubbed API)."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+
+import pytest
+
+# Google client modules the provider imports, with the names it uses
+_GOOGLE_STUBS = {
+    "google": [],
+    "google.auth": [],
+    "google.auth.transport": [],
+    "google.auth.transport.requests": ["Request"],
+    "google.oauth2": [],
+    "google.oauth2.credentials": ["Credentials"],
+    "google_auth_oauthlib": [],
+    "google_auth_oauthlib.flow": ["InstalledAppFlow"],
+    "googleapiclient": [],
+    "googleapiclient.discovery": ["build"],
+    "googleapiclient.errors": ["HttpError"],
+}
+
+
+@pytest.fixture
+def gmail(monkeypatch):
+    """Import the provider module, stubbing the Google client if it is absent."""
+    try:
+        import googleapiclient  # noqa: F401
+    except ImportError:
+        for name, attrs in _GOOGLE_STUBS.items():
+            module = types.ModuleType(name)
+            for attr in attrs:
+                setattr(module, attr, type(attr, (Exception,), {}))
+            monkeypatch.setitem(sys.modules, name, module)
+        for name in ("email_opportunity_pipeline.providers", "email_opportunity_pipeline.providers.gmail"):
+            # Recorded so teardown drops the stub-bound modules again
+            monkeypatch.setitem(sys.modules, name, None)
+            del sys.modules[name]
+    return importlib.import_module("email_opportunity_pipeline.providers.gmail")
+
+
+class _Request:
+    def __init__(self, service, msg_id):
+        self.service = service
+        self.msg_id = msg_id
+
+    def execute(self, num_retries=0):
+        self.service.single_calls.append(self.msg_id)
+        return self.service.message(self.msg_id)
+
+
+class _Batch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = {}
+
+    def add(self, request, request_id):
+        if request_id in self.requests:
+            raise KeyError(f"duplicate request id {request_id}")
+        self.requests[request_id] = request
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests.items():
+            if request_id in self.service.throttled:
+                self.service.throttled.discard(request_id)
+                self.callback(request_id, None, RuntimeError("429 rate limited"))
+            else:
+                self.callback(request_id, self.service.message(request_id), None)
+
+
+class _Service:
+    def __init__(self, throttled=()):
+        self.batch_sizes = []
+        self.single_calls = []
+        self.throttled = set(throttled)
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def get(self, userId, id, format, metadataHeaders):
+        return _Request(self, id)
+
+    def new_batch_http_request(self, callback):
+        return _Batch(self, callback)
+
+    @staticmethod
+    def message(msg_id):
+        return {
+            "id": msg_id,
+            "threadId": f"thread_{msg_id}",
+            "snippet": "",
+            "payload": {"headers": [{"name": "Subject", "value": f"Subject {msg_id}"}]},
+        }
+
+
+def _fetch(gmail, service, msg_ids):
+    from email_opportunity_pipeline.time_window import parse_window
+
+    provider = gmail.GmailProvider()
+    provider._build_service = lambda: service
+    provider._list_message_ids = lambda svc, query, max_results: list(msg_ids)
+    return list(provider.fetch_messages(parse_window("1d"), include_body=False))
+
+
+class TestBatchedFetch:
+    def test_batches_keep_list_order(self, gmail):
+        service = _Service()
+        ids = [f"m{i}" for i in range(120)]
+        messages = _fetch(gmail, service, ids)
+
+        assert service.batch_sizes == [50, 50, 20]
+        assert [m.message_id for m in messages] == ids
+        assert messages[7].headers.subject == "Subject m7"
+
+    def test_failed_sub_request_is_retried_alone(self, gmail):
+        service = _Service(throttled={"m3"})
+        messages = _fetch(gmail, service, [f"m{i}" for i in range(5)])
+
+        assert service.single_calls == ["m3"]
+        assert [m.message_id for m in messages] == ["m0", "m1", "m2", "m3", "m4"]
+
+    def test_duplicate_ids_are_fetched_once(self, gmail):
+        service = _Service()
+        messages = _fetch(gmail, service, ["m0", "m1", "m0", "m2"])
+
+        assert service.batch_sizes == [3]
+        assert [m.message_id for m in messages] == ["m0", "m1", "m2"]
@@ -0,0 +1,144 @@
+"""Tests for email_opportunity_pipeline.io (artifact readers and writers)."""
+
+from __future__ import annotations
+
+import os
+import stat
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import pytest
+
+from email_opportunity_pipeline.io import (
+    iter_match_results,
+    iter_messages,
+    iter_opportunities,
+    read_match_results,
+    read_messages,
+    read_opportunities,
+    write_markdown,
+    write_match_results,
+    write_messages,
+    write_opportunities,
+)
+from email_opportunity_pipeline.matching.models import (
+    CategoryScore,
+    ExperienceMatch,
+    MatchInsights,
+    MatchResult,
+    SkillMatch,
+)
+from email_opportunity_pipeline.models import EmailHeaders, EmailMessage, EmailSource
+
+
+def _email(msg_id: str) -> EmailMessage:
+    return EmailMessage(
+        message_id=msg_id,
+        thread_id=f"thread_{msg_id}",
+        internal_date=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        headers=EmailHeaders(from_="recruiter@corp.com", subject=f"Role {msg_id}"),
+        snippet="",
+        body_text="",
+        body_html="",
+        source=EmailSource(provider="gmail", user_id="me"),
+    )
+
+
+def _opportunity(msg_id: str) -> Dict[str, Any]:
+    return {
+        "job_title": "Senior Engineer",
+        "company": "Café Société",
+        "mandatory_skills": ["Python"],
+        "source_email": {"message_id": msg_id, "subject": f"Role {msg_id}"},
+        "confidence": 0.9,
+    }
+
+
+def _match_result(job_id: str, score: float) -> MatchResult:
+    return MatchResult(
+        job_id=job_id,
+        overall_score=score,
+        match_grade="good",
+        recommendation="apply",
+        skills_match=SkillMatch(score=80.0, matched_mandatory=["Python"]),
+        experience_match=ExperienceMatch(score=90.0, years_required=5),
+        education_score=CategoryScore(score=85.0),
+        location_score=CategoryScore(score=95.0),
+        culture_fit_score=CategoryScore(score=80.0),
+        insights=MatchInsights(strengths=["Python"]),
+        timestamp=datetime(2025, 2, 2, tzinfo=timezone.utc),
+    )
+
+
+class TestStreamedReads:
+    def test_streamed_opportunities_match_read(self, tmp_path):
+        path = tmp_path / "opportunities.json"
+        write_opportunities(path, [_opportunity("msg_a"), _opportunity("msg_b")])
+
+        assert list(iter_opportunities(path)) == read_opportunities(path)
+
+    def test_streamed_match_results_match_read(self, tmp_path):
+        path = tmp_path / "match_results.json"
+        write_match_results(path, [_match_result("job_a", 91.5), _match_result("job_b", 40.0)])
+
+        streamed = [r.to_dict() for r in iter_match_results(path)]
+        assert streamed == [r.to_dict() for r in read_match_results(path)]
+
+
+class TestJsonlWrites:
+    def test_in_place_rewrite_keeps_input(self, tmp_path):
+        path = tmp_path / "messages.jsonl"
+        write_messages(path, [_email("msg_a"), _email("msg_b")])
+
+        # filter --in messages.jsonl --out messages.jsonl
+        assert write_messages(path, (m for m in iter_messages(path) if m.message_id == "msg_b")) == 1
+        assert [m.message_id for m in read_messages(path)] == ["msg_b"]
+        assert [p.name for p in tmp_path.iterdir()] == ["messages.jsonl"]
+
+    def test_error_mid_stream_leaves_previous_file(self, tmp_path):
+        path = tmp_path / "messages.jsonl"
+        write_messages(path, [_email("msg_a"), _email("msg_b")])
+
+        def failing():
+            yield _email("msg_c")
+            raise RuntimeError("fetch failed")
+
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            write_messages(path, failing())
+        assert [m.message_id for m in read_messages(path)] == ["msg_a", "msg_b"]
+        assert [p.name for p in tmp_path.iterdir()] == ["messages.jsonl"]
+
+    def test_match_results_round_trip(self, tmp_path):
+        results = [_match_result("job_a", 91.5), _match_result("job_b", 40.0)]
+        path = tmp_path / "match_results.jsonl"
+        write_match_results(path, results)
+
+        assert len(path.read_bytes().splitlines()) == 2
+        assert [r.to_dict() for r in iter_match_results(path)] == [r.to_dict() for r in results]
+        assert [r.to_dict() for r in read_match_results(path)] == [r.to_dict() for r in results]
+
+    def test_messages_and_opportunities_round_trip(self, tmp_path):
+        messages = [_email("msg_a"), _email("msg_b")]
+        path = tmp_path / "messages.jsonl"
+        assert write_messages(path, (m for m in messages)) == 2
+
+        assert len(path.read_bytes().splitlines()) == 2
+        assert [m.to_dict() for m in iter_messages(path)] == [m.to_dict() for m in messages]
+        assert [m.to_dict() for m in read_messages(path)] == [m.to_dict() for m in messages]
+
+        opportunities = [_opportunity("msg_a"), _opportunity("msg_b")]
+        path = tmp_path / "opportunities.jsonl"
+        write_opportunities(path, opportunities)
+        assert list(iter_opportunities(path)) == opportunities
+        assert read_opportunities(path) == opportunities
+
+
+class TestWriteBytes:
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_mode_follows_umask(self, tmp_path):
+        old = os.umask(0o002)
+        try:
+            write_markdown(tmp_path / "card.md", "# Card\n")
+        finally:
+            os.umask(old)
+        assert stat.S_IMODE((tmp_path / "card.md").stat().st_mode) == 0o664
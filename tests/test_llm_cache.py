@@ -0,0 +1,244 @@
+"""Tests for email_opportunity_pipeline.llm_cache."""
+
+from __future__ import annotations
+
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from email_opportunity_pipeline.llm_cache import ResponseCache, default_cache_dir
+
+
+class TestResponseCache:
+    def test_miss_returns_none(self, tmp_path):
+        assert ResponseCache(tmp_path).get(ResponseCache.key("m", "p")) is None
+
+    def test_put_then_get(self, tmp_path):
+        cache = ResponseCache(tmp_path / "nested")
+        key = ResponseCache.key("gpt-4o-mini", "system", "user")
+        cache.put(key, {"score": 87, "notes": ["café"]})
+        assert cache.get(key) == {"score": 87, "notes": ["café"]}
+        assert [p.name for p in (tmp_path / "nested").iterdir()] == [f"{key}.json"]
+
+    def test_key_depends_on_every_part(self):
+        base = ResponseCache.key("model", "system", "user", {"a": 1})
+        assert base == ResponseCache.key("model", "system", "user", {"a": 1})
+        assert base != ResponseCache.key("other", "system", "user", {"a": 1})
+        assert base != ResponseCache.key("model", "system", "user!", {"a": 1})
+        assert base != ResponseCache.key("model", "system", "user", {"a": 2})
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        key = ResponseCache.key("x")
+        (tmp_path / f"{key}.json").write_text("{not json", encoding="utf-8")
+        assert ResponseCache(tmp_path).get(key) is None
+
+    def test_default_dir_honours_xdg(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "email_opportunity_pipeline" / "llm"
+
+
+# Pack schema name -> (per-item section marker, reply key)
+_PACKS = {
+    "job_analysis_pack": ("### Job ", "analyses"),
+    "job_opportunity_pack": ("### Email ", "opportunities"),
+}
+
+
+class _FakeResponses:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.short_packs = False
+
+    def create(self, **kwargs):
+        self.calls += 1
+        analysis = {"role_summary": {"level": "senior"}}
+        if kwargs.get("stream"):
+            text = json.dumps({"overall_score": 72})
+            return iter(
+                [types.SimpleNamespace(type="response.created")]
+                + [
+                    types.SimpleNamespace(type="response.output_text.delta", delta=text[i:i + 5])
+                    for i in range(0, len(text), 5)
+                ]
+                + [types.SimpleNamespace(type="response.completed")]
+            )
+        pack = _PACKS.get(kwargs["text"]["format"].get("name"))
+        if pack is not None:
+            marker, key = pack
+            items = kwargs["input"][1]["content"].count(marker)
+            if self.short_packs:
+                items -= 1
+            return types.SimpleNamespace(output_text=json.dumps({key: [analysis] * items}))
+        return types.SimpleNamespace(output_text=json.dumps(analysis))
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    responses = _FakeResponses()
+
+    class OpenAI:
+        def __init__(self, api_key=None):
+            self.responses = responses
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=OpenAI))
+    return responses
+
+
+class TestAnalyzerCache:
+    def _job(self, title="Backend Engineer"):
+        return {
+            "job_title": title,
+            "company": "Acme",
+            "source_email": {"message_id": "msg_1"},
+        }
+
+    def test_unchanged_job_is_served_from_cache(self, tmp_path, fake_openai):
+        from email_opportunity_pipeline.matching import JobAnalyzer
+
+        analyzer = JobAnalyzer(cache=ResponseCache(tmp_path))
+        first = analyzer.analyze(self._job())
+        second = analyzer.analyze(self._job())
+
+        assert fake_openai.calls == 1
+        assert first == second
+        assert second["source_job"]["message_id"] == "msg_1"
+
+    def test_changed_job_misses(self, tmp_path, fake_openai):
+        from email_opportunity_pipeline.matching import JobAnalyzer
+
+        analyzer = JobAnalyzer(cache=ResponseCache(tmp_path))
+        analyzer.analyze(self._job())
+        analyzer.analyze(self._job(title="Staff Engineer"))
+        assert fake_openai.calls == 2
+
+    def test_without_cache_always_calls(self, fake_openai):
+        from email_opportunity_pipeline.matching import JobAnalyzer
+
+        analyzer = JobAnalyzer()
+        analyzer.analyze(self._job())
+        analyzer.analyze(self._job())
+        assert fake_openai.calls == 2
+
+
+class TestExtractAndFilterCache:
+    def _email(self, body="We are hiring a backend engineer.", msg_id="msg_1"):
+        from email_opportunity_pipeline.models import EmailHeaders, EmailMessage
+
+        return EmailMessage(
+            message_id=msg_id,
+            thread_id=f"thread_{msg_id}",
+            internal_date=None,
+            headers=EmailHeaders(subject="Backend role", date=f"date of {msg_id}"),
+            snippet="",
+            body_text=body,
+            body_html="",
+        )
+
+    def test_extractor_reuses_cached_response(self, tmp_path, fake_openai):
+        from email_opportunity_pipeline.extraction import LLMExtractor
+
+        extractor = LLMExtractor(cache=ResponseCache(tmp_path))
+        first = extractor.extract(self._email())
+        assert extractor.extract(self._email()) == first
+        assert fake_openai.calls == 1
+
+        extractor.extract(self._email(body="Different role."))
+        assert fake_openai.calls == 2
+
+    def test_resent_template_shares_extraction(self, tmp_path, fake_openai):
+        from email_opportunity_pipeline.extraction import LLMExtractor
+
+        extractor = LLMExtractor(cache=ResponseCache(tmp_path))
+        extractor.extract(self._email(msg_id="msg_1"))
+        repost = extractor.extract(self._email(msg_id="msg_2"))
+
+        assert fake_openai.calls == 1
+        assert repost["source_email"]["message_id"] == "msg_2"
+        assert repost["source_email"]["date"] == "date of msg_2"
+
+    def test_extract_pack_shares_cache_and_falls_back(self, tmp_path, fake_openai):
+        from email_opportunity_pipeline.extraction import LLMExtractor
+        from email_opportunity_pipeline.pipeline import extract_opportunities
+
+        emails = [self._email(body=f"Role {i}", msg_id=f"msg_{i}") for i in range(5)]
+        opportunities = extract_opportunities(
+            emails, use_llm=True, cache=ResponseCache(tmp_path), pack_size=2
+        )
+        assert fake_openai.calls == 3
+        assert [o["source_email"]["message_id"] for o in opportunities] == [
+            f"msg_{i}" for i in range(5)
+        ]
+
+        extractor = LLMExtractor(cache=ResponseCache(tmp_path))
+        for email in emails:
+            extractor.extract(email)
+        assert fake_openai.calls == 3
+
+        fake_openai.short_packs = True
+        extractor.extract_pack([self._email(body=f"New {i}") for i in range(3)])
+        assert fake_openai.calls == 7
+
+    def test_filter_reuses_cached_decision(self, tmp_path, fake_openai):
+        from email_opportunity_pipeline.filters import LLMFilter
+
+        llm_filter = LLMFilter(cache=ResponseCache(tmp_path))
+        first = llm_filter.evaluate(self._email())
+        second = llm_filter.evaluate(self._email())
+        assert fake_openai.calls == 1
+        assert second.to_dict() == first.to_dict()
+
+
+class TestAnalyzerPack:
+    def _jobs(self, n):
+        return [
+            {"job_title": f"Engineer {i}", "company": "Acme", "source_email": {"message_id": f"msg_{i}"}}
+            for i in range(n)
+        ]
+
+    def test_one_request_per_pack(self, fake_openai):
+        from email_opportunity_pipeline.matching import JobAnalyzer
+
+        analyses = JobAnalyzer().analyze_batch(self._jobs(5), pack_size=2)
+
+        assert fake_openai.calls == 3
+        assert [a["source_job"]["message_id"] for a in analyses] == [f"msg_{i}" for i in range(5)]
+
+    def test_pack_shares_cache_with_single_analyze(self, tmp_path, fake_openai):
+        from email_opportunity_pipeline.matching import JobAnalyzer
+
+        analyzer = JobAnalyzer(cache=ResponseCache(tmp_path))
+        jobs = self._jobs(3)
+        analyzer.analyze(jobs[1])
+        analyzer.analyze_pack(jobs)
+        assert fake_openai.calls == 2
+
+        for job in jobs:
+            analyzer.analyze(job)
+        assert fake_openai.calls == 2
+
+    def test_wrong_count_falls_back_to_single(self, fake_openai):
+        from email_opportunity_pipeline.matching import JobAnalyzer
+
+        fake_openai.short_packs = True
+        analyses = JobAnalyzer().analyze_pack(self._jobs(3))
+
+        assert fake_openai.calls == 4
+        assert [a["role_summary"]["level"] for a in analyses] == ["senior"] * 3
+
+
+class TestMatcherStream:
+    def test_deltas_are_forwarded_and_parsed(self, fake_openai):
+        from email_opportunity_pipeline.io import read_resume
+        from email_opportunity_pipeline.matching import ResumeMatcher
+
+        resume = read_resume(Path(__file__).resolve().parents[1] / "examples" / "sample_resume.json")
+        job = {"job_title": "Backend Engineer", "source_email": {"message_id": "msg_1"}}
+        deltas = []
+        result = ResumeMatcher().match(resume, job, on_delta=deltas.append)
+
+        assert "".join(deltas) == json.dumps({"overall_score": 72})
+        assert len(deltas) > 1
+        assert result.overall_score == 72
@@ -0,0 +1,104 @@
+"""Tests for email_opportunity_pipeline.llm_limiter."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from email_opportunity_pipeline import llm_limiter
+from email_opportunity_pipeline.llm_limiter import AdaptiveLimiter, is_rate_limit_error
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+class _ServerError(Exception):
+    status_code = 500
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(llm_limiter.time, "sleep", recorded.append)
+    return recorded
+
+
+def _flaky(failures):
+    """Return a callable that raises a 429 *failures* times, then returns 'ok'."""
+    remaining = [failures]
+
+    def call():
+        if remaining[0]:
+            remaining[0] -= 1
+            raise _RateLimited()
+        return "ok"
+
+    return call
+
+
+class TestAdaptiveLimiter:
+    def test_detects_rate_limit_errors(self):
+        assert is_rate_limit_error(_RateLimited())
+        assert not is_rate_limit_error(_ServerError())
+        assert not is_rate_limit_error(ValueError())
+
+    def test_throttle_halves_limit_and_retries(self, sleeps):
+        limiter = AdaptiveLimiter(maximum=8, backoff=0.5)
+        assert limiter.call(_flaky(2)) == "ok"
+        assert limiter.limit == 2
+        assert sleeps == [0.5, 1.0]
+
+    def test_limit_recovers_after_a_round_of_successes(self, sleeps):
+        limiter = AdaptiveLimiter(maximum=4)
+        limiter.call(_flaky(1))
+        assert limiter.limit == 2
+        for _ in range(2):
+            limiter.call(lambda: None)
+        assert limiter.limit == 3
+
+    def test_gives_up_after_retries(self, sleeps):
+        limiter = AdaptiveLimiter(maximum=2, retries=1)
+        with pytest.raises(_RateLimited):
+            limiter.call(_flaky(5))
+        assert limiter.limit == 1
+
+    def test_other_errors_propagate_without_retry(self, sleeps):
+        limiter = AdaptiveLimiter(maximum=2)
+
+        def boom():
+            raise _ServerError()
+
+        with pytest.raises(_ServerError):
+            limiter.call(boom)
+        assert limiter.limit == 2
+        assert sleeps == []
+
+    def test_rpm_budget_delays_past_the_burst(self, sleeps):
+        limiter = AdaptiveLimiter(maximum=1, rpm=120)  # 2/s, bucket of 10
+        for _ in range(11):
+            limiter.call(lambda: None)
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(0.5, abs=0.05)
+
+    def test_in_flight_never_exceeds_limit(self):
+        limiter = AdaptiveLimiter(maximum=3)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            threading.Event().wait(0.02)
+            with lock:
+                active.pop()
+
+        threads = [threading.Thread(target=limiter.call, args=(work,)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert max(peak) == 3
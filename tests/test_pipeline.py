@@ -0,0 +1,130 @@
+"""Tests for email_opportunity_pipeline.pipeline."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from email_opportunity_pipeline import pipeline as pipeline_mod
+from email_opportunity_pipeline.io import read_messages, read_opportunities
+from email_opportunity_pipeline.models import EmailHeaders, EmailMessage, FilterOutcome
+from email_opportunity_pipeline.pipeline import prefetch, run_pipeline
+
+
+class TestPrefetch:
+    def test_yields_all_items_in_order(self):
+        assert list(prefetch(iter(range(500)), maxsize=8)) == list(range(500))
+
+    def test_empty_source(self):
+        assert list(prefetch(iter([]))) == []
+
+    def test_runs_producer_on_another_thread(self):
+        main = threading.get_ident()
+
+        def source():
+            yield threading.get_ident()
+
+        (producer,) = prefetch(source())
+        assert producer != main
+
+    def test_producer_error_reaches_consumer(self):
+        def source():
+            yield 1
+            yield 2
+            raise RuntimeError("fetch failed")
+
+        received = []
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            for item in prefetch(source()):
+                received.append(item)
+        assert received == [1, 2]
+
+    def test_early_stop_releases_producer(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                for i in range(1000):
+                    yield i
+            finally:
+                closed.set()
+
+        stream = prefetch(source(), maxsize=1)
+        assert next(stream) == 0
+        stream.close()
+        assert closed.wait(timeout=5)
+
+
+def _email(msg_id: str) -> EmailMessage:
+    return EmailMessage(
+        message_id=msg_id,
+        thread_id=f"thread_{msg_id}",
+        internal_date=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        headers=EmailHeaders(from_="recruiter@corp.com", to="me@example.com", subject="Role"),
+        snippet="",
+        body_text="",
+        body_html="",
+    )
+
+
+class TestRunPipelineOverlap:
+    @pytest.fixture
+    def fake_stages(self, monkeypatch):
+        extracted = threading.Event()
+
+        class PassAll:
+            def apply(self, email):
+                return FilterOutcome(passed=True)
+
+        class FakeExtractor:
+            def __init__(self, model="gpt-4o-mini", cache=None):
+                pass
+
+            def extract(self, email):
+                extracted.set()
+                return {"source_email": {"message_id": email.message_id}}
+
+        monkeypatch.setattr(pipeline_mod, "build_filter_pipeline", lambda **kwargs: PassAll())
+        monkeypatch.setattr(pipeline_mod, "LLMExtractor", FakeExtractor)
+        return extracted
+
+    def test_extraction_starts_before_stream_ends(self, tmp_path, fake_stages):
+        seen_mid_stream = []
+
+        def source():
+            yield _email("msg_0")
+            seen_mid_stream.append(fake_stages.wait(timeout=5))
+            yield _email("msg_1")
+
+        outputs = run_pipeline(
+            source(), tmp_path / "out", tmp_path / "work",
+            use_llm_extract=True, enable_analytics=False, workers=2,
+        )
+
+        assert seen_mid_stream == [True]
+        opportunities = read_opportunities(outputs.opportunities_path)
+        assert [o["source_email"]["message_id"] for o in opportunities] == ["msg_0", "msg_1"]
+
+
+class TestRunPipelineFailures:
+    def test_fetched_messages_survive_filter_error(self, tmp_path, monkeypatch):
+        class FailsOnSecond:
+            seen = 0
+
+            def apply(self, email):
+                self.seen += 1
+                if self.seen == 2:
+                    raise RuntimeError("LLM filter unavailable")
+                return FilterOutcome(passed=True)
+
+        monkeypatch.setattr(pipeline_mod, "build_filter_pipeline", lambda **kwargs: FailsOnSecond())
+
+        with pytest.raises(RuntimeError, match="LLM filter unavailable"):
+            run_pipeline(
+                iter([_email("msg_0"), _email("msg_1")]), tmp_path / "out", tmp_path / "work",
+                enable_analytics=False,
+            )
+        saved = read_messages(tmp_path / "work" / "messages.json")
+        assert [m.message_id for m in saved] == ["msg_0", "msg_1"]
@@ -19,9 +19,11 @@ from email_opportunity_pipeline.tracking.models import (
 )
 from email_opportunity_pipeline.tracking.tracker import ApplicationTracker
 from email_opportunity_pipeline.tracking.report import (
+    iter_tracking_report,
     render_application_card,
     render_tracking_report,
     render_tracking_summary,
+    tracking_summary_digest,
 )
 from email_opportunity_pipeline.correlation.models import (
     CorrelatedOpportunity,
@@ -30,7 +32,14 @@ from email_opportunity_pipeline.correlation.models import (
     ReplyOutcome,
     ReplySummary,
 )
-from email_opportunity_pipeline.io import read_tracking, write_tracking
+from email_opportunity_pipeline.io import (
+    append_tracking_event,
+    read_tracking,
+    read_tracking_events,
+    read_tracking_replayed,
+    tracking_events_path,
+    write_tracking,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -241,6 +250,17 @@ class TestTrackedApplication:
         app = TrackedApplication.from_dict({"job_id": "x", "final_outcome": "not_real"})
         assert app.final_outcome is None
 
+    def test_unhashable_enum_values_fall_back(self):
+        app = TrackedApplication.from_dict({
+            "job_id": "x",
+            "status": ["interviewing"],
+            "final_outcome": {"value": "accepted"},
+            "interviews": [{"interview_type": ["technical"]}],
+        })
+        assert app.status == ApplicationStatus.APPLIED
+        assert app.final_outcome is None
+        assert app.interviews[0].interview_type == InterviewType.OTHER
+
 
 class TestTrackingSummary:
     def test_round_trip(self):
@@ -261,6 +281,10 @@ class TestTrackingSummary:
         assert restored.active_count == 4
         assert restored.avg_match_score == 82.5
 
+    def test_render_hash_round_trip(self):
+        summary = TrackingSummary(render_hash="abc123")
+        assert TrackingSummary.from_dict(summary.to_dict()).render_hash == "abc123"
+
     def test_defaults(self):
         summary = TrackingSummary.from_dict({})
         assert summary.total_tracked == 0
@@ -408,6 +432,68 @@ class TestApplicationTracker:
         assert tracker.get_application("msg_001") is not None
         assert tracker.get_application("nonexistent") is None
 
+    def test_get_by_statuses(self):
+        tracker = ApplicationTracker()
+        tracker.load_existing([
+            _make_tracked("msg_001", status=ApplicationStatus.APPLIED),
+            _make_tracked("msg_002", status=ApplicationStatus.INTERVIEWING),
+            _make_tracked("msg_003", status=ApplicationStatus.OFFERED),
+        ])
+        tracker.set_outcome("msg_003", FinalOutcome.DECLINED)
+
+        ids = {a.job_id for a in tracker.get_by_statuses({"applied", "closed"})}
+        assert ids == {"msg_001", "msg_003"}
+        assert tracker.get_by_statuses({"offered"}) == []
+        assert tracker.get_by_statuses({"bogus"}) == []
+
+    def test_get_by_statuses_after_reload(self):
+        tracker = ApplicationTracker()
+        tracker.load_existing([_make_tracked("msg_001", status=ApplicationStatus.APPLIED)])
+        tracker.load_existing([_make_tracked("msg_001", status=ApplicationStatus.OFFERED)])
+        assert tracker.get_by_statuses({"applied"}) == []
+        assert [a.job_id for a in tracker.get_by_statuses({"offered"})] == ["msg_001"]
+
+    def test_build_summary_collects_top_active(self):
+        tracker = ApplicationTracker()
+        tracker.load_existing([
+            _make_tracked(f"msg_{i:03d}", status=ApplicationStatus.APPLIED)
+            for i in range(7)
+        ] + [_make_tracked("msg_100", status=ApplicationStatus.INTERVIEWING)])
+        apps = tracker.get_all()
+        summary = tracker.build_summary(apps)
+        assert summary.top_active == [a for a in apps if a.is_active][:5]
+        assert "top_active" not in summary.to_dict()
+
+        filtered = tracker.build_summary(apps, display_statuses={"interviewing"})
+        assert [a.job_id for a in filtered.top_active] == ["msg_100"]
+        assert filtered.total_tracked == 8
+
+    def test_apply_event_uses_recorded_timestamp(self):
+        tracker = ApplicationTracker()
+        tracker.load_existing([_make_tracked("msg_001")])
+        app = tracker.apply_event({
+            "ts": "2026-03-01T09:00:00+00:00",
+            "job_id": "msg_001",
+            "action": "status",
+            "payload": {"status": "interviewing", "note": "Phone screen"},
+        })
+        assert app.status == ApplicationStatus.INTERVIEWING
+        assert app.last_updated_at == "2026-03-01T09:00:00+00:00"
+        assert app.status_history[-1].timestamp == "2026-03-01T09:00:00+00:00"
+
+    def test_replay_events_skips_unknown_jobs(self):
+        tracker = ApplicationTracker()
+        tracker.load_existing([_make_tracked("msg_001")])
+        applied = tracker.replay_events([
+            {"ts": "t1", "job_id": "msg_001", "action": "note", "payload": {"note": "a"}},
+            {"ts": "t2", "job_id": "gone", "action": "note", "payload": {"note": "b"}},
+            {"ts": "t3", "job_id": "msg_001", "action": "offer", "payload": {"salary": "1"}},
+        ])
+        assert applied == 2
+        app = tracker.get_application("msg_001")
+        assert app.notes == ["a"]
+        assert app.status == ApplicationStatus.OFFERED
+
 
 # ============================================================================
 # Report tests
@@ -457,12 +543,41 @@ class TestTrackingReport:
         assert "Detailed Application Cards" in md
         assert "Senior Engineer" in md
 
+    def test_iter_report_matches_rendered_report(self):
+        apps = [_make_tracked("msg_001"), _make_tracked("msg_002")]
+        summary = TrackingSummary(total_tracked=2, active_count=2)
+        for include_cards in (False, True):
+            chunks = list(iter_tracking_report(summary, apps, include_cards=include_cards))
+            assert "".join(chunks) == render_tracking_report(
+                summary, apps, include_cards=include_cards
+            )
+
     def test_card_minimal_data(self):
         app = TrackedApplication(job_id="x")
         md = render_application_card(app)
         assert "Unknown Role" in md
         assert "Unknown Company" in md
 
+    def test_digest_ignores_generated_at(self):
+        apps = [_make_tracked("msg_001")]
+        a = TrackingSummary(total_tracked=1, generated_at="2026-02-10T00:00:00")
+        b = TrackingSummary(total_tracked=1, generated_at="2026-02-11T00:00:00")
+        assert tracking_summary_digest(a, apps) == tracking_summary_digest(b, apps)
+
+    def test_digest_changes_with_displayed_fields(self):
+        summary = TrackingSummary(total_tracked=1)
+        app = _make_tracked("msg_001")
+        before = tracking_summary_digest(summary, [app])
+        app.status = ApplicationStatus.INTERVIEWING
+        assert tracking_summary_digest(summary, [app]) != before
+
+    def test_digest_ignores_notes(self):
+        summary = TrackingSummary(total_tracked=1)
+        app = _make_tracked("msg_001")
+        before = tracking_summary_digest(summary, [app])
+        app.notes.append("Followed up")
+        assert tracking_summary_digest(summary, [app]) == before
+
 
 # ============================================================================
 # I/O tests
@@ -506,3 +621,163 @@ class TestTrackingIO:
         assert "summary" in raw
         assert "tracked_applications" in raw
         assert raw["tracked_applications"][0]["job_id"] == "msg_001"
+
+    def test_failed_write_keeps_previous_snapshot(self, tmp_path, monkeypatch):
+        import email_opportunity_pipeline.io as io_mod
+
+        path = tmp_path / "tracking.json"
+        write_tracking(path, [_make_tracked("msg_001")], TrackingSummary(total_tracked=1))
+
+        def boom(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(io_mod.os, "replace", boom)
+        with pytest.raises(OSError):
+            write_tracking(path, [], TrackingSummary())
+
+        apps, _ = read_tracking(path)
+        assert [a.job_id for a in apps] == ["msg_001"]
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_journal_round_trip_ignores_torn_line(self, tmp_path):
+        journal = tmp_path / "tracking.events.jsonl"
+        append_tracking_event(journal, {"job_id": "msg_001", "action": "note"})
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"job_id": "msg_0')
+        events = read_tracking_events(journal)
+        assert events == [{"job_id": "msg_001", "action": "note"}]
+        assert read_tracking_events(tmp_path / "missing.jsonl") == []
+
+    def test_append_after_torn_line_keeps_later_events(self, tmp_path):
+        journal = tmp_path / "tracking.events.jsonl"
+        append_tracking_event(journal, {"n": 1})
+        with open(journal, "ab") as f:
+            f.write(b'{"n": 2, "job_')
+        append_tracking_event(journal, {"n": 3})
+        append_tracking_event(journal, {"n": 4})
+        assert read_tracking_events(journal) == [{"n": 1}, {"n": 3}, {"n": 4}]
+
+    def test_undecodable_middle_line_is_skipped(self, tmp_path, caplog):
+        journal = tmp_path / "tracking.events.jsonl"
+        journal.write_bytes(b'{"n": 1}\n{"n": \n{"n": 3}\n')
+        assert read_tracking_events(journal) == [{"n": 1}, {"n": 3}]
+        assert "line 2" in caplog.text
+
+    def test_journal_is_per_tracking_file(self, tmp_path):
+        first = tmp_path / "tracking.json"
+        second = tmp_path / "archive.json"
+        assert tracking_events_path(first) == tmp_path / "tracking.events.jsonl"
+        assert tracking_events_path(first) != tracking_events_path(second)
+
+    def test_read_tracking_replays_journal(self, tmp_path):
+        path = tmp_path / "tracking.json"
+        write_tracking(path, [_make_tracked("msg_001")], TrackingSummary(total_tracked=1))
+        append_tracking_event(tracking_events_path(path), {
+            "ts": "2026-03-01T09:00:00+00:00",
+            "job_id": "msg_001",
+            "action": "outcome",
+            "payload": {"outcome": "accepted", "note": None},
+            "render_hash": "abc",
+        })
+
+        apps, summary = read_tracking(path)
+        assert apps[0].final_outcome == FinalOutcome.ACCEPTED
+        assert summary.by_outcome == {"accepted": 1}
+        assert summary.render_hash == "abc"
+
+        apps, _ = read_tracking(path, replay_journal=False)
+        assert apps[0].final_outcome is None
+
+    def test_interrupted_compaction_does_not_replay_twice(self, tmp_path):
+        path = tmp_path / "tracking.json"
+        write_tracking(path, [_make_tracked("msg_001")], TrackingSummary(total_tracked=1))
+        for seq, note in enumerate(["Called back", "Sent portfolio"], 1):
+            append_tracking_event(tracking_events_path(path), {
+                "seq": seq,
+                "ts": "2026-03-01T09:00:00+00:00",
+                "job_id": "msg_001",
+                "action": "note",
+                "payload": {"note": note},
+            })
+
+        apps, summary = read_tracking(path)
+        assert summary.journal_seq == 2
+        # Compaction crashes after writing the snapshot, before clearing
+        write_tracking(path, apps, summary)
+
+        apps, summary = read_tracking(path)
+        assert apps[0].notes == ["Called back", "Sent portfolio"]
+        assert summary.journal_seq == 2
+        assert read_tracking_replayed(path)[2] == 0
+
+    def test_round_trip_without_orjson(self, tmp_path, monkeypatch):
+        import email_opportunity_pipeline.io as io_mod
+
+        monkeypatch.setattr(io_mod, "orjson", None)
+        path = tmp_path / "tracking.json"
+        write_tracking(path, [_make_tracked("msg_001")], TrackingSummary(total_tracked=1))
+        append_tracking_event(tracking_events_path(path), {
+            "ts": "2026-03-01T09:00:00+00:00",
+            "job_id": "msg_001",
+            "action": "note",
+            "payload": {"note": "Sent thank-you email"},
+        })
+
+        apps, summary = read_tracking(path)
+        assert apps[0].notes == ["Sent thank-you email"]
+        assert summary.total_tracked == 1
+
+
+# ============================================================================
+# CLI tests
+# ============================================================================
+
+class TestTrackingCLI:
+    def test_update_to_same_dir_by_other_path_does_not_replay_twice(self, tmp_path, monkeypatch):
+        from email_opportunity_pipeline.cli import main
+
+        monkeypatch.chdir(tmp_path)
+        out_dir = tmp_path / "output" / "tracking"
+        out_dir.mkdir(parents=True)
+        write_tracking(out_dir / "tracking.json", [_make_tracked("msg_001")], TrackingSummary(total_tracked=1))
+        tracking_file = "output/tracking/tracking.json"
+
+        def note(text, *extra):
+            main(["track-update", "--tracking-file", tracking_file, "--job-id", "msg_001",
+                  "--action", "note", "--note", text, *extra])
+
+        note("first")
+        assert tracking_events_path(out_dir / "tracking.json").exists()
+        note("second", "--out", str(out_dir))
+        note("third", "--out", "output/../output/tracking")
+
+        apps, _ = read_tracking(out_dir / "tracking.json")
+        assert apps[0].notes == ["first", "second", "third"]
+
+    def test_update_reads_journal_once_and_compacts_at_threshold(self, tmp_path, monkeypatch):
+        import email_opportunity_pipeline.cli as cli
+        import email_opportunity_pipeline.io as io_mod
+
+        path = tmp_path / "tracking.json"
+        write_tracking(path, [_make_tracked("msg_001")], TrackingSummary(total_tracked=1))
+        monkeypatch.setattr(cli, "_TRACKING_COMPACT_THRESHOLD", 3)
+        reads = []
+        real_read = io_mod.read_tracking_events
+        def counting_read(journal):
+            reads.append(journal)
+            return real_read(journal)
+
+        monkeypatch.setattr(io_mod, "read_tracking_events", counting_read)
+        monkeypatch.setattr(cli, "read_tracking_events", counting_read, raising=False)
+
+        for text in ["one", "two"]:
+            cli.main(["track-update", "--tracking-file", str(path), "--job-id", "msg_001",
+                      "--action", "note", "--note", text])
+        assert len(reads) == 2
+        assert read_tracking_replayed(path)[2] == 2
+
+        cli.main(["track-update", "--tracking-file", str(path), "--job-id", "msg_001",
+                  "--action", "note", "--note", "three"])
+        assert not tracking_events_path(path).exists()
+        apps, _ = read_tracking(path, replay_journal=False)
+        assert apps[0].notes == ["one", "two", "three"]
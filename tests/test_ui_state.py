@@ -0,0 +1,43 @@
+"""Tests for the Streamlit state helpers that do not need Streamlit."""
+from __future__ import annotations
+
+import os
+
+from email_opportunity_pipeline.ui import state
+from email_opportunity_pipeline.ui.state import discover_artifacts
+
+
+def _age(path, seconds=60):
+    """Push *path*'s mtime into the past so its listing may be cached."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestDiscoverArtifacts:
+    def test_finds_existing_artifacts(self, tmp_path):
+        work, out = tmp_path / "data", tmp_path / "output"
+        (out / "matches").mkdir(parents=True)
+        work.mkdir()
+        (work / "messages.json").write_text("{}", encoding="utf-8")
+        (out / "matches" / "match_results.json").write_text("{}", encoding="utf-8")
+
+        found = discover_artifacts(work, out)
+        assert found == {
+            "messages": work / "messages.json",
+            "match_results": out / "matches" / "match_results.json",
+        }
+
+    def test_cached_listing_sees_new_files(self, tmp_path):
+        work, out = tmp_path / "data", tmp_path / "output"
+        work.mkdir()
+        (work / "messages.json").write_text("{}", encoding="utf-8")
+        _age(work)
+
+        assert set(discover_artifacts(work, out)) == {"messages"}
+        assert work in state._LISTINGS
+
+        (work / "opportunities.json").write_text("{}", encoding="utf-8")
+        assert set(discover_artifacts(work, out)) == {"messages", "opportunities"}
+
+        (work / "messages.json").unlink()
+        assert set(discover_artifacts(work, out)) == {"opportunities"}